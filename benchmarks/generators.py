@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generators for the benchmark suite.
+
+Everything is generated from a fixed seed so runs are comparable, and
+nothing needs network access.
+"""
+
+import csv
+import math
+import os
+import random
+from typing import Dict, List, Tuple
+
+# Japan's bounding box, as used by the map projection
+MIN_LAT, MAX_LAT = 30.0, 46.0
+MIN_LON, MAX_LON = 128.0, 146.0
+
+
+def clamp_to_bounds(lat: float, lon: float) -> Tuple[float, float]:
+    """Pull a point back inside the map bounds."""
+    return min(MAX_LAT, max(MIN_LAT, lat)), min(MAX_LON, max(MIN_LON, lon))
+
+
+def random_walk_river(n_points: int, seed: int = 0, step_deg: float = 0.002,
+                      jump_probability: float = 0.0) -> List[Tuple[float, float]]:
+    """
+    Generate a random-walk polyline with n_points vertices.
+
+    With jump_probability > 0, some steps teleport the walk far away, like
+    the jumps left by unordered OSM relation members.
+    """
+    rng = random.Random(seed)
+    lat, lon = 36.0, 138.0
+    heading = rng.uniform(0, 2 * math.pi)
+    coords = []
+    for _ in range(n_points):
+        coords.append((lat, lon))
+        if jump_probability and rng.random() < jump_probability:
+            lat = rng.uniform(MIN_LAT + 1, MAX_LAT - 1)
+            lon = rng.uniform(MIN_LON + 1, MAX_LON - 1)
+            continue
+        # Meander: small random changes of heading
+        heading += rng.gauss(0, 0.4)
+        lat = min(MAX_LAT, max(MIN_LAT, lat + step_deg * math.sin(heading)))
+        lon = min(MAX_LON, max(MIN_LON, lon + step_deg * math.cos(heading)))
+    return coords
+
+
+def grid_prefectures(rows: int = 7, cols: int = 7, vertices_per_edge: int = 50,
+                     seed: int = 0) -> List[Dict[str, str]]:
+    """
+    Generate grid-shaped prefecture polygons covering the map bounds.
+
+    Each cell's outline has 4 * vertices_per_edge points with a little
+    jitter so the rings are not trivially collinear.
+    """
+    rng = random.Random(seed)
+    cell_h = (MAX_LAT - MIN_LAT) / rows
+    cell_w = (MAX_LON - MIN_LON) / cols
+    prefectures = []
+    for r in range(rows):
+        for c in range(cols):
+            lat0, lon0 = MIN_LAT + r * cell_h, MIN_LON + c * cell_w
+            corners = [(lat0, lon0), (lat0, lon0 + cell_w),
+                       (lat0 + cell_h, lon0 + cell_w), (lat0 + cell_h, lon0)]
+            ring = []
+            for k in range(4):
+                (a_lat, a_lon), (b_lat, b_lon) = corners[k], corners[(k + 1) % 4]
+                for i in range(vertices_per_edge):
+                    t = i / vertices_per_edge
+                    ring.append(clamp_to_bounds(a_lat + (b_lat - a_lat) * t + rng.uniform(-0.01, 0.01),
+                                                a_lon + (b_lon - a_lon) * t + rng.uniform(-0.01, 0.01)))
+            ring.append(ring[0])
+            prefectures.append({
+                'Name': f"Pref{r * cols + c + 1:02d} Ken",
+                'Japanese Name': f"県{r * cols + c + 1:02d}",
+                'ID': str(r * cols + c + 1),
+                'Coordinates': coords_to_string(ring),
+            })
+    return prefectures
+
+
+def grid_provinces(prefectures: List[Dict[str, str]], seed: int = 0) -> List[Dict[str, str]]:
+    """Group synthetic prefectures into provinces of one to three prefectures."""
+    rng = random.Random(seed)
+    names = [p['Name'].replace(' Ken', '') for p in prefectures]
+    provinces = []
+    i = 0
+    while i < len(names):
+        size = rng.randint(1, 3)
+        group = names[i:i + size]
+        provinces.append({
+            'Name': f"Province{len(provinces) + 1:02d}",
+            'Japanese Name': f"国{len(provinces) + 1:02d}",
+            'Prefectures': ';'.join(group),
+            'Region': 'Synthetic',
+        })
+        i += size
+    return provinces
+
+
+def grid_municipalities(rows: int = 20, cols: int = 20, vertices_per_edge: int = 20,
+                        seed: int = 0) -> List[List[Tuple[float, float]]]:
+    """
+    Generate grid-shaped municipality rings whose shared borders use
+    identical vertices (as in N03 data), for the dissolve benchmark.
+
+    Vertices sit on a jittered lattice, so both neighbours of a border
+    see exactly the same points.
+    """
+    rng = random.Random(seed)
+    lattice_rows, lattice_cols = rows * vertices_per_edge, cols * vertices_per_edge
+    step_lat = (MAX_LAT - MIN_LAT) / lattice_rows
+    step_lon = (MAX_LON - MIN_LON) / lattice_cols
+    lattice = [[(MIN_LAT + i * step_lat + rng.uniform(-0.2, 0.2) * step_lat,
+                 MIN_LON + j * step_lon + rng.uniform(-0.2, 0.2) * step_lon)
+                for j in range(lattice_cols + 1)] for i in range(lattice_rows + 1)]
+    rings = []
+    for r in range(rows):
+        for c in range(cols):
+            i0, j0 = r * vertices_per_edge, c * vertices_per_edge
+            n = vertices_per_edge
+            ring = ([lattice[i0][j0 + k] for k in range(n)] + [lattice[i0 + k][j0 + n] for k in range(n)] +
+                    [lattice[i0 + n][j0 + n - k] for k in range(n)] + [lattice[i0 + n - k][j0] for k in range(n)])
+            rings.append(ring)
+    return rings
+
+
+# Syllables for synthetic names: (romaji, hiragana)
+SYLLABLES = [('ka', 'か'), ('shi', 'し'), ('ta', 'た'), ('na', 'な'), ('ma', 'ま'), ('ya', 'や'),
+             ('ri', 'り'), ('to', 'と'), ('no', 'の'), ('yo', 'よ'), ('kō', 'こう'), ('gu', 'ぐ'),
+             ('fu', 'ふ'), ('mi', 'み'), ('sa', 'さ'), ('ō', 'おう'), ('ni', 'に'), ('ki', 'き')]
+
+
+def random_names(n: int, seed: int = 0) -> List[Tuple[str, str]]:
+    """
+    Generate n (romaji, hiragana) name pairs of two to five syllables, some
+    of them two words and some with long vowels, for the search benchmark.
+    """
+    rng = random.Random(seed)
+    names = []
+    for _ in range(n):
+        syllables = [rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))]
+        romaji = ''.join(s[0] for s in syllables).capitalize()
+        if rng.random() < 0.3:
+            romaji += ' ' + rng.choice(['Nishiki', 'Yama', 'Kawa', 'Omachi'])
+        names.append((romaji, ''.join(s[1] for s in syllables)))
+    return names
+
+
+def coords_to_string(coords) -> str:
+    """Format (lat, lon) pairs the way the geometry CSVs store them."""
+    return ';'.join(f"{lat:.6f},{lon:.6f}" for lat, lon in coords)
+
+
+def write_csv(path: str, rows: List[Dict[str, str]]) -> None:
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_csv(path: str) -> List[Dict[str, str]]:
+    with open(path, encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def write_synthetic_geometry(data_dir: str, river_points: int = 1000, n_rivers: int = 40,
+                             seed: int = 0) -> None:
+    """
+    Overwrite the geometry CSVs in a copy of data/ with synthetic data.
+
+    The result has to pass the csv_schema checks: the real prefectures keep
+    their names and IDs and get grid cells as outlines, and rivers.csv is
+    rewritten with a metadata row per synthetic river. The other metadata
+    files are left alone, so convert_csv_to_js.py sees a normal data
+    directory with bigger geometry.
+    """
+    path = os.path.join(data_dir, 'prefectures_geo.csv')
+    prefectures = read_csv(path)
+    for row, cell in zip(prefectures, grid_prefectures(seed=seed)):
+        row['Coordinates'] = cell['Coordinates']
+    write_csv(path, prefectures)
+
+    real_rivers = read_csv(os.path.join(data_dir, 'rivers.csv'))
+    rivers = [{'Name': f"River{i:02d}",
+               'Coordinates': coords_to_string(random_walk_river(river_points, seed=seed + i))}
+              for i in range(n_rivers)]
+    write_csv(os.path.join(data_dir, 'rivers_geo_final.csv'), rivers)
+    write_csv(os.path.join(data_dir, 'rivers.csv'), [
+        {'Name': river['Name'],
+         'Japanese Name': f"川{i:02d}",
+         'Prefecture': real_rivers[i % len(real_rivers)]['Prefecture'],
+         'Length': str(river_points // 10),
+         'Basin': ''}
+        for i, river in enumerate(rivers)])
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for data/query_server.py.
+
+Opens --concurrency keep-alive connections and sends --requests GET
+requests over them, drawn from a fixed mix of queries (every endpoint,
+with the examples from the server's docstring) plus seeded random
+points for the point and nearest queries, so the run exercises both the
+response cache and the indexes. Reports p50, p99 and max latency and the
+request rate, overall and per endpoint, and optionally writes them as
+JSON. --no-cache adds nocache=1 to every request to time the queries
+themselves.
+
+Usage:
+    python3 benchmarks/query_client.py --spawn                 # start a server on a free port
+    python3 benchmarks/query_client.py --url http://127.0.0.1:8765 --requests 5000 --concurrency 16
+    python3 benchmarks/query_client.py --spawn --no-cache --output latency.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(BENCH_DIR), 'data')
+
+FIXED_QUERIES = [
+    '/layers',
+    '/prefecture?prefecture=Gifu&layer=rivers',
+    '/prefecture?prefecture=Nagano',
+    '/nearest?layer=sake_rice&lat=35.3606&lon=138.7274&km=50&k=20',
+    '/nearest?layer=mountains&lat=35.3606&lon=138.7274&k=5',
+    '/bbox?bbox=35,137,36.5,139',
+    '/bbox?bbox=34,135,35,136&layer=rivers',
+    '/attribute?layer=mountains&field=Elevation&min=3000',
+    '/attribute?layer=sake_rice&field=Importance&value=1',
+    '/search?q=shin',
+    '/search?q=yama&limit=20',
+    '/search?q=富士',
+    '/feature?layer=rivers&id=0',
+]
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def build_requests(count, seed=0):
+    """count request targets: the fixed queries in turn, every third one a random point."""
+    rng = random.Random(seed)
+    targets = []
+    for i in range(count):
+        if i % 3 == 2:
+            lat, lon = round(rng.uniform(31, 45), 4), round(rng.uniform(129, 145), 4)
+            if rng.random() < 0.5:
+                targets.append(f"/point?lat={lat}&lon={lon}")
+            else:
+                layer = rng.choice(['mountains', 'rivers', 'lakes', 'sake_rice'])
+                targets.append(f"/nearest?layer={layer}&lat={lat}&lon={lon}&k=5")
+        else:
+            targets.append(FIXED_QUERIES[i % len(FIXED_QUERIES)])
+    return targets
+
+
+async def worker(host, port, queue, timings, no_cache):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                target = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if no_cache:
+                target += ('&' if '?' in target else '?') + 'nocache=1'
+            start = time.perf_counter()
+            writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('utf-8'))
+            await writer.drain()
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+            endpoint = urlsplit(target).path
+            timings.append((endpoint, status, time.perf_counter() - start))
+    finally:
+        writer.close()
+
+
+async def run(host, port, targets, concurrency, no_cache):
+    queue = asyncio.Queue()
+    for target in targets:
+        queue.put_nowait(target)
+    timings = []
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, queue, timings, no_cache) for _ in range(concurrency)))
+    return timings, time.perf_counter() - start
+
+
+def summarise(timings, elapsed):
+    def stats(values):
+        values = sorted(values)
+        return {
+            'requests': len(values),
+            'p50_ms': round(percentile(values, 50) * 1000, 3),
+            'p99_ms': round(percentile(values, 99) * 1000, 3),
+            'max_ms': round(values[-1] * 1000, 3) if values else 0.0,
+        }
+
+    endpoints = {}
+    for endpoint, _, seconds in timings:
+        endpoints.setdefault(endpoint, []).append(seconds)
+    return {
+        'overall': dict(stats([t[2] for t in timings]), requests_per_s=round(len(timings) / elapsed, 1)),
+        'errors': sum(1 for t in timings if t[1] != 200),
+        'endpoints': {endpoint: stats(values) for endpoint, values in sorted(endpoints.items())},
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def spawn_server(port):
+    """Start data/query_server.py on port and wait until it accepts connections."""
+    process = subprocess.Popen([sys.executable, 'query_server.py', '--port', str(port)], cwd=DATA_DIR,
+                               stdout=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('query_server.py exited during start-up')
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError('query_server.py did not start within 60 s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure query_server.py latency (p50/p99)')
+    parser.add_argument('--url', default='http://127.0.0.1:8765', help='Server to benchmark')
+    parser.add_argument('--spawn', action='store_true', help='Start a query server on a free port for the run')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests to send (default 2000)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Parallel connections (default 8)')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the response cache (nocache=1)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the random points')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    args = parser.parse_args()
+
+    process = None
+    if args.spawn:
+        host, port = '127.0.0.1', free_port()
+        process = spawn_server(port)
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    try:
+        targets = build_requests(args.requests, args.seed)
+        timings, elapsed = asyncio.run(run(host, port, targets, args.concurrency, args.no_cache))
+    except OSError as e:
+        print(f"✗ Cannot reach {host}:{port} ({e}) - start data/query_server.py or pass --spawn")
+        return 1
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    results = summarise(timings, elapsed)
+    results.update(requests=args.requests, concurrency=args.concurrency, cache=not args.no_cache)
+    overall = results['overall']
+    print(f"✓ {overall['requests']} requests over {args.concurrency} connections "
+          f"({'cache bypassed' if args.no_cache else 'cache on'}): {overall['requests_per_s']} req/s, "
+          f"p50 {overall['p50_ms']} ms, p99 {overall['p99_ms']} ms, max {overall['max_ms']} ms")
+    print(f"\n{'Endpoint':<14}{'Requests':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for endpoint, stats in results['endpoints'].items():
+        print(f"{endpoint:<14}{stats['requests']:>10}{stats['p50_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}")
+    if results['errors']:
+        print(f"\n✗ {results['errors']} request(s) did not return 200")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"\n✓ Wrote {args.output}")
+    return 1 if results['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark the data pipeline and geometry kernels on synthetic data.
+
+Times douglas_peucker, simplify_to_n_points, find_largest_connected_segment,
+the province boundary merge, the municipality dissolve, vector tiling, the
+name search index and convert_csv_to_js.py end to end, and writes the
+results as JSON. Pass --baseline to compare against an earlier run; any
+case slower than the baseline by more than --threshold fails the run.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py                     # default sizes
+    python3 benchmarks/run_benchmarks.py --max-size 1000000  # up to 10^6 vertices
+    python3 benchmarks/run_benchmarks.py --output current.json --baseline baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+DATA_DIR = os.path.join(REPO_DIR, 'data')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+
+from generators import (grid_municipalities, grid_prefectures, grid_provinces,  # noqa: E402
+                        random_names, random_walk_river, write_synthetic_geometry)
+from clean_river_jumps import find_largest_connected_segment  # noqa: E402
+from dissolve import dissolve  # noqa: E402
+from entity_ids import NameResolver  # noqa: E402
+from merge_province_boundaries import build_province_boundaries  # noqa: E402
+from name_search import SearchIndex, build_search_index  # noqa: E402
+from simplify_rivers import douglas_peucker, simplify_to_n_points  # noqa: E402
+from vector_tiles import build_tiles, project  # noqa: E402
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+
+# Lookups per search_names run: prefixes, long-vowel spellings, misspellings, kana
+SEARCH_QUERIES = ['ka', 'Kōshi', 'koushi', 'tana', 'Oomachi', 'nishki', 'yamma', 'かし', 'おうま', 'しな'] * 100
+
+
+def time_call(func, repeat):
+    """Run func repeat times and return the timings in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_convert(data_dir):
+    """Run convert_csv_to_js.py in a copy of the data directory."""
+    subprocess.run([sys.executable, 'convert_csv_to_js.py'], cwd=data_dir, check=True,
+                   stdout=subprocess.DEVNULL)
+
+
+def copy_data_dir(workdir, name):
+    """
+    Copy the CSVs and conversion script into workdir/name/data.
+    scripts/ is copied alongside, since the conversion imports from it.
+    """
+    root = os.path.join(workdir, name)
+    target = os.path.join(root, 'data')
+    ignore = shutil.ignore_patterns('archive', '__pycache__')
+    shutil.copytree(DATA_DIR, target, ignore=ignore)
+    shutil.copytree(os.path.join(REPO_DIR, 'scripts'), os.path.join(root, 'scripts'), ignore=ignore)
+    return target
+
+
+def build_cases(sizes, workdir):
+    """Return (name, params, func) for every benchmark case."""
+    cases = []
+
+    for n in sizes:
+        river = random_walk_river(n, seed=n)
+        cases.append(('douglas_peucker', {'vertices': n},
+                      lambda river=river: douglas_peucker(river, 0.01)))
+        cases.append(('simplify_to_n_points', {'vertices': n},
+                      lambda river=river: simplify_to_n_points(river, target_points=10)))
+
+        jumpy = random_walk_river(n, seed=n, jump_probability=0.001)
+        cases.append(('find_largest_connected_segment', {'vertices': n},
+                      lambda jumpy=jumpy: find_largest_connected_segment(jumpy, 50)))
+
+    for vertices_per_edge in (50, 500):
+        prefectures = grid_prefectures(vertices_per_edge=vertices_per_edge)
+        provinces = grid_provinces(prefectures)
+        prefecture_geo = {int(p['ID']): p['Coordinates'] for p in prefectures}
+        resolver = NameResolver(prefectures)
+        cases.append(('province_merge', {'vertices': len(prefectures) * vertices_per_edge * 4},
+                      lambda provinces=provinces, prefecture_geo=prefecture_geo, resolver=resolver:
+                      build_province_boundaries(provinces, prefecture_geo, resolver, verbose=False)))
+
+    for vertices_per_edge in (5, 50):
+        rings = grid_municipalities(vertices_per_edge=vertices_per_edge)
+        cases.append(('dissolve', {'vertices': sum(len(ring) for ring in rings)},
+                      lambda rings=rings: dissolve(rings)))
+        layers = {'municipalities': ('polygon', [[[project(lat, lon) for lat, lon in ring]] for ring in rings])}
+        cases.append(('build_tiles', {'vertices': sum(len(ring) for ring in rings)},
+                      lambda layers=layers: build_tiles(layers)))
+
+    for n in (1000, 10000):
+        entries = [('names', i, romaji, kana) for i, (romaji, kana) in enumerate(random_names(n, seed=n))]
+        cases.append(('build_search_index', {'names': n},
+                      lambda entries=entries: build_search_index(['names'], entries)))
+        index = SearchIndex(build_search_index(['names'], entries))
+        cases.append(('search_names', {'names': n, 'queries': len(SEARCH_QUERIES)},
+                      lambda index=index: [index.search(query) for query in SEARCH_QUERIES]))
+
+    real_dir = copy_data_dir(workdir, 'real')
+    cases.append(('convert_csv_to_js', {'dataset': 'real'},
+                  lambda: run_convert(real_dir)))
+
+    synthetic_dir = copy_data_dir(workdir, 'synthetic')
+    write_synthetic_geometry(synthetic_dir, river_points=max(sizes[0], 1000))
+    cases.append(('convert_csv_to_js', {'dataset': 'synthetic'},
+                  lambda: run_convert(synthetic_dir)))
+
+    return cases
+
+
+def case_key(name, params):
+    return name + '[' + ','.join(f"{k}={v}" for k, v in params.items()) + ']'
+
+
+def compare(results, baseline, threshold):
+    """Return the regressions (cases slower than baseline by more than threshold)."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get('results', {}).get(key)
+        if not base:
+            continue
+        ratio = result['median_s'] / base['median_s'] if base['median_s'] else float('inf')
+        result['baseline_median_s'] = base['median_s']
+        result['ratio'] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the data pipeline')
+    parser.add_argument('--max-size', type=int, default=10**5,
+                        help='Largest synthetic river size in vertices (default: 100000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case (default: 3)')
+    parser.add_argument('--only', help='Only run cases whose name contains this string')
+    parser.add_argument('--output', help='Write results JSON here (default: stdout)')
+    parser.add_argument('--baseline', help='Compare against a previous results JSON')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed slowdown vs baseline before failing (default: 0.25 = 25%%)')
+    args = parser.parse_args()
+
+    # Douglas-Peucker recurses once per kept split point
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100000))
+
+    sizes = [n for n in SIZES if n <= args.max_size]
+    results = {}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, params, func in build_cases(sizes, workdir):
+            if args.only and args.only not in name:
+                continue
+            key = case_key(name, params)
+            print(f"Running {key}...", file=sys.stderr, flush=True)
+            timings = time_call(func, args.repeat)
+            results[key] = {
+                'name': name,
+                'params': params,
+                'repeat': args.repeat,
+                'min_s': round(min(timings), 6),
+                'median_s': round(statistics.median(timings), 6),
+            }
+
+    report = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        report['baseline'] = args.baseline
+        report['threshold'] = args.threshold
+        report['regressions'] = [key for key, _ in regressions]
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+        print(f"✓ Wrote {len(results)} results to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    for key, ratio in regressions:
+        print(f"✗ Regression: {key} is {ratio:.2f}x the baseline", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
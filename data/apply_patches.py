@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Apply the curation patches in patches/ to the CSV files.
+
+Every patch file is loaded, checked for conflicts and applied in one pass
+by scripts/patch_engine.py; files are written atomically and each change
+is journaled with its provenance in csv_journal.ndjson. Applying the same
+patches again changes nothing, so this can run before every build.
+
+Usage (from the data/ directory):
+    python3 apply_patches.py [patches/x.json ...] [--dry-run | --check]
+                             [--run-report run.json]
+
+With no files, every patches/*.json is applied. --dry-run reports what
+would change without writing; --check does the same and exits with an
+error if any CSV differs from its patches (e.g. after a hand edit that
+a patch would revert).
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from csv_store import CsvStore  # noqa: E402
+from patch_engine import PatchError, apply_patch_files, patch_files  # noqa: E402
+from pipeline_stats import RunReport, add_instrumentation_args  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply curation patches to the CSV files')
+    parser.add_argument('files', nargs='*', help='Patch files (default: patches/*.json)')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--dry-run', action='store_true', help='Report changes without writing them')
+    mode.add_argument('--check', action='store_true',
+                      help='Exit with an error if applying the patches would change anything')
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    run = RunReport.from_args('apply_patches', args)
+
+    paths = args.files or patch_files()
+    store = CsvStore()
+    with run.stage('apply') as stats:
+        try:
+            counts = apply_patch_files(paths, store, dry_run=args.dry_run or args.check,
+                                       source='apply_patches')
+        except PatchError as e:
+            for problem in e.problems:
+                print(f"✗ {problem}")
+            print(f"\n✗ {len(e.problems)} problem(s) - nothing written")
+            return 1
+        stats['rows_in'] = counts['changed'] + counts['unchanged']
+        stats['rows_out'] = counts['changed']
+
+    verb = 'would change' if args.dry_run or args.check else 'changed'
+    print(f"✓ {len(paths)} patch file(s): {counts['changed']} field(s) {verb}, "
+          f"{counts['inserted']} row(s) inserted, {counts['unchanged']} already up to date")
+
+    if args.run_report or args.profile_dir:
+        run.print_summary()
+    run.write(args.run_report)
+
+    if args.check and counts['changed']:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
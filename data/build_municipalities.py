@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Build the municipality (shichōson) layer from MLIT's N03 administrative areas.
+
+The N03 GeoJSON (National Land Numerical Information, one feature per
+polygon of every city, town, village and designated-city ward) is read as
+a stream by scripts/geojson_stream.py and written feature by feature to a
+geometry store, so the file never has to fit in memory. From there the
+layer is built bottom-up by hierarchical dissolve (scripts/dissolve.py):
+
+    N03 polygons -> municipalities (by administrative code)
+    municipalities -> prefectures (first two digits of the code)
+    municipalities -> old provinces (province containing each municipality)
+
+Each municipality is assigned to the old province (old_provinces_geo.csv)
+that contains the centroid of its largest ring, preferring provinces that
+list its prefecture. Outputs:
+
+    municipalities.csv                  Code, Name, Japanese Name, Prefecture, Province ID
+    build/n03.geom                      the N03 polygons as read
+    build/municipalities.geom           one dissolved feature per municipality
+    build/prefectures_dissolved.geom    prefecture outlines, all rings
+    build/old_provinces_dissolved.geom  old province outlines, all rings
+    ../municipalities/<code>.js         per-prefecture chunks for the page
+
+A chunk is a columnar table (scripts/columnar.py) of one prefecture's
+municipalities with simplified outlines, parts separated by '|', assigned
+to JAPAN_MUNICIPALITIES[<JIS code>]. convert_csv_to_js.py indexes
+municipalities.csv (prefecture and province -> municipality codes) so the
+page can load a prefecture's chunk the first time it is clicked, keeping
+the main bundle the same size.
+
+N03 has no romanised names, so Name starts as the Japanese name; the key
+column is Code. With --update-geometry the largest ring of each dissolved
+prefecture and old province (simplified with --outline-epsilon) replaces
+its Coordinates in prefectures_geo.csv / old_provinces_geo.csv, in one
+journaled CsvStore transaction.
+
+Usage (from the data/ directory):
+    python3 build_municipalities.py N03-20240101.geojson[.gz] [--epsilon 0.0005]
+                                    [--update-geometry] [--outline-epsilon 0.01]
+                                    [--run-report run.json] [--profile-dir profiles/]
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from columnar import encode_table  # noqa: E402
+from csv_store import CsvStore, write_atomic  # noqa: E402
+from dissolve import dissolve, point_in_ring, ring_area, ring_centroid, simplify_ring  # noqa: E402
+from entity_ids import load_resolver  # noqa: E402
+from geojson_stream import iter_features, polygon_rings  # noqa: E402
+from geometry_store import GeometryStore, GeometryStoreWriter, parse_coordinates  # noqa: E402
+from pipeline_stats import RunReport, add_instrumentation_args  # noqa: E402
+
+MUNICIPALITY_FIELDS = ['Code', 'Name', 'Japanese Name', 'Prefecture', 'Province ID']
+CHUNK_DIR = '../municipalities'
+# Decimal places of chunk coordinates (about 1 m)
+CHUNK_PRECISION = 5
+
+
+def municipality_name(properties):
+    """Japanese name of an N03 feature; designated-city wards keep their city ("札幌市中央区")."""
+    county = properties.get('N03_003') or ''
+    name = properties.get('N03_004') or ''
+    ward = properties.get('N03_005') or ''
+    if ward:
+        # 2024 and later files: city in N03_004, ward in N03_005
+        return name + ward
+    if county.endswith('市') and name.endswith('区'):
+        return county + name
+    return name or county
+
+
+def ingest(path, store_path):
+    """Stream the N03 file into a geometry store; returns (features, points, skipped)."""
+    skipped = 0
+    with GeometryStoreWriter(store_path, ['Code', 'Japanese Name']) as writer:
+        for feature in iter_features(path):
+            properties = feature.get('properties') or {}
+            code = (properties.get('N03_007') or '').strip()
+            rings = polygon_rings(feature.get('geometry'))
+            # Unassigned land (所属未定地) has no code
+            if not code.isdigit() or not rings:
+                skipped += 1
+                continue
+            writer.add({'Code': code.zfill(5), 'Japanese Name': municipality_name(properties)}, rings)
+        return writer.features, writer.points, skipped
+
+
+def ring_list(store, index):
+    """A store feature's parts as lists of (lat, lon)."""
+    return [[(flat[k], flat[k + 1]) for k in range(0, len(flat), 2)] for flat in store.parts(index)]
+
+
+def dissolve_municipalities(raw, store_path):
+    """One feature per administrative code, from every N03 polygon with that code; returns (features, points)."""
+    by_code = defaultdict(list)
+    for i in range(len(raw)):
+        by_code[raw.attributes(i)['Code']].append(i)
+    with GeometryStoreWriter(store_path, ['Code', 'Japanese Name']) as writer:
+        for code in sorted(by_code):
+            indexes = by_code[code]
+            rings = dissolve(ring for i in indexes for ring in ring_list(raw, i))
+            writer.add(raw.attributes(indexes[0]), rings)
+        return writer.features, writer.points
+
+
+def load_provinces(resolver):
+    """[(province ID, bbox, ring)] for the old province outlines."""
+    store = CsvStore()
+    provinces = []
+    for row in store.table('old_provinces_geo.csv', key='Japanese Name'):
+        province_id = resolver.province_id(row.get('Japanese Name', ''))
+        for ring in parse_coordinates(row.get('Coordinates', '')):
+            if province_id is None or len(ring) < 3:
+                continue
+            lats = [p[0] for p in ring]
+            lons = [p[1] for p in ring]
+            provinces.append((province_id, (min(lats), min(lons), max(lats), max(lons)), ring))
+    return provinces
+
+
+def find_province(point, prefecture_code, provinces, resolver):
+    """ID of the old province containing a point (provinces of the same prefecture first), or None."""
+    lat, lon = point
+    candidates = [p for p in provinces
+                  if p[1][0] <= lat <= p[1][2] and p[1][1] <= lon <= p[1][3]]
+    candidates.sort(key=lambda p: prefecture_code not in resolver.province_prefectures.get(p[0], []))
+    for province_id, _, ring in candidates:
+        if point_in_ring(point, ring):
+            return province_id
+    return None
+
+
+def dissolve_groups(municipalities, groups, store_path, attributes):
+    """Dissolve each group of municipality indexes into one feature; returns {group: rings}."""
+    outlines = {}
+    with GeometryStoreWriter(store_path, ['ID', 'Name']) as writer:
+        for key in sorted(groups):
+            rings = dissolve(ring for i in groups[key] for ring in ring_list(municipalities, i))
+            writer.add(attributes(key), rings)
+            outlines[key] = rings
+    return outlines
+
+
+def format_ring(ring, precision=None):
+    if precision is None:
+        return ';'.join(f"{lat!r},{lon!r}" for lat, lon in ring)
+    return ';'.join(f"{round(lat, precision)!r},{round(lon, precision)!r}" for lat, lon in ring)
+
+
+def write_chunks(municipalities, rows, epsilon, directory=CHUNK_DIR):
+    """One script per prefecture; returns {prefecture code: (municipalities, points)}."""
+    os.makedirs(directory, exist_ok=True)
+    by_prefecture = defaultdict(list)
+    for i, row in enumerate(rows):
+        by_prefecture[int(row['Code'][:2])].append(i)
+    written = {}
+    for code, indexes in sorted(by_prefecture.items()):
+        chunk_rows = []
+        points = 0
+        for i in indexes:
+            parts = [simplify_ring(ring, epsilon) for ring in ring_list(municipalities, i)]
+            parts = [part for part in parts if part]
+            points += sum(len(part) for part in parts)
+            chunk_rows.append({
+                'Code': int(rows[i]['Code']), 'Name': rows[i]['Name'],
+                'Japanese Name': rows[i]['Japanese Name'],
+                'Province ID': int(rows[i]['Province ID']) if rows[i]['Province ID'] else None,
+                'Coordinates': '|'.join(format_ring(part, CHUNK_PRECISION) for part in parts),
+            })
+        table = json.dumps(encode_table(chunk_rows), ensure_ascii=False, separators=(',', ':'))
+        write_atomic(os.path.join(directory, f"{code:02d}.js"),
+                     '// Municipalities of one prefecture - generated by build_municipalities.py\n'
+                     f"(window.JAPAN_MUNICIPALITIES = window.JAPAN_MUNICIPALITIES || {{}})[{code}] = {table};\n")
+        written[code] = (len(indexes), points)
+    return written
+
+
+def update_outlines(prefectures, provinces, resolver, epsilon):
+    """Replace prefecture and old province Coordinates with their dissolved outlines."""
+    store = CsvStore()
+    changed = 0
+    with store.transaction('build_municipalities'):
+        prefecture_table = store.table('prefectures_geo.csv', key='ID')
+        for code, rings in prefectures.items():
+            ring = simplify_ring(rings[0], epsilon) if rings else []
+            if ring and str(code) in prefecture_table:
+                changed += bool(prefecture_table.patch(str(code), {'Coordinates': format_ring(ring)},
+                                                       provenance='Dissolved from N03 municipalities'))
+        province_table = store.table('old_provinces_geo.csv', key='Japanese Name')
+        for row in list(province_table):
+            province_id = resolver.province_id(row.get('Japanese Name', ''))
+            rings = provinces.get(province_id)
+            ring = simplify_ring(rings[0], epsilon) if rings else []
+            if ring:
+                changed += bool(province_table.patch(row['Japanese Name'], {'Coordinates': format_ring(ring)},
+                                                     provenance='Dissolved from N03 municipalities'))
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the municipality layer from an N03 GeoJSON file')
+    parser.add_argument('geojson', help='N03 administrative areas (.geojson or .geojson.gz)')
+    parser.add_argument('--build-dir', default='build', help='Directory for the geometry stores')
+    parser.add_argument('--epsilon', type=float, default=0.0005,
+                        help='Simplification tolerance of chunk outlines, in degrees (default 0.0005)')
+    parser.add_argument('--update-geometry', action='store_true',
+                        help='Write the dissolved outlines into prefectures_geo.csv and old_provinces_geo.csv')
+    parser.add_argument('--outline-epsilon', type=float, default=0.01,
+                        help='Simplification tolerance of the written outlines, in degrees (default 0.01)')
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    run = RunReport.from_args('build_municipalities', args)
+
+    raw_path = os.path.join(args.build_dir, 'n03.geom')
+    with run.stage('ingest') as stats:
+        try:
+            features, points, skipped = ingest(args.geojson, raw_path)
+        except (OSError, ValueError) as e:
+            print(f"✗ Cannot read {args.geojson}: {e}")
+            return 1
+        stats['rows_in'] = features + skipped
+        stats['rows_out'] = features
+        stats['vertices_in'] = stats['vertices_out'] = points
+    print(f"✓ Streamed {features} polygons ({points} points) from {args.geojson}"
+          + (f", skipped {skipped} without a code" if skipped else ''))
+
+    municipality_path = os.path.join(args.build_dir, 'municipalities.geom')
+    with run.stage('dissolve:municipalities') as stats, GeometryStore(raw_path) as raw:
+        count, points = dissolve_municipalities(raw, municipality_path)
+        stats['rows_in'] = len(raw)
+        stats['rows_out'] = count
+        stats['vertices_in'] = raw.meta['points']
+        stats['vertices_out'] = points
+
+    resolver = load_resolver()
+    provinces = load_provinces(resolver)
+    with GeometryStore(municipality_path) as municipalities:
+        with run.stage('assign') as stats:
+            rows = []
+            unplaced = []
+            for i in range(len(municipalities)):
+                attributes = municipalities.attributes(i)
+                code = int(attributes['Code'][:2])
+                rings = ring_list(municipalities, i)
+                largest = max(rings, key=lambda r: abs(ring_area(r))) if rings else None
+                province_id = find_province(ring_centroid(largest), code, provinces, resolver) if largest else None
+                if province_id is None:
+                    unplaced.append(attributes['Japanese Name'])
+                rows.append({
+                    'Code': attributes['Code'], 'Name': attributes['Japanese Name'],
+                    'Japanese Name': attributes['Japanese Name'],
+                    'Prefecture': resolver.prefecture_name(code) or '',
+                    'Province ID': province_id or '',
+                })
+            stats['rows_in'] = len(municipalities)
+            stats['rows_out'] = len(rows) - len(unplaced)
+        missing = sorted({row['Code'][:2] for row in rows if not row['Prefecture']})
+        for prefix in missing:
+            print(f"✗ Unknown prefecture code {prefix}")
+        if unplaced:
+            print(f"  ({len(unplaced)} municipalities outside every old province, e.g. {unplaced[0]})")
+
+        with run.stage('dissolve:prefectures') as stats:
+            groups = defaultdict(list)
+            for i, row in enumerate(rows):
+                groups[int(row['Code'][:2])].append(i)
+            prefectures = dissolve_groups(
+                municipalities, groups, os.path.join(args.build_dir, 'prefectures_dissolved.geom'),
+                lambda code: {'ID': code, 'Name': resolver.prefecture_geo_names.get(code, '')})
+            stats['rows_in'] = len(rows)
+            stats['rows_out'] = len(prefectures)
+
+        with run.stage('dissolve:provinces') as stats:
+            groups = defaultdict(list)
+            for i, row in enumerate(rows):
+                if row['Province ID']:
+                    groups[row['Province ID']].append(i)
+            province_outlines = dissolve_groups(
+                municipalities, groups, os.path.join(args.build_dir, 'old_provinces_dissolved.geom'),
+                lambda province_id: {'ID': province_id, 'Name': resolver.province_names.get(province_id, '')})
+            stats['rows_in'] = len(rows) - len(unplaced)
+            stats['rows_out'] = len(province_outlines)
+        print(f"✓ Dissolved {len(rows)} municipalities into {len(prefectures)} prefectures "
+              f"and {len(province_outlines)} old provinces")
+
+        with run.stage('write:municipalities.csv') as stats:
+            store = CsvStore()
+            with store.transaction('build_municipalities'):
+                store.table('municipalities.csv', key='Code',
+                            fieldnames=MUNICIPALITY_FIELDS).replace_rows(rows, MUNICIPALITY_FIELDS)
+            stats['rows_in'] = stats['rows_out'] = len(rows)
+        print(f"✓ Wrote municipalities.csv: {len(rows)} rows")
+
+        with run.stage('write:chunks') as stats:
+            chunks = write_chunks(municipalities, rows, args.epsilon)
+            stats['rows_in'] = stats['rows_out'] = len(rows)
+            stats['vertices_in'] = municipalities.meta['points']
+            stats['vertices_out'] = sum(points for _, points in chunks.values())
+        print(f"✓ Wrote {len(chunks)} prefecture chunks to {CHUNK_DIR}/ "
+              f"({stats['vertices_out']} of {stats['vertices_in']} points kept)")
+
+    if args.update_geometry:
+        with run.stage('write:outlines') as stats:
+            changed = update_outlines(prefectures, province_outlines, resolver, args.outline_epsilon)
+            stats['rows_in'] = len(prefectures) + len(province_outlines)
+            stats['rows_out'] = changed
+        print(f"✓ Updated {changed} prefecture and old province outline(s)")
+
+    if args.run_report or args.profile_dir:
+        run.print_summary()
+    run.write(args.run_report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
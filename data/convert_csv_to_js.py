@@ -1,10 +1,50 @@
 #!/usr/bin/env python3
 """
 Convert all CSV data files to a single JavaScript file for embedding.
+
+Every CSV is loaded through its schema (scripts/csv_schema.py); any
+violation stops the build before anything is written. The data, plus
+the derived sections (bounds, entity_index, sake_rice_lineage,
+sake_rice_choropleth, search_index and, with municipalities.csv,
+municipality_index), is written as:
+- ../japan_geo_data.js, for file:// use
+- ../japan_geo_data.ndjson.gz (and .br), one section per line
+- ../chunks/*.json, per-layer chunks the page loads lazily (CHUNKS)
+- ../tiles/japan.tiles, vector tiles of TILE_LAYERS
+
+Each section is built by its module in scripts/ (columnar, entity_ids,
+lineage, choropleth, name_search, vector_tiles, geometry_store), which
+documents it; data/README.md describes the outputs.
+
+Usage (from the data/ directory):
+    python3 convert_csv_to_js.py [--layout columnar|rows] [--validate-only]
+                                 [--geometry-dir build/] [--tile-max-zoom 4]
+                                 [--run-report run.json] [--profile-dir profiles/]
 """
 
-import csv
+import argparse
+import gzip
+import hashlib
 import json
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from choropleth import choropleth_section  # noqa: E402
+from columnar import encode_table  # noqa: E402
+from csv_schema import check_all_references, format_violation, load_table  # noqa: E402
+from entity_ids import NameResolver, strip_feature_prefix  # noqa: E402
+from geometry_store import GeometryStore, parse_coordinates  # noqa: E402
+from lineage import Lineage  # noqa: E402
+from name_search import build_search_index  # noqa: E402
+from pipeline_stats import RunReport, add_instrumentation_args, count_vertices  # noqa: E402
+from vector_tiles import DEFAULT_MAX_ZOOM, build_tiles, project, write_archive  # noqa: E402
 
 # Files to convert
 files = {
@@ -22,34 +62,482 @@ files = {
     'sake_rice': 'sake_rice.csv'
 }
 
+# Optional tables, read when present but not embedded: only their index
+# goes into the bundle (the rows are loaded on demand from chunks)
+optional_files = {
+    'municipalities': 'municipalities.csv'
+}
+
+# Tables indexed by prefecture in the prefecture_index section
+PREFECTURE_TABLES = [
+    'prefectures', 'prefectures_geo', 'lakes', 'lakes_geo', 'rivers', 'rivers_geo',
+    'mountains', 'mountains_geo', 'mountain_ranges', 'sake_rice'
+]
+
+# Geometry tables joined to the metadata row of the same (canonical) name
+METADATA_TABLES = {
+    'lakes_geo': 'lakes', 'rivers_geo': 'rivers', 'mountains_geo': 'mountains',
+    'old_provinces_geo': 'old_provinces'
+}
+
+# Lazily loaded chunks, in load order: the page fetches "core" at start-up
+# and every other chunk the first time its layer is shown. Old province
+# metadata is tiny and names provinces everywhere, so it stays in core.
+CHUNKS = {
+    'core': ['prefectures', 'prefectures_geo', 'old_provinces'],
+    'old_provinces': ['old_provinces_geo'],
+    'lakes': ['lakes', 'lakes_geo'],
+    'rivers': ['rivers', 'rivers_geo'],
+    'mountains': ['mountains', 'mountains_geo'],
+    'mountain_ranges': ['mountain_ranges'],
+    'sake_rice': ['sake_rice', 'sake_rice_lineage', 'sake_rice_choropleth'],
+    'search': ['search_index'],
+}
+
+# Map layer (the page's layer buttons) -> the chunk holding its data
+LAYER_CHUNKS = {
+    'prefectures': 'core', 'old_provinces': 'old_provinces', 'lakes': 'lakes', 'rivers': 'rivers',
+    'mountains': 'mountains', 'mountain_ranges': 'mountain_ranges', 'sake_rice': 'sake_rice'
+}
+
+# Map layer -> (geometry table, feature kind) cut into vector tiles
+TILE_LAYERS = {
+    'prefectures': ('prefectures_geo', 'polygon'), 'old_provinces': ('old_provinces_geo', 'polygon'),
+    'lakes': ('lakes_geo', 'polygon'), 'rivers': ('rivers_geo', 'polyline'),
+    'mountains': ('mountains_geo', 'point'), 'mountain_ranges': ('mountain_ranges', 'polygon')
+}
+
+# Tables whose Name and Japanese Name go into the search index, in index order
+SEARCH_LAYERS = ['prefectures', 'old_provinces', 'mountains', 'rivers', 'lakes', 'sake_rice']
+
+# Column spellings the page has always accepted for a record's prefecture(s)
+PREFECTURE_FIELDS = ('Prefecture', 'Prefectures', ' Prefecture', 'Prefecture ', ' Prefecture ')
+
 def read_csv(filename):
-    """Read CSV file and return as list of dictionaries."""
-    data = []
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Filter out completely empty rows
-                if any(v.strip() for v in row.values()):
-                    data.append(row)
-        print(f"✓ Loaded {filename}: {len(data)} rows")
-    except Exception as e:
-        print(f"✗ Error loading {filename}: {e}")
-        data = []
-    return data
-
-# Load all data
-all_data = {}
-for key, filename in files.items():
-    all_data[key] = read_csv(filename)
-
-# Write to JavaScript file in parent directory
-with open('../japan_geo_data.js', 'w', encoding='utf-8') as f:
-    f.write('// Japan Geography Data - Auto-generated from CSV files\n')
-    f.write('// Do not edit manually - regenerate using convert_csv_to_js.py\n\n')
-    f.write('const JAPAN_GEO_DATA = ')
-    json.dump(all_data, f, ensure_ascii=False, indent=2)
-    f.write(';\n')
-
-print(f"\n✓ Created japan_geo_data.js with {sum(len(v) for v in all_data.values())} total records")
-print(f"  Data keys: {', '.join(all_data.keys())}")
+    """
+    Load a CSV through its schema: (typed rows, row line numbers, violations).
+    Read errors are returned as violations rather than as an empty table.
+    """
+    rows, lines, violations = load_table(filename)
+    if not any(v.line == 0 for v in violations):
+        print(f"✓ Loaded {filename}: {len(rows)} rows")
+    return rows, lines, violations
+
+def coordinate_bounds(coords_str):
+    """[min_lat, min_lon, max_lat, max_lon] of a "lat,lon;lat,lon" string, or None."""
+    lats = []
+    lons = []
+    for pair in coords_str.split(';'):
+        try:
+            lat, lon = map(float, pair.split(','))
+        except ValueError:
+            continue
+        lats.append(lat)
+        lons.append(lon)
+    if not lats:
+        return None
+    return [round(min(lats), 5), round(min(lons), 5), round(max(lats), 5), round(max(lons), 5)]
+
+def table_bounds(all_data, stores=None):
+    """
+    Per-row bounding boxes for every table that has geometry, read from the
+    table's geometry store when there is one (no coordinate parsing).
+    """
+    bounds = {}
+    for key, rows in all_data.items():
+        if not rows or 'Coordinates' not in rows[0]:
+            continue
+        store = (stores or {}).get(key)
+        if store is not None:
+            bounds[key] = [[round(v, 5) for v in box] if box else None
+                           for box in (store.bounds(i) for i in range(len(store)))]
+        else:
+            bounds[key] = [coordinate_bounds(row.get('Coordinates') or '') for row in rows]
+    return bounds
+
+def open_geometry_stores(directory, all_data):
+    """
+    {table key: GeometryStore} for the tables with a <csv name>.geom store in
+    directory. A store must have the table's rows in the same order; a stale
+    one is reported and skipped.
+    """
+    stores = {}
+    for key, filename in files.items():
+        path = os.path.join(directory, os.path.splitext(filename)[0] + '.geom')
+        if not os.path.isdir(path):
+            continue
+        store = GeometryStore(path)
+        rows = all_data.get(key, [])
+        if len(store) != len(rows) or any(store.attributes(i).get('Name') != row.get('Name')
+                                          for i, row in enumerate(rows)):
+            print(f"✗ {path} does not match {filename} - re-import it; parsing the CSV instead")
+            store.close()
+            continue
+        stores[key] = store
+    return stores
+
+def metadata_joins(all_data):
+    """
+    For each geometry table, the row index of each row's metadata record (or -1).
+    Rows are joined by Japanese name where they have one, else by canonical name.
+    """
+    joins = {}
+    for table, meta_table in METADATA_TABLES.items():
+        by_name = {}
+        by_japanese = {}
+        for i, row in enumerate(all_data.get(meta_table, [])):
+            by_name.setdefault(strip_feature_prefix(row.get('Name', ''), meta_table), i)
+            if row.get('Japanese Name'):
+                by_japanese.setdefault(row['Japanese Name'], i)
+        table_joins = []
+        for row in all_data.get(table, []):
+            index = by_japanese.get(row.get('Japanese Name') or None)
+            if index is None:
+                index = by_name.get(strip_feature_prefix(row.get('Name', ''), meta_table), -1)
+            table_joins.append(index)
+        joins[table] = table_joins
+    return joins
+
+def record_prefectures(row, table, meta_row):
+    """The ';'-separated prefecture value of a record, as the page reads it."""
+    if table in ('prefectures', 'prefectures_geo'):
+        return row['Name']
+    for source in (row, meta_row or {}):
+        for field in PREFECTURE_FIELDS:
+            if source.get(field):
+                return source[field]
+    return ''
+
+def entity_index(all_data):
+    """Build the entity_index section; also returns the names that did not resolve."""
+    resolver = NameResolver(all_data['prefectures_geo'], all_data['prefectures'],
+                            all_data.get('old_provinces', []))
+    joins = metadata_joins(all_data)
+
+    prefectures = {}
+    tables = {}
+    unresolved = set(resolver.unmatched)
+    for table in PREFECTURE_TABLES:
+        meta_rows = all_data.get(METADATA_TABLES.get(table), [])
+        table_ids = []
+        inverted = {}
+        for i, row in enumerate(all_data.get(table, [])):
+            meta_index = joins[table][i] if table in joins else -1
+            value = record_prefectures(row, table, meta_rows[meta_index] if meta_index >= 0 else None)
+            unresolved.update(resolver.unresolved(value))
+            row_ids = resolver.prefecture_ids(value)
+            for code in row_ids:
+                inverted.setdefault(code, []).append(i)
+            table_ids.append(row_ids)
+        prefectures[table] = table_ids
+        tables[table] = inverted
+
+    for value in all_data.get('old_provinces', []):
+        unresolved.update(resolver.unresolved(value.get('Prefectures', '')))
+
+    # Old provinces are matched by row, not name: two provinces are called "Awa"
+    provinces = {
+        'old_provinces': list(range(1, len(all_data.get('old_provinces', [])) + 1)),
+        'old_provinces_geo': [i + 1 if i >= 0 else None for i in joins['old_provinces_geo']],
+    }
+
+    index = {
+        'aliases': {'prefectures': resolver.prefecture_aliases, 'provinces': resolver.province_aliases},
+        'prefectures': prefectures,
+        'tables': tables,
+        'provinces': provinces,
+        'province_prefectures': resolver.province_prefectures,
+        'metadata': joins,
+    }
+    return index, resolver, sorted(unresolved)
+
+def municipality_index(rows):
+    """
+    The municipality_index section: prefecture code and old province ID ->
+    municipality codes, the prefectures each province spans, and where the
+    per-prefecture chunks written by build_municipalities.py live.
+    """
+    prefectures = {}
+    provinces = {}
+    province_prefectures = {}
+    for row in rows:
+        code = row['Code']
+        prefecture = code // 1000
+        prefectures.setdefault(prefecture, []).append(code)
+        if row.get('Province ID'):
+            provinces.setdefault(row['Province ID'], []).append(code)
+            spanned = province_prefectures.setdefault(row['Province ID'], [])
+            if prefecture not in spanned:
+                spanned.append(prefecture)
+    return {
+        'chunk': 'municipalities/{code}.js',
+        'prefectures': prefectures,
+        'provinces': provinces,
+        'province_prefectures': province_prefectures,
+    }
+
+def build_bundle(all_data):
+    """Serialise the data as newline-delimited [key, rows] sections, in files order."""
+    lines = [json.dumps([key, rows], ensure_ascii=False, separators=(',', ':'))
+             for key, rows in all_data.items()]
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+def write_compressed_bundle(all_data, basename='../japan_geo_data.ndjson'):
+    """Write the gzip (and, if available, brotli) variants of the bundle."""
+    payload = build_bundle(all_data)
+    written = []
+
+    # mtime=0 keeps the output byte-identical between runs
+    with open(basename + '.gz', 'wb') as f:
+        f.write(gzip.compress(payload, compresslevel=9, mtime=0))
+    written.append(basename + '.gz')
+
+    if brotli is not None:
+        with open(basename + '.br', 'wb') as f:
+            f.write(brotli.compress(payload, quality=11))
+        written.append(basename + '.br')
+    else:
+        print("  (brotli module not installed - skipping .br bundle)")
+
+    for path in written:
+        print(f"✓ Created {os.path.basename(path)}: {os.path.getsize(path) / 1024:.0f} KB "
+              f"({len(payload) / 1024:.0f} KB uncompressed)")
+    return len(payload)
+
+def layer_rows(all_data):
+    """Features per map layer (rows of its geometry table), for the layer buttons."""
+    return {layer: len(all_data[TILE_LAYERS[layer][0] if layer in TILE_LAYERS else layer])
+            for layer in LAYER_CHUNKS}
+
+def write_chunks(output, rows, directory='../chunks'):
+    """
+    Split the output into one JSON file per CHUNKS entry plus manifest.json.
+    Each chunk holds its tables and their bounds; the indexes go into core.
+    The manifest also gives each layer's feature count (rows, from
+    layer_rows()), so the page can show it before the chunk is loaded.
+    Returns the manifest.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest = {'chunks': {}, 'layers': LAYER_CHUNKS, 'layer_rows': rows}
+    for name, keys in CHUNKS.items():
+        sections = {key: output[key] for key in keys}
+        sections['bounds'] = {key: boxes for key, boxes in output['bounds'].items() if key in keys}
+        if name == 'core':
+            for key in ('entity_index', 'municipality_index'):
+                if key in output:
+                    sections[key] = output[key]
+        payload = json.dumps(sections, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with open(os.path.join(directory, f"{name}.json"), 'wb') as f:
+            f.write(payload)
+        manifest['chunks'][name] = {
+            'file': f"chunks/{name}.json",
+            'sections': list(sections),
+            'bytes': len(payload),
+            # Changes whenever the chunk does, so the page can bypass stale caches
+            'hash': hashlib.sha1(payload).hexdigest()[:12],
+        }
+    with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return manifest
+
+def tile_features(rows):
+    """Projected parts of every row, in row order (Latitude/Longitude rows become one point)."""
+    features = []
+    for row in rows:
+        if row.get('Coordinates'):
+            parts = parse_coordinates(row['Coordinates'])
+        elif row.get('Latitude') not in (None, '') and row.get('Longitude') not in (None, ''):
+            parts = [[(float(row['Latitude']), float(row['Longitude']))]]
+        else:
+            parts = []
+        features.append([[project(lat, lon) for lat, lon in part] for part in parts])
+    return features
+
+def write_tiles(all_data, path='../tiles/japan.tiles', max_zoom=DEFAULT_MAX_ZOOM):
+    """
+    Cut the TILE_LAYERS into vector tiles (scripts/vector_tiles.py).
+    Returns the archive directory and the points in and (over all zooms) out.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    layers = {name: (kind, tile_features(all_data[table])) for name, (table, kind) in TILE_LAYERS.items()}
+    tiles = build_tiles(layers, max_zoom)
+    directory = write_archive(path, tiles, {name: kind for name, (_, kind) in TILE_LAYERS.items()}, max_zoom)
+    points_in = sum(len(part) for _, features in layers.values() for parts in features for part in parts)
+    points_out = sum(len(part) // 2 for tile in tiles.values() for features in tile.values()
+                     for feature in features for part in feature[1:])
+    return directory, points_in, points_out
+
+def sake_rice_choropleth(all_data, index):
+    """The sake_rice_choropleth section: production per prefecture and old province (scripts/choropleth.py)."""
+    prefecture_ids = sorted({code for codes in index['prefectures']['prefectures'] for code in codes})
+    return choropleth_section(all_data['sake_rice'], index['prefectures']['sake_rice'],
+                              prefecture_ids, index['province_prefectures'])
+
+def search_index(all_data):
+    """The search_index section: names of the SEARCH_LAYERS rows (scripts/name_search.py)."""
+    entries = [(table, i, row.get('Name') or '', row.get('Japanese Name') or '')
+               for table in SEARCH_LAYERS for i, row in enumerate(all_data[table])]
+    return build_search_index(SEARCH_LAYERS, entries)
+
+def table_vertices(rows, store=None):
+    """Total number of coordinate points in a table's Coordinates column (or its geometry store)."""
+    if store is not None:
+        return store.meta['points']
+    return sum(count_vertices(row.get('Coordinates', '')) for row in rows)
+
+def main():
+    parser = argparse.ArgumentParser(description='Regenerate japan_geo_data.js from the CSV files')
+    parser.add_argument('--layout', choices=('columnar', 'rows'), default='columnar',
+                        help='Emit tables as typed columns (default) or as indented row objects')
+    parser.add_argument('--geometry-dir',
+                        help='Directory of geometry stores (<csv name>.geom, see scripts/geometry_store.py) '
+                             'to read bounds and vertex counts from')
+    parser.add_argument('--tile-max-zoom', type=int, default=DEFAULT_MAX_ZOOM,
+                        help=f'Deepest zoom level of tiles/japan.tiles (default {DEFAULT_MAX_ZOOM})')
+    parser.add_argument('--validate-only', action='store_true',
+                        help='Check the CSVs against their schemas and exit without writing anything')
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    run = RunReport.from_args('convert_csv_to_js', args)
+
+    # Load all data, coercing and checking every table against its schema
+    all_data = {}
+    lines = {}
+    violations = []
+    for key, filename in files.items():
+        with run.stage(f"load:{key}") as stats:
+            all_data[key], lines[filename], table_violations = read_csv(filename)
+            violations += table_violations
+            stats['rows_in'] = stats['rows_out'] = len(all_data[key])
+            stats['vertices_in'] = stats['vertices_out'] = table_vertices(all_data[key])
+    optional_data = {}
+    for key, filename in optional_files.items():
+        if not os.path.exists(filename):
+            continue
+        with run.stage(f"load:{key}") as stats:
+            optional_data[key], lines[filename], table_violations = read_csv(filename)
+            violations += table_violations
+            stats['rows_in'] = stats['rows_out'] = len(optional_data[key])
+
+    with run.stage('validate') as stats:
+        tables = {filename: all_data[key] for key, filename in files.items()}
+        tables.update({optional_files[key]: rows for key, rows in optional_data.items()})
+        violations += check_all_references(tables, lines, violations)
+        stats['rows_in'] = sum(len(v) for v in all_data.values())
+        stats['rows_out'] = stats['rows_in'] - len({(v.file, v.line) for v in violations})
+
+    if violations:
+        for violation in violations:
+            print(f"✗ {format_violation(violation)}")
+        print(f"\n✗ {len(violations)} schema violation(s) in "
+              f"{len({v.file for v in violations})} file(s) - nothing written")
+        run.write(args.run_report)
+        return 1
+    print(f"✓ All {len(files) + len(optional_data)} tables match their schemas")
+    if args.validate_only:
+        run.write(args.run_report)
+        return 0
+
+    stores = open_geometry_stores(args.geometry_dir, all_data) if args.geometry_dir else {}
+    with run.stage('bounds') as stats:
+        bounds = table_bounds(all_data, stores)
+        stats['rows_in'] = stats['rows_out'] = sum(len(v) for v in bounds.values())
+        stats['vertices_in'] = stats['vertices_out'] = sum(
+            table_vertices(all_data[key], stores.get(key)) for key in bounds)
+        used = [key for key in stores if key in bounds]
+        if used:
+            print(f"✓ Bounds of {', '.join(used)} read from geometry stores in {args.geometry_dir}")
+    # Only the bounds and vertex counts come from the stores
+    for store in stores.values():
+        store.close()
+
+    with run.stage('entity_index') as stats:
+        index, resolver, unresolved = entity_index(all_data)
+        stats['rows_in'] = sum(len(v) for v in index['prefectures'].values())
+        stats['rows_out'] = sum(1 for v in index['prefectures'].values() for ids in v if ids)
+        for name in unresolved:
+            print(f"✗ Unknown prefecture name: {name}")
+        for alias, ids in sorted(resolver.conflicts.items()):
+            print(f"  (ambiguous alias '{alias}' shared by IDs {ids} - not resolvable by that name)")
+
+    if args.layout == 'columnar':
+        with run.stage('encode:columnar') as stats:
+            tables = {key: encode_table(rows) for key, rows in all_data.items()}
+            stats['rows_in'] = stats['rows_out'] = sum(len(v) for v in all_data.values())
+    else:
+        tables = all_data
+    output = dict(tables, bounds=bounds, entity_index=index)
+    with run.stage('lineage') as stats:
+        lineage = Lineage(all_data['sake_rice'])
+        output['sake_rice_lineage'] = lineage.section()
+        stats['rows_in'] = lineage.rows
+        stats['rows_out'] = len(lineage.names)
+        print(f"✓ Parsed sake rice lineage: {sum(map(len, lineage.parents))} crosses over "
+              f"{len(lineage.names)} varieties ({len(lineage.names) - lineage.rows} known only as parents)")
+        for parent, child, source in lineage.rejected:
+            print(f"✗ Lineage edge {parent} -> {child} ({source}) left out: it would close a cycle")
+
+    with run.stage('choropleth') as stats:
+        output['sake_rice_choropleth'] = sake_rice_choropleth(all_data, index)
+        stats['rows_in'] = len(all_data['sake_rice'])
+        stats['rows_out'] = sum(len(output['sake_rice_choropleth'][level]['ids'])
+                                for level in ('prefectures', 'provinces'))
+        prefectures = output['sake_rice_choropleth']['prefectures']['all']
+        print(f"✓ Aggregated sake rice production: {sum(prefectures['tonnes']):.0f} tonnes over "
+              f"{sum(1 for v in prefectures['varieties'] if v)} prefectures, "
+              f"breaks {prefectures['tonnes_breaks']}")
+
+    with run.stage('search_index') as stats:
+        output['search_index'] = search_index(all_data)
+        stats['rows_in'] = len(output['search_index']['entries'])
+        stats['rows_out'] = len(output['search_index']['keys'])
+        print(f"✓ Indexed {stats['rows_in']} names for search: {stats['rows_out']} keys, "
+              f"{len(output['search_index']['grams'])} n-grams")
+    if 'municipalities' in optional_data:
+        output['municipality_index'] = municipality_index(optional_data['municipalities'])
+        print(f"✓ Indexed {len(optional_data['municipalities'])} municipalities "
+              f"in {len(output['municipality_index']['prefectures'])} prefecture chunks")
+
+    # Write to JavaScript file in parent directory
+    with run.stage('write:japan_geo_data.js') as stats:
+        with open('../japan_geo_data.js', 'w', encoding='utf-8') as f:
+            f.write('// Japan Geography Data - Auto-generated from CSV files\n')
+            f.write('// Do not edit manually - regenerate using convert_csv_to_js.py\n\n')
+            f.write('const JAPAN_GEO_DATA = ')
+            if args.layout == 'columnar':
+                json.dump(output, f, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(output, f, ensure_ascii=False, indent=2)
+            f.write(';\n')
+        stats['rows_in'] = stats['rows_out'] = sum(len(v) for v in all_data.values())
+        stats['vertices_in'] = stats['vertices_out'] = sum(table_vertices(v) for v in all_data.values())
+
+    with run.stage('write:compressed_bundle') as stats:
+        write_compressed_bundle(output)
+        stats['rows_in'] = stats['rows_out'] = sum(len(v) for v in all_data.values())
+
+    with run.stage('write:chunks') as stats:
+        manifest = write_chunks(output, layer_rows(all_data))
+        stats['rows_in'] = stats['rows_out'] = sum(len(v) for v in all_data.values())
+        sizes = {name: chunk['bytes'] for name, chunk in manifest['chunks'].items()}
+        print(f"✓ Created chunks/manifest.json and {len(sizes)} chunks: core {sizes['core'] / 1024:.0f} KB, "
+              f"{sum(sizes.values()) / 1024:.0f} KB in all")
+
+    with run.stage('write:tiles') as stats:
+        directory, stats['vertices_in'], stats['vertices_out'] = write_tiles(all_data, max_zoom=args.tile_max_zoom)
+        stats['rows_in'] = sum(len(all_data[table]) for table, _ in TILE_LAYERS.values())
+        stats['rows_out'] = len(directory['tiles'])
+        print(f"✓ Created tiles/japan.tiles: {len(directory['tiles'])} tiles at zoom 0-{args.tile_max_zoom}, "
+              f"{directory['bytes'] / 1024:.0f} KB")
+
+    print(f"\n✓ Created japan_geo_data.js with {sum(len(v) for v in all_data.values())} total records")
+    print(f"  Data keys: {', '.join(all_data.keys())}")
+
+    if args.run_report or args.profile_dir:
+        run.print_summary()
+    run.write(args.run_report)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Precompute leader-line label layouts for the map's fixed zoom bands.
+
+Run after convert_csv_to_js.py. Reads ../japan_geo_data.js and, for every
+label layer, runs the page's placement engine (scripts/label_layout.py) for:
+- each zoom level the +/- buttons reach from the default view, unfiltered
+- zoom 1 with each prefecture selected as the filter (keyed by its
+  normalised name)
+
+The result is written to ../japan_label_layouts.js. The page looks a layout
+up when the view is unpanned at one of those zoom levels and only computes
+layouts itself for other views. Every layout is also checked for overlapping
+or out-of-view labels; with --check the stage fails if any are found.
+
+Usage (from the data/ directory):
+    python3 precompute_label_layouts.py [--check] [--run-report run.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from columnar import decode_table  # noqa: E402
+from label_layout import (LABEL_SPACING, MAX_DISPLACEMENT, LabelSources,  # noqa: E402
+                          count_overlaps, layout_labels, visible_bounds, zoom_bands)
+from pipeline_stats import RunReport, add_instrumentation_args  # noqa: E402
+
+# Page layer -> featureType used in its label classes
+LABEL_LAYERS = {
+    'rivers': 'river',
+    'lakes': 'lake',
+    'mountains': 'mountain',
+    'mountain_ranges': 'mountain-range',
+    'sake_rice': 'sake-rice',
+}
+
+
+def load_geo_data(path='../japan_geo_data.js'):
+    """Read the JAPAN_GEO_DATA object back out of the generated script, decoding columnar tables."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    start = text.index('=', text.index('const JAPAN_GEO_DATA')) + 1
+    data = json.loads(text[start:].strip().rstrip(';'))
+    return {key: decode_table(value) for key, value in data.items()}
+
+
+def layout_key(feature_type, zoom, prefecture='', variant=''):
+    """Lookup key shared with the page (labelLayoutKey)."""
+    return f"{feature_type}|{zoom:.6f}|{prefecture}|{variant}"
+
+
+def build_layouts(sources, bands, prefectures):
+    """Yield (key, layout, overlaps, outside) for every band/filter combination."""
+    jobs = []
+    for layer, feature_type in LABEL_LAYERS.items():
+        variants = [''] + (['top'] if layer == 'sake_rice' else [])
+        for variant in variants:
+            for zoom in bands:
+                jobs.append((layer, feature_type, variant, zoom, ''))
+            for prefecture in prefectures:
+                jobs.append((layer, feature_type, variant, 1, prefecture))
+
+    # Keyed by the normalised name so the map's and the labels' spellings of a
+    # prefecture filter ("Nagano Ken" / "Nagano") find the same layout
+    for layer, feature_type, variant, zoom, prefecture in jobs:
+        features = sources.features(layer, prefecture_filter=prefecture or None,
+                                    top_tier_only=(variant == 'top'))
+        bounds = visible_bounds(zoom)
+        in_view = [f for f in features
+                   if bounds['minX'] <= f['point'][0] <= bounds['maxX']
+                   and bounds['minY'] <= f['point'][1] <= bounds['maxY']]
+        placements = layout_labels(features, bounds)
+        outside = sum(1 for p in placements
+                      if not bounds['minY'] <= p['labelY'] <= bounds['maxY'])
+        layout = {
+            # Candidates inside the view; the page only uses the layout if it
+            # sees the same number, so a stale file falls back to live layout
+            'n': len(in_view),
+            'p': [[p['feature']['index'], round(p['labelX'], 3), round(p['labelY'], 3)]
+                  for p in placements],
+        }
+        yield layout_key(feature_type, zoom, sources.normalize(prefecture), variant), layout, count_overlaps(placements), outside
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute label layouts per zoom band')
+    parser.add_argument('--input', default='../japan_geo_data.js')
+    parser.add_argument('--output', default='../japan_label_layouts.js')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit with an error if any layout has overlapping or out-of-view labels')
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    run = RunReport.from_args('precompute_label_layouts', args)
+
+    with run.stage('load') as stats:
+        data = load_geo_data(args.input)
+        sources = LabelSources(data)
+        stats['rows_in'] = stats['rows_out'] = sum(len(v) for v in data.values() if isinstance(v, list))
+
+    bands = zoom_bands()
+    prefectures = [p['Name'] for p in data['prefectures_geo']]
+
+    layouts = {}
+    counts = {'layouts': 0, 'labels': 0, 'overlaps': 0, 'outside': 0}
+    with run.stage('layout') as stats:
+        for key, layout, overlaps, outside in build_layouts(sources, bands, prefectures):
+            layouts[key] = layout
+            counts['layouts'] += 1
+            counts['labels'] += len(layout['p'])
+            counts['overlaps'] += overlaps
+            counts['outside'] += outside
+            if overlaps or outside:
+                print(f"✗ {key}: {overlaps} overlapping, {outside} out-of-view labels")
+        stats['rows_in'] = counts['layouts']
+        stats['rows_out'] = counts['labels']
+
+    output = {
+        'spacing': LABEL_SPACING,
+        'maxDisplacement': MAX_DISPLACEMENT,
+        'bands': bands,
+        # Row counts the layouts were computed for; the page ignores the file if they differ
+        'counts': {
+            'rivers': len(data['rivers_geo']),
+            'lakes': len(data['lakes_geo']),
+            'mountains': len(data['mountains_geo']),
+            'mountain_ranges': len(data['mountain_ranges']),
+            'sake_rice': len(data['sake_rice']),
+        },
+        'layouts': layouts,
+    }
+
+    with run.stage('write') as stats:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write('// Precomputed label layouts - Auto-generated by precompute_label_layouts.py\n')
+            f.write('// Do not edit manually - regenerate after convert_csv_to_js.py\n\n')
+            f.write('const JAPAN_LABEL_LAYOUTS = ')
+            json.dump(output, f, ensure_ascii=False, separators=(',', ':'))
+            f.write(';\n')
+        stats['rows_in'] = stats['rows_out'] = counts['layouts']
+
+    print(f"✓ Created {os.path.basename(args.output)}: {counts['layouts']} layouts, "
+          f"{counts['labels']} labels over {len(bands)} zoom bands and {len(prefectures)} prefecture filters")
+    if counts['overlaps'] or counts['outside']:
+        print(f"✗ {counts['overlaps']} overlapping and {counts['outside']} out-of-view labels")
+    else:
+        print("✓ No overlapping or out-of-view labels")
+
+    if args.run_report or args.profile_dir:
+        run.print_summary()
+    run.write(args.run_report)
+
+    if args.check and (counts['overlaps'] or counts['outside']):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""
+Local HTTP/JSON query service over the canonical datasets.
+
+The CSVs are loaded once through their schemas (as convert_csv_to_js.py
+does) and indexed in memory:
+- an R-tree per map layer over the feature bounding boxes
+  (scripts/spatial_index.py), for bbox, point and nearest queries
+- prefecture code -> rows per layer, from the entity index
+  (scripts/entity_ids.py), for "which rivers flow through Gifu?"
+- a trie over the English and Japanese names of every feature, folded
+  and split into keys as in the page's name search (scripts/name_search.py),
+  for prefix search
+
+Metadata rows with no geometry row (rivers.csv lists rivers that
+rivers_geo_final.csv has no line for) are indexed too, so /prefecture,
+/attribute, /search and /feature cover the whole dataset; only the
+spatial queries skip them.
+
+Sake rice has no geometry of its own; spatial queries place each variety
+in the prefectures it is grown in, so "sake rice within 50 km of Mt. Fuji"
+is the varieties of the prefectures within 50 km.
+
+Requests are served by one asyncio event loop with keep-alive
+connections. Responses are cached by normalised URL (least recently used
+first out, --cache-size entries); add nocache=1 to bypass the cache.
+
+Endpoints (GET; every result has layer, id, name, japanese_name,
+prefectures, plus distance_km for distance queries; full=1 adds all
+attributes and geometry=1 the (lat, lon) parts):
+    /layers                                       layers, kinds and row counts
+    /bbox?bbox=min_lat,min_lon,max_lat,max_lon[&layer=]
+    /point?lat=&lon=[&km=0][&layer=]              features at (within km of) a point
+    /nearest?layer=&lat=&lon=[&k=5][&km=]         k nearest, optionally within km
+    /prefecture?prefecture=Gifu[&layer=]          features in a prefecture (any spelling)
+    /attribute?layer=&field=[&value=][&min=][&max=][&contains=]
+    /search?q=[&layer=][&limit=10]                name prefix search (English or Japanese)
+    /feature?layer=&id=                           one feature by row index
+    /stats                                        request and cache counters
+
+Usage (from the data/ directory):
+    python3 query_server.py [--host 127.0.0.1] [--port 8765] [--cache-size 1024]
+    curl 'http://127.0.0.1:8765/prefecture?prefecture=Gifu&layer=rivers'
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from convert_csv_to_js import entity_index, files, read_csv  # noqa: E402
+from csv_schema import check_all_references, format_violation  # noqa: E402
+from geometry_store import parse_coordinates  # noqa: E402
+from name_search import query_key, search_keys  # noqa: E402
+from pipeline_stats import RunReport, add_instrumentation_args  # noqa: E402
+from spatial_index import NameTrie, RTree, shape_distance  # noqa: E402
+
+# Layer -> (table with the features, metadata table joined to it, geometry kind)
+LAYERS = {
+    'prefectures': ('prefectures_geo', 'prefectures', 'polygon'),
+    'old_provinces': ('old_provinces_geo', 'old_provinces', 'polygon'),
+    'lakes': ('lakes_geo', 'lakes', 'polygon'),
+    'rivers': ('rivers_geo', 'rivers', 'polyline'),
+    'mountains': ('mountains_geo', 'mountains', 'point'),
+    'mountain_ranges': ('mountain_ranges', None, 'polygon'),
+    'sake_rice': ('sake_rice', None, None),
+}
+
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_SIZE = 1024
+# Largest result list returned by any query
+MAX_RESULTS = 1000
+
+
+class QueryError(Exception):
+    """A bad request; reported to the client with its HTTP status."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def feature_parts(row):
+    """(lat, lon) parts of a row: its Coordinates, or one Latitude/Longitude point."""
+    if row.get('Coordinates'):
+        return parse_coordinates(row['Coordinates'])
+    if row.get('Latitude') not in (None, '') and row.get('Longitude') not in (None, ''):
+        return [[(float(row['Latitude']), float(row['Longitude']))]]
+    return []
+
+
+def parts_box(parts):
+    points = [p for part in parts for p in part]
+    if not points:
+        return None
+    return (min(p[0] for p in points), min(p[1] for p in points),
+            max(p[0] for p in points), max(p[1] for p in points))
+
+
+class Layer:
+    """The records of one layer and its indexes."""
+
+    def __init__(self, name, kind, records):
+        self.name = name
+        self.kind = kind
+        self.records = records
+        self.by_prefecture = {}
+        for record in records:
+            for code in record['prefectures']:
+                self.by_prefecture.setdefault(code, []).append(record['id'])
+        self.tree = RTree((record['box'], record['id']) for record in records) if kind else None
+
+    def distance(self, point, record_id):
+        record = self.records[record_id]
+        return shape_distance(point, self.kind, record['parts'])
+
+
+class QueryIndex:
+    """Every layer, indexed once; the query methods return JSON-ready dicts."""
+
+    def __init__(self, all_data):
+        index, self.resolver, _ = entity_index(all_data)
+        self.index = index
+        meta_by_code = {}
+        for j, row in enumerate(all_data['prefectures']):
+            code = self.resolver.prefecture_id(row['Name'])
+            if code is not None:
+                meta_by_code.setdefault(code, j)
+
+        self.layers = {}
+        self.names = NameTrie()
+        for name, (table, meta_table, kind) in LAYERS.items():
+            meta_rows = all_data[meta_table] if meta_table else []
+            joins = index['metadata'].get(table)
+            records = []
+            joined = set()
+            for i, row in enumerate(all_data[table]):
+                if table == 'prefectures_geo':
+                    j = meta_by_code.get(int(row['ID']), -1)
+                    codes = [int(row['ID'])]
+                else:
+                    j = joins[i] if joins else -1
+                    codes = self.row_prefectures(table, i)
+                meta = meta_rows[j] if j >= 0 else {}
+                joined.add(j)
+                parts = feature_parts(row) if kind else []
+                self.add_record(name, records, row, meta, codes, parts)
+            # Metadata rows without geometry (rivers.csv lists rivers that
+            # rivers_geo_final.csv has no line for) are found by every query but
+            # the spatial ones: they have no box, so they stay out of the R-tree
+            for j, meta in enumerate(meta_rows):
+                if j not in joined:
+                    self.add_record(name, records, {}, meta, self.row_prefectures(meta_table, j), [])
+            self.layers[name] = Layer(name, kind, records)
+
+    def row_prefectures(self, table, i):
+        """Prefecture codes of row i of a table, from the entity index."""
+        if table in self.index['prefectures']:
+            return self.index['prefectures'][table][i]
+        province = self.index['provinces'].get(table, [None] * (i + 1))[i]
+        return self.resolver.province_prefectures.get(province, [])
+
+    def add_record(self, layer, records, row, meta, codes, parts):
+        """Append a feature (its row joined to its metadata) and index its names."""
+        record_id = len(records)
+        attributes = {key: value for key, value in meta.items() if value not in (None, '')}
+        attributes.update({key: value for key, value in row.items()
+                           if key != 'Coordinates' and value not in (None, '')})
+        records.append({
+            'id': record_id,
+            'name': row.get('Name') or meta.get('Name', ''),
+            'japanese_name': row.get('Japanese Name') or meta.get('Japanese Name') or '',
+            'attributes': attributes,
+            'prefectures': codes,
+            'parts': parts,
+            'box': parts_box(parts),
+        })
+        for label in {row.get('Name'), meta.get('Name')}:
+            for key in search_keys(label or '', records[-1]['japanese_name']):
+                self.names.insert(key, (layer, record_id))
+
+    # Helpers
+
+    def layer(self, params, required=True):
+        name = params.get('layer')
+        if not name:
+            if required:
+                raise QueryError('missing parameter: layer')
+            return None
+        if name not in self.layers:
+            raise QueryError(f"unknown layer '{name}' (one of {', '.join(self.layers)})", 404)
+        return self.layers[name]
+
+    def spatial_layers(self, params):
+        layer = self.layer(params, required=False)
+        return [layer] if layer else [layer for layer in self.layers.values() if layer.kind]
+
+    @staticmethod
+    def number(params, key, default=None):
+        if params.get(key) in (None, ''):
+            if default is None:
+                raise QueryError(f"missing parameter: {key}")
+            return default
+        try:
+            value = float(params[key])
+        except ValueError:
+            raise QueryError(f"{key} must be a number, not '{params[key]}'")
+        if not math.isfinite(value):
+            raise QueryError(f"{key} must be finite")
+        return value
+
+    def point(self, params):
+        return (self.number(params, 'lat'), self.number(params, 'lon'))
+
+    def result(self, layer, record_id, params, distance=None):
+        record = layer.records[record_id]
+        result = {
+            'layer': layer.name,
+            'id': record_id,
+            'name': record['name'],
+            'japanese_name': record['japanese_name'],
+            'prefectures': [self.resolver.prefecture_name(code) for code in record['prefectures']],
+        }
+        if distance is not None:
+            result['distance_km'] = round(distance, 3)
+        if params.get('full') == '1':
+            result['attributes'] = record['attributes']
+        if params.get('geometry') == '1':
+            result['parts'] = record['parts']
+        return result
+
+    def results(self, hits, params, query):
+        """hits: (layer, record id, distance or None) in result order."""
+        hits = list(hits)
+        return {
+            'query': query,
+            'count': len(hits),
+            'truncated': len(hits) > MAX_RESULTS,
+            'results': [self.result(layer, i, params, d) for layer, i, d in hits[:MAX_RESULTS]],
+        }
+
+    def within(self, layer, point, k, max_km):
+        """(distance, id) of a layer's nearest features; sake rice goes by its prefectures."""
+        if layer.kind:
+            return layer.tree.nearest(point, lambda i: layer.distance(point, i), k, max_km)
+        prefectures = self.layers['prefectures']
+        nearest = {}
+        for distance, i in prefectures.tree.iter_nearest(point, lambda i: prefectures.distance(point, i), max_km):
+            for row in layer.by_prefecture.get(prefectures.records[i]['prefectures'][0], []):
+                nearest.setdefault(row, distance)
+            if k is not None and len(nearest) >= k:
+                break
+        ranked = sorted((distance, row) for row, distance in nearest.items())
+        return ranked if k is None else ranked[:k]
+
+    # Queries
+
+    def q_layers(self, params):
+        return {'layers': {name: {'kind': layer.kind, 'count': len(layer.records),
+                                  'prefectures': len(layer.by_prefecture)}
+                           for name, layer in self.layers.items()}}
+
+    def q_bbox(self, params):
+        try:
+            box = tuple(float(v) for v in (params.get('bbox') or '').split(','))
+        except ValueError:
+            box = ()
+        if len(box) != 4:
+            raise QueryError('bbox must be min_lat,min_lon,max_lat,max_lon')
+        hits = [(layer, i, None) for layer in self.spatial_layers(params) for i in sorted(layer.tree.search(box))]
+        return self.results(hits, params, {'bbox': box})
+
+    def q_point(self, params):
+        point = self.point(params)
+        km = self.number(params, 'km', 0.0)
+        hits = [(layer, i, d) for layer in self.spatial_layers(params)
+                for d, i in self.within(layer, point, None, km)]
+        return self.results(hits, params, {'lat': point[0], 'lon': point[1], 'km': km})
+
+    def q_nearest(self, params):
+        layer = self.layer(params)
+        point = self.point(params)
+        k = int(self.number(params, 'k', 5))
+        km = self.number(params, 'km', math.inf)
+        if k < 1:
+            raise QueryError('k must be at least 1')
+        hits = [(layer, i, d) for d, i in self.within(layer, point, min(k, MAX_RESULTS), km)]
+        return self.results(hits, params, {'lat': point[0], 'lon': point[1], 'k': k,
+                                           'km': None if km == math.inf else km})
+
+    def q_prefecture(self, params):
+        name = params.get('prefecture')
+        if not name:
+            raise QueryError('missing parameter: prefecture')
+        code = self.resolver.prefecture_id(name)
+        if code is None:
+            raise QueryError(f"unknown prefecture '{name}'", 404)
+        layer = self.layer(params, required=False)
+        layers = [layer] if layer else list(self.layers.values())
+        hits = [(layer, i, None) for layer in layers for i in layer.by_prefecture.get(code, [])]
+        return self.results(hits, params, {'prefecture': self.resolver.prefecture_name(code), 'code': code})
+
+    def q_attribute(self, params):
+        layer = self.layer(params)
+        field = params.get('field')
+        if not field:
+            raise QueryError('missing parameter: field')
+        value, contains = params.get('value'), params.get('contains')
+        low = self.number(params, 'min', -math.inf)
+        high = self.number(params, 'max', math.inf)
+
+        def matches(record):
+            current = record['attributes'].get(field)
+            if current is None:
+                return False
+            if value is not None and str(current) != value:
+                return False
+            if contains is not None and contains.lower() not in str(current).lower():
+                return False
+            if low != -math.inf or high != math.inf:
+                return isinstance(current, (int, float)) and low <= current <= high
+            return True
+
+        hits = [(layer, record['id'], None) for record in layer.records if matches(record)]
+        return self.results(hits, params, {'layer': layer.name, 'field': field, 'value': value,
+                                           'contains': contains,
+                                           'min': None if low == -math.inf else low,
+                                           'max': None if high == math.inf else high})
+
+    def q_search(self, params):
+        prefix, _ = query_key(params.get('q') or '')
+        if not prefix:
+            raise QueryError('missing parameter: q')
+        limit = min(int(self.number(params, 'limit', 10)), MAX_RESULTS)
+        layer = self.layer(params, required=False)
+        matches = self.names.prefix(prefix, None if layer else limit)
+        hits = [(self.layers[name], i, None) for name, i in matches if not layer or name == layer.name]
+        return self.results(hits[:limit], params, {'q': params['q'], 'limit': limit})
+
+    def q_feature(self, params):
+        layer = self.layer(params)
+        record_id = int(self.number(params, 'id'))
+        if not 0 <= record_id < len(layer.records):
+            raise QueryError(f"no {layer.name} feature {record_id}", 404)
+        return self.result(layer, record_id, dict(params, full='1'))
+
+
+class ResponseCache:
+    """Encoded responses by normalised URL, least recently used dropped first."""
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        body = self.entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, key, body):
+        if self.size <= 0:
+            return
+        self.entries[key] = body
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+
+class QueryServer:
+    """Routes HTTP requests to QueryIndex methods over asyncio streams."""
+
+    REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               500: 'Internal Server Error'}
+
+    def __init__(self, index, cache_size=DEFAULT_CACHE_SIZE):
+        self.index = index
+        self.cache = ResponseCache(cache_size)
+        self.requests = 0
+        self.started = time.time()
+        self.routes = {name[2:]: getattr(index, name) for name in dir(index) if name.startswith('q_')}
+
+    def respond(self, target):
+        """(status, JSON body bytes) for a request target such as '/search?q=fuji'."""
+        url = urlsplit(target)
+        route = url.path.strip('/')
+        params = dict(parse_qsl(url.query))
+        if route == 'stats':
+            return 200, self.encode(self.stats())
+        nocache = params.pop('nocache', None) == '1'
+        key = route + '?' + '&'.join(f"{k}={v}" for k, v in sorted(params.items()))
+        body = None if nocache else self.cache.get(key)
+        if body is not None:
+            return 200, body
+        handler = self.routes.get(route)
+        if handler is None:
+            return 404, self.encode({'error': f"unknown endpoint '/{route}'", 'endpoints': sorted(self.routes) + ['stats']})
+        try:
+            body = self.encode(handler(params))
+        except QueryError as e:
+            return e.status, self.encode({'error': str(e)})
+        if not nocache:
+            self.cache.put(key, body)
+        return 200, body
+
+    @staticmethod
+    def encode(payload):
+        return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'uptime_s': round(time.time() - self.started, 1),
+            'cache': {'entries': len(self.cache.entries), 'size': self.cache.size,
+                      'hits': self.cache.hits, 'misses': self.cache.misses},
+        }
+
+    async def handle(self, reader, writer):
+        """Serve one connection: HTTP/1.1 keep-alive, GET/HEAD only."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                parts = request_line.decode('latin-1').split()
+                if len(parts) != 3:
+                    break
+                method, target, version = parts
+                self.requests += 1
+                if method not in ('GET', 'HEAD'):
+                    status, body = 405, self.encode({'error': 'only GET is supported'})
+                else:
+                    try:
+                        status, body = self.respond(target)
+                    except Exception as e:  # keep serving after a bug in one query
+                        print(f"✗ {target}: {e!r}")
+                        status, body = 500, self.encode({'error': repr(e)})
+                keep_alive = (headers.get('connection', '').lower() != 'close' and
+                              (version == 'HTTP/1.1' or headers.get('connection', '').lower() == 'keep-alive'))
+                head = (f"HTTP/1.1 {status} {self.REASONS.get(status, '')}\r\n"
+                        f"Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        f"Access-Control-Allow-Origin: *\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode('latin-1')
+                # One write per response: separate small writes stall on delayed ACKs
+                writer.write(head if method == 'HEAD' else head + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def load_index(run):
+    """Load, validate and index every table; None if a table fails its schema."""
+    all_data = {}
+    lines = {}
+    violations = []
+    with run.stage('load') as stats:
+        for key, filename in files.items():
+            all_data[key], lines[filename], table_violations = read_csv(filename)
+            violations += table_violations
+        tables = {filename: all_data[key] for key, filename in files.items()}
+        violations += check_all_references(tables, lines, violations)
+        stats['rows_in'] = stats['rows_out'] = sum(len(rows) for rows in all_data.values())
+    if violations:
+        for violation in violations:
+            print(f"✗ {format_violation(violation)}")
+        print(f"\n✗ {len(violations)} schema violation(s) - fix the CSVs before serving them")
+        return None
+
+    with run.stage('index') as stats:
+        index = QueryIndex(all_data)
+        stats['rows_in'] = sum(len(rows) for rows in all_data.values())
+        stats['rows_out'] = sum(len(layer.records) for layer in index.layers.values())
+        stats['vertices_in'] = stats['vertices_out'] = sum(
+            len(part) for layer in index.layers.values() for record in layer.records for part in record['parts'])
+    print(f"✓ Indexed {stats['rows_out']} features in {len(index.layers)} layers, "
+          f"{index.names.keys} names")
+    return index
+
+
+async def serve(index, host, port, cache_size):
+    server = QueryServer(index, cache_size)
+    listener = await asyncio.start_server(server.handle, host, port)
+    print(f"✓ Serving on http://{host}:{port}/ (cache {cache_size} responses) - Ctrl+C to stop")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve bbox, point, nearest, attribute and name queries as JSON')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port (default {DEFAULT_PORT})')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f'Responses kept in the cache (default {DEFAULT_CACHE_SIZE}, 0 disables it)')
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    run = RunReport.from_args('query_server', args)
+
+    index = load_index(run)
+    if args.run_report or args.profile_dir:
+        run.print_summary()
+    run.write(args.run_report)
+    if index is None:
+        return 1
+    try:
+        asyncio.run(serve(index, args.host, args.port, args.cache_size))
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,4 @@
+// Precomputed label layouts - Auto-generated by precompute_label_layouts.py
+// Do not edit manually - regenerate after convert_csv_to_js.py
+
+const JAPAN_LABEL_LAYOUTS = {"spacing":35,"maxDisplacement":6,"bands":[0.5,0.5917159763313609,0.7692307692307692,1,1.3,1.6900000000000002,2.1970000000000005,2.856100000000001,3.7129300000000014,4.826809000000002,5],"counts":{"rivers":36,"lakes":6,"mountains":62,"mountain_ranges":14,"sake_rice":97},"layouts":{"river|0.500000||":{"n":36,"p":[[3,136.0,140.0],[2,136.0,210.0],[15,136.0,490.0],[28,136.0,595.0],[4,136.0,630.0],[6,136.0,665.0],[8,136.0,700.0],[5,136.0,735.0],[0,136.0,770.0],[10,136.0,805.0],[12,136.0,840.0],[1,136.0,875.0],[14,136.0,910.0],[7,136.0,945.0],[9,136.0,980.0],[11,136.0,1015.0],[18,136.0,1050.0],[34,136.0,1085.0],[30,136.0,1120.0],[17,136.0,1155.0],[13,136.0,1190.0],[29,136.0,1225.0],[19,136.0,1260.0]]},"river|0.591716||":{"n":36,"p":[[3,83.92,140.0],[2,83.92,210.0],[15,83.92,490.0],[28,83.92,595.0],[4,83.92,630.0],[6,83.92,665.0],[8,83.92,700.0],[5,83.92,735.0],[0,83.92,770.0],[10,83.92,805.0],[12,83.92,840.0],[1,83.92,875.0],[14,83.92,910.0],[7,83.92,945.0],[9,83.92,980.0],[11,83.92,1015.0],[18,83.92,1050.0],[34,83.92,1085.0],[30,83.92,1120.0],[17,83.92,1155.0],[13,83.92,1190.0],[29,83.92,1225.0],[19,83.92,1260.0]]},"river|0.769231||":{"n":36,"p":[[15,18.4,490.0],[28,18.4,595.0],[6,18.4,630.0],[8,18.4,665.0],[5,18.4,700.0],[0,18.4,735.0],[10,18.4,770.0],[12,18.4,805.0],[1,18.4,840.0],[16,18.4,875.0],[14,18.4,910.0],[7,18.4,945.0],[9,18.4,980.0],[11,18.4,1015.0],[18,18.4,1050.0],[34,18.4,1085.0],[30,18.4,1120.0],[17,18.4,1155.0],[13,18.4,1190.0],[29,18.4,1225.0],[19,18.4,1260.0],[3,1401.6,140.0],[2,1401.6,210.0],[4,1401.6,630.0]]},"river|1.000000||":{"n":36,"p":[[23,-32.0,805.0],[32,-32.0,840.0],[18,-32.0,875.0],[25,-32.0,910.0],[26,-32.0,945.0],[22,-32.0,980.0],[27,-32.0,1015.0],[34,-32.0,1050.0],[30,-32.0,1085.0],[17,-32.0,1120.0],[13,-32.0,1155.0],[29,-32.0,1190.0],[19,-32.0,1225.0],[3,1032.0,140.0],[2,1032.0,210.0],[15,1032.0,490.0],[28,1032.0,595.0],[4,1032.0,630.0],[6,1032.0,665.0],[8,1032.0,700.0],[5,1032.0,735.0],[0,1032.0,770.0],[10,1032.0,805.0],[12,1032.0,840.0],[1,1032.0,875.0],[16,1032.0,910.0],[14,1032.0,945.0],[7,1032.0,980.0],[20,1032.0,1015.0],[9,1032.0,1050.0],[11,1032.0,1085.0],[24,1032.0,1120.0],[35,1032.0,1155.0]]},"river|1.300000||":{"n":31,"p":[[3,747.692,140.0],[2,747.692,210.0],[15,747.692,490.0],[28,747.692,595.0],[4,747.692,630.0],[6,747.692,665.0],[8,747.692,700.0],[5,747.692,735.0],[0,747.692,770.0],[10,747.692,805.0],[12,747.692,840.0],[1,747.692,875.0],[14,747.692,910.0],[7,747.692,945.0],[9,747.692,980.0],[11,747.692,1015.0],[34,747.692,1050.0]]},"river|1.690000||":{"n":4,"p":[[0,528.994,700.0],[33,528.994,735.0],[1,528.994,770.0],[31,528.994,805.0]]},"river|2.197000||":{"n":0,"p":[]},"river|2.856100||":{"n":0,"p":[]},"river|3.712930||":{"n":0,"p":[]},"river|4.826809||":{"n":0,"p":[]},"river|5.000000||":{"n":0,"p":[]},"river|1.000000|Kyoto|":{"n":3,"p":[[25,-32.0,910.0],[26,-32.0,945.0],[27,-32.0,980.0]]},"river|1.000000|Saga|":{"n":1,"p":[[13,-32.0,1120.0]]},"river|1.000000|Kumamoto|":{"n":3,"p":[[13,-32.0,1120.0],[29,-32.0,1155.0],[19,-32.0,1190.0]]},"river|1.000000|Kagawa|":{"n":0,"p":[]},"river|1.000000|Aichi|":{"n":1,"p":[[7,1032.0,910.0]]},"river|1.000000|Tochigi|":{"n":2,"p":[[10,1032.0,805.0],[21,1032.0,840.0]]},"river|1.000000|Yamanashi|":{"n":0,"p":[]},"river|1.000000|Shiga|":{"n":0,"p":[]},"river|1.000000|Gunma|":{"n":0,"p":[]},"river|1.000000|Miyagi|":{"n":2,"p":[[4,1032.0,630.0],[5,1032.0,735.0]]},"river|1.000000|Shizuoka|":{"n":4,"p":[[9,1032.0,910.0],[11,1032.0,945.0],[24,1032.0,980.0],[35,1032.0,1015.0]]},"river|1.000000|Ibaraki|":{"n":2,"p":[[12,1032.0,805.0],[16,1032.0,840.0]]},"river|1.000000|Okinawa|":{"n":0,"p":[]},"river|1.000000|Yamagata|":{"n":1,"p":[[6,1032.0,665.0]]},"river|1.000000|Wakayama|":{"n":1,"p":[[34,-32.0,1050.0]]},"river|1.000000|Nagasaki|":{"n":0,"p":[]},"river|1.000000|Akita|":{"n":2,"p":[[15,1032.0,490.0],[28,1032.0,595.0]]},"river|1.000000|Okayama|":{"n":0,"p":[]},"river|1.000000|Fukuoka|":{"n":1,"p":[[13,-32.0,1120.0]]},"river|1.000000|Gifu|":{"n":1,"p":[[18,-32.0,945.0]]},"river|1.000000|Aomori|":{"n":0,"p":[]},"river|1.000000|Osaka|":{"n":1,"p":[[22,-32.0,980.0]]},"river|1.000000|Nagano|":{"n":0,"p":[]},"river|1.000000|Oita|":{"n":1,"p":[[13,-32.0,1120.0]]},"river|1.000000|Mie|":{"n":0,"p":[]},"river|1.000000|Hiroshima|":{"n":0,"p":[]},"river|1.000000|Hokkaido|":{"n":2,"p":[[3,1032.0,140.0],[2,1032.0,210.0]]},"river|1.000000|Hyogo|":{"n":0,"p":[]},"river|1.000000|Chiba|":{"n":1,"p":[[1,1032.0,805.0]]},"river|1.000000|Toyama|":{"n":2,"p":[[33,1032.0,805.0],[31,1032.0,840.0]]},"river|1.000000|Tokyo|":{"n":1,"p":[[14,1032.0,875.0]]},"river|1.000000|Saitama|":{"n":0,"p":[]},"river|1.000000|Yamaguchi|":{"n":0,"p":[]},"river|1.000000|Fukushima|":{"n":0,"p":[]},"river|1.000000|Ishikawa|":{"n":1,"p":[[23,-32.0,840.0]]},"river|1.000000|Fukui|":{"n":1,"p":[[32,-32.0,875.0]]},"river|1.000000|Ehime|":{"n":0,"p":[]},"river|1.000000|Nara|":{"n":0,"p":[]},"river|1.000000|Shimane|":{"n":0,"p":[]},"river|1.000000|Iwate|":{"n":0,"p":[]},"river|1.000000|Tottori|":{"n":0,"p":[]},"river|1.000000|Tokushima|":{"n":0,"p":[]},"river|1.000000|Kagoshima|":{"n":0,"p":[]},"river|1.000000|Niigata|":{"n":2,"p":[[8,1032.0,735.0],[0,1032.0,805.0]]},"river|1.000000|Kochi|":{"n":2,"p":[[30,-32.0,1050.0],[17,-32.0,1085.0]]},"river|1.000000|Miyazaki|":{"n":0,"p":[]},"river|1.000000|Kanagawa|":{"n":1,"p":[[20,1032.0,910.0]]},"lake|0.500000||":{"n":6,"p":[[3,136.0,490.0],[1,136.0,735.0],[2,136.0,805.0],[5,136.0,875.0],[4,136.0,910.0],[0,136.0,945.0]]},"lake|0.591716||":{"n":6,"p":[[3,83.92,490.0],[1,83.92,735.0],[2,83.92,805.0],[5,83.92,875.0],[4,83.92,910.0],[0,83.92,945.0]]},"lake|0.769231||":{"n":6,"p":[[1,18.4,735.0],[2,18.4,805.0],[5,18.4,875.0],[4,18.4,910.0],[0,18.4,945.0],[3,1401.6,490.0]]},"lake|1.000000||":{"n":6,"p":[[5,-32.0,875.0],[4,-32.0,910.0],[0,-32.0,945.0],[3,1032.0,490.0],[1,1032.0,735.0],[2,1032.0,805.0]]},"lake|1.300000||":{"n":6,"p":[[5,-70.769,910.0],[4,-70.769,945.0],[3,747.692,490.0],[1,747.692,735.0],[2,747.692,805.0],[0,747.692,910.0]]},"lake|1.690000||":{"n":0,"p":[]},"lake|2.197000||":{"n":0,"p":[]},"lake|2.856100||":{"n":0,"p":[]},"lake|3.712930||":{"n":0,"p":[]},"lake|4.826809||":{"n":0,"p":[]},"lake|5.000000||":{"n":0,"p":[]},"lake|1.000000|Kyoto|":{"n":0,"p":[]},"lake|1.000000|Saga|":{"n":0,"p":[]},"lake|1.000000|Kumamoto|":{"n":0,"p":[]},"lake|1.000000|Kagawa|":{"n":0,"p":[]},"lake|1.000000|Aichi|":{"n":0,"p":[]},"lake|1.000000|Tochigi|":{"n":1,"p":[[2,1032.0,805.0]]},"lake|1.000000|Yamanashi|":{"n":0,"p":[]},"lake|1.000000|Shiga|":{"n":1,"p":[[0,-32.0,910.0]]},"lake|1.000000|Gunma|":{"n":0,"p":[]},"lake|1.000000|Miyagi|":{"n":0,"p":[]},"lake|1.000000|Shizuoka|":{"n":0,"p":[]},"lake|1.000000|Ibaraki|":{"n":0,"p":[]},"lake|1.000000|Okinawa|":{"n":0,"p":[]},"lake|1.000000|Yamagata|":{"n":0,"p":[]},"lake|1.000000|Wakayama|":{"n":0,"p":[]},"lake|1.000000|Nagasaki|":{"n":0,"p":[]},"lake|1.000000|Akita|":{"n":1,"p":[[3,1032.0,490.0]]},"lake|1.000000|Okayama|":{"n":0,"p":[]},"lake|1.000000|Fukuoka|":{"n":0,"p":[]},"lake|1.000000|Gifu|":{"n":0,"p":[]},"lake|1.000000|Aomori|":{"n":1,"p":[[3,1032.0,490.0]]},"lake|1.000000|Osaka|":{"n":0,"p":[]},"lake|1.000000|Nagano|":{"n":0,"p":[]},"lake|1.000000|Oita|":{"n":0,"p":[]},"lake|1.000000|Mie|":{"n":0,"p":[]},"lake|1.000000|Hiroshima|":{"n":0,"p":[]},"lake|1.000000|Hokkaido|":{"n":0,"p":[]},"lake|1.000000|Hyogo|":{"n":0,"p":[]},"lake|1.000000|Chiba|":{"n":0,"p":[]},"lake|1.000000|Toyama|":{"n":0,"p":[]},"lake|1.000000|Tokyo|":{"n":0,"p":[]},"lake|1.000000|Saitama|":{"n":0,"p":[]},"lake|1.000000|Yamaguchi|":{"n":0,"p":[]},"lake|1.000000|Fukushima|":{"n":1,"p":[[1,1032.0,735.0]]},"lake|1.000000|Ishikawa|":{"n":0,"p":[]},"lake|1.000000|Fukui|":{"n":0,"p":[]},"lake|1.000000|Ehime|":{"n":0,"p":[]},"lake|1.000000|Nara|":{"n":0,"p":[]},"lake|1.000000|Shimane|":{"n":2,"p":[[5,-32.0,910.0],[4,-32.0,945.0]]},"lake|1.000000|Iwate|":{"n":0,"p":[]},"lake|1.000000|Tottori|":{"n":1,"p":[[5,-32.0,910.0]]},"lake|1.000000|Tokushima|":{"n":0,"p":[]},"lake|1.000000|Kagoshima|":{"n":0,"p":[]},"lake|1.000000|Niigata|":{"n":0,"p":[]},"lake|1.000000|Kochi|":{"n":0,"p":[]},"lake|1.000000|Miyazaki|":{"n":0,"p":[]},"lake|1.000000|Kanagawa|":{"n":0,"p":[]},"mountain|0.500000||":{"n":61,"p":[[18,136.0,175.0],[37,136.0,210.0],[5,136.0,350.0],[56,136.0,385.0],[51,136.0,420.0],[57,136.0,455.0],[3,136.0,490.0],[16,136.0,525.0],[52,136.0,560.0],[33,136.0,595.0],[38,136.0,630.0],[28,136.0,665.0],[48,136.0,700.0],[30,136.0,735.0],[11,136.0,770.0],[25,136.0,805.0],[24,136.0,840.0],[26,136.0,875.0],[10,136.0,910.0],[17,136.0,945.0],[23,136.0,980.0],[12,136.0,1015.0],[49,136.0,1050.0],[42,136.0,1085.0],[21,136.0,1120.0],[47,136.0,1155.0],[39,136.0,1190.0],[9,136.0,1225.0],[55,136.0,1260.0],[19,136.0,1295.0],[34,136.0,1330.0]]},"mountain|0.591716||":{"n":61,"p":[[18,83.92,175.0],[37,83.92,210.0],[5,83.92,350.0],[56,83.92,385.0],[51,83.92,420.0],[57,83.92,455.0],[3,83.92,490.0],[16,83.92,525.0],[52,83.92,560.0],[33,83.92,595.0],[38,83.92,630.0],[28,83.92,665.0],[48,83.92,700.0],[30,83.92,735.0],[11,83.92,770.0],[25,83.92,805.0],[24,83.92,840.0],[26,83.92,875.0],[10,83.92,910.0],[17,83.92,945.0],[23,83.92,980.0],[12,83.92,1015.0],[49,83.92,1050.0],[42,83.92,1085.0],[21,83.92,1120.0],[47,83.92,1155.0],[39,83.92,1190.0],[9,83.92,1225.0],[55,83.92,1260.0],[19,83.92,1295.0],[34,83.92,1330.0]]},"mountain|0.769231||":{"n":61,"p":[[56,18.4,420.0],[51,18.4,455.0],[3,18.4,490.0],[52,18.4,525.0],[46,18.4,560.0],[33,18.4,595.0],[38,18.4,630.0],[28,18.4,665.0],[48,18.4,700.0],[30,18.4,735.0],[11,18.4,770.0],[25,18.4,805.0],[24,18.4,840.0],[26,18.4,875.0],[10,18.4,910.0],[17,18.4,945.0],[23,18.4,980.0],[12,18.4,1015.0],[49,18.4,1050.0],[42,18.4,1085.0],[21,18.4,1120.0],[47,18.4,1155.0],[39,18.4,1190.0],[9,18.4,1225.0],[55,18.4,1260.0],[19,18.4,1295.0],[34,18.4,1330.0],[18,1401.6,175.0],[37,1401.6,210.0],[5,1401.6,455.0],[57,1401.6,560.0],[16,1401.6,630.0]]},"mountain|1.000000||":{"n":61,"p":[[22,-32.0,770.0],[7,-32.0,805.0],[20,-32.0,840.0],[61,-32.0,875.0],[8,-32.0,910.0],[14,-32.0,945.0],[54,-32.0,980.0],[47,-32.0,1015.0],[53,-32.0,1050.0],[39,-32.0,1085.0],[9,-32.0,1120.0],[55,-32.0,1155.0],[36,-32.0,1190.0],[45,-32.0,1225.0],[19,-32.0,1260.0],[34,-32.0,1295.0],[18,1032.0,175.0],[37,1032.0,210.0],[5,1032.0,350.0],[56,1032.0,385.0],[51,1032.0,420.0],[57,1032.0,455.0],[3,1032.0,490.0],[16,1032.0,525.0],[52,1032.0,560.0],[33,1032.0,595.0],[38,1032.0,630.0],[28,1032.0,665.0],[48,1032.0,700.0],[30,1032.0,735.0],[11,1032.0,770.0],[25,1032.0,805.0],[24,1032.0,840.0],[26,1032.0,875.0],[10,1032.0,910.0],[17,1032.0,945.0],[23,1032.0,980.0],[12,1032.0,1015.0],[49,1032.0,1050.0],[42,1032.0,1085.0],[21,1032.0,1120.0]]},"mountain|1.300000||":{"n":57,"p":[[20,-70.769,945.0],[9,-70.769,1015.0],[55,-70.769,1050.0],[18,747.692,175.0],[37,747.692,210.0],[5,747.692,350.0],[56,747.692,385.0],[51,747.692,420.0],[57,747.692,455.0],[3,747.692,490.0],[16,747.692,525.0],[52,747.692,560.0],[33,747.692,595.0],[38,747.692,630.0],[28,747.692,665.0],[48,747.692,700.0],[30,747.692,735.0],[11,747.692,770.0],[25,747.692,805.0],[24,747.692,840.0],[26,747.692,875.0],[17,747.692,910.0],[23,747.692,945.0],[12,747.692,980.0],[42,747.692,1015.0],[21,747.692,1050.0]]},"mountain|1.690000||":{"n":4,"p":[[32,528.994,700.0],[38,528.994,735.0],[28,528.994,770.0],[1,528.994,805.0]]},"mountain|2.197000||":{"n":0,"p":[]},"mountain|2.856100||":{"n":0,"p":[]},"mountain|3.712930||":{"n":0,"p":[]},"mountain|4.826809||":{"n":0,"p":[]},"mountain|5.000000||":{"n":0,"p":[]},"mountain|1.000000|Kyoto|":{"n":0,"p":[]},"mountain|1.000000|Saga|":{"n":1,"p":[[36,-32.0,1085.0]]},"mountain|1.000000|Kumamoto|":{"n":1,"p":[[19,-32.0,1155.0]]},"mountain|1.000000|Kagawa|":{"n":0,"p":[]},"mountain|1.000000|Aichi|":{"n":0,"p":[]},"mountain|1.000000|Tochigi|":{"n":1,"p":[[33,1032.0,805.0]]},"mountain|1.000000|Yamanashi|":{"n":11,"p":[[40,1032.0,735.0],[59,1032.0,770.0],[13,1032.0,805.0],[15,1032.0,840.0],[10,1032.0,875.0],[17,1032.0,910.0],[23,1032.0,945.0],[12,1032.0,980.0],[49,1032.0,1015.0],[43,1032.0,1050.0],[60,1032.0,1085.0]]},"mountain|1.000000|Shiga|":{"n":2,"p":[[7,-32.0,910.0],[61,-32.0,945.0]]},"mountain|1.000000|Gunma|":{"n":3,"p":[[1,1032.0,805.0],[6,1032.0,840.0],[31,1032.0,875.0]]},"mountain|1.000000|Miyagi|":{"n":4,"p":[[51,1032.0,560.0],[57,1032.0,595.0],[16,1032.0,630.0],[41,1032.0,700.0]]},"mountain|1.000000|Shizuoka|":{"n":3,"p":[[49,1032.0,875.0],[42,1032.0,910.0],[21,1032.0,945.0]]},"mountain|1.000000|Ibaraki|":{"n":1,"p":[[29,1032.0,840.0]]},"mountain|1.000000|Okinawa|":{"n":0,"p":[]},"mountain|1.000000|Yamagata|":{"n":5,"p":[[51,1032.0,560.0],[3,1032.0,595.0],[52,1032.0,630.0],[46,1032.0,665.0],[41,1032.0,700.0]]},"mountain|1.000000|Wakayama|":{"n":1,"p":[[53,-32.0,1050.0]]},"mountain|1.000000|Nagasaki|":{"n":0,"p":[]},"mountain|1.000000|Akita|":{"n":4,"p":[[56,1032.0,490.0],[51,1032.0,560.0],[3,1032.0,595.0],[16,1032.0,630.0]]},"mountain|1.000000|Okayama|":{"n":0,"p":[]},"mountain|1.000000|Fukuoka|":{"n":1,"p":[[36,-32.0,1085.0]]},"mountain|1.000000|Gifu|":{"n":4,"p":[[7,-32.0,910.0],[48,1032.0,805.0],[4,1032.0,840.0],[11,1032.0,875.0]]},"mountain|1.000000|Aomori|":{"n":3,"p":[[5,1032.0,455.0],[56,1032.0,490.0],[51,1032.0,560.0]]},"mountain|1.000000|Osaka|":{"n":3,"p":[[35,-32.0,945.0],[8,-32.0,980.0],[14,-32.0,1015.0]]},"mountain|1.000000|Nagano|":{"n":15,"p":[[48,1032.0,665.0],[30,1032.0,700.0],[4,1032.0,735.0],[11,1032.0,770.0],[25,1032.0,805.0],[24,1032.0,840.0],[40,1032.0,875.0],[59,1032.0,910.0],[26,1032.0,945.0],[50,1032.0,980.0],[10,1032.0,1015.0],[49,1032.0,1050.0],[42,1032.0,1085.0],[43,1032.0,1120.0]]},"mountain|1.000000|Oita|":{"n":1,"p":[[45,-32.0,1120.0]]},"mountain|1.000000|Mie|":{"n":2,"p":[[61,-32.0,945.0],[53,-32.0,1050.0]]},"mountain|1.000000|Hiroshima|":{"n":0,"p":[]},"mountain|1.000000|Hokkaido|":{"n":2,"p":[[18,1032.0,175.0],[37,1032.0,210.0]]},"mountain|1.000000|Hyogo|":{"n":0,"p":[]},"mountain|1.000000|Chiba|":{"n":0,"p":[]},"mountain|1.000000|Toyama|":{"n":3,"p":[[38,1032.0,805.0],[28,1032.0,840.0],[48,1032.0,875.0]]},"mountain|1.000000|Tokyo|":{"n":2,"p":[[15,1032.0,875.0],[27,1032.0,910.0]]},"mountain|1.000000|Saitama|":{"n":2,"p":[[13,1032.0,875.0],[15,1032.0,910.0]]},"mountain|1.000000|Yamaguchi|":{"n":0,"p":[]},"mountain|1.000000|Fukushima|":{"n":3,"p":[[51,1032.0,560.0],[0,1032.0,700.0],[2,1032.0,735.0]]},"mountain|1.000000|Ishikawa|":{"n":1,"p":[[22,-32.0,875.0]]},"mountain|1.000000|Fukui|":{"n":0,"p":[]},"mountain|1.000000|Ehime|":{"n":2,"p":[[9,-32.0,1050.0],[55,-32.0,1085.0]]},"mountain|1.000000|Nara|":{"n":5,"p":[[8,-32.0,945.0],[14,-32.0,980.0],[54,-32.0,1015.0],[47,-32.0,1050.0],[53,-32.0,1085.0]]},"mountain|1.000000|Shimane|":{"n":0,"p":[]},"mountain|1.000000|Iwate|":{"n":3,"p":[[51,1032.0,560.0],[57,1032.0,595.0],[16,1032.0,630.0]]},"mountain|1.000000|Tottori|":{"n":1,"p":[[20,-32.0,945.0]]},"mountain|1.000000|Tokushima|":{"n":2,"p":[[39,-32.0,1050.0],[55,-32.0,1085.0]]},"mountain|1.000000|Kagoshima|":{"n":1,"p":[[34,-32.0,1260.0]]},"mountain|1.000000|Niigata|":{"n":1,"p":[[32,1032.0,805.0]]},"mountain|1.000000|Kochi|":{"n":1,"p":[[55,-32.0,1085.0]]},"mountain|1.000000|Miyazaki|":{"n":0,"p":[]},"mountain|1.000000|Kanagawa|":{"n":1,"p":[[58,1032.0,910.0]]},"mountain-range|0.500000||":{"n":14,"p":[[13,136.0,490.0],[0,136.0,560.0],[1,136.0,595.0],[2,136.0,630.0],[3,136.0,805.0],[6,136.0,840.0],[4,136.0,875.0],[5,136.0,910.0],[8,136.0,945.0],[7,136.0,980.0],[9,136.0,1015.0],[11,136.0,1050.0],[10,136.0,1085.0],[12,136.0,1120.0]]},"mountain-range|0.591716||":{"n":14,"p":[[13,83.92,490.0],[0,83.92,560.0],[1,83.92,595.0],[2,83.92,630.0],[3,83.92,805.0],[6,83.92,840.0],[4,83.92,875.0],[5,83.92,910.0],[8,83.92,945.0],[7,83.92,980.0],[9,83.92,1015.0],[11,83.92,1050.0],[10,83.92,1085.0],[12,83.92,1120.0]]},"mountain-range|0.769231||":{"n":14,"p":[[13,18.4,490.0],[1,18.4,595.0],[2,18.4,630.0],[3,18.4,805.0],[6,18.4,840.0],[4,18.4,875.0],[5,18.4,910.0],[8,18.4,945.0],[7,18.4,980.0],[9,18.4,1015.0],[11,18.4,1050.0],[10,18.4,1085.0],[12,18.4,1120.0],[0,1401.6,595.0]]},"mountain-range|1.000000||":{"n":14,"p":[[9,-32.0,945.0],[11,-32.0,1015.0],[10,-32.0,1050.0],[12,-32.0,1085.0],[13,1032.0,490.0],[0,1032.0,560.0],[1,1032.0,595.0],[2,1032.0,630.0],[3,1032.0,840.0],[6,1032.0,875.0],[4,1032.0,910.0],[5,1032.0,945.0],[8,1032.0,980.0],[7,1032.0,1015.0]]},"mountain-range|1.300000||":{"n":14,"p":[[12,-70.769,1050.0],[13,747.692,490.0],[0,747.692,560.0],[1,747.692,595.0],[2,747.692,630.0],[3,747.692,805.0],[6,747.692,840.0],[4,747.692,875.0],[5,747.692,910.0],[8,747.692,945.0],[7,747.692,980.0],[9,747.692,1015.0],[10,747.692,1050.0]]},"mountain-range|1.690000||":{"n":0,"p":[]},"mountain-range|2.197000||":{"n":0,"p":[]},"mountain-range|2.856100||":{"n":0,"p":[]},"mountain-range|3.712930||":{"n":0,"p":[]},"mountain-range|4.826809||":{"n":0,"p":[]},"mountain-range|5.000000||":{"n":0,"p":[]},"mountain-range|1.000000|Kyoto|":{"n":0,"p":[]},"mountain-range|1.000000|Saga|":{"n":0,"p":[]},"mountain-range|1.000000|Kumamoto|":{"n":0,"p":[]},"mountain-range|1.000000|Kagawa|":{"n":0,"p":[]},"mountain-range|1.000000|Aichi|":{"n":0,"p":[]},"mountain-range|1.000000|Tochigi|":{"n":0,"p":[]},"mountain-range|1.000000|Yamanashi|":{"n":3,"p":[[6,1032.0,875.0],[5,1032.0,910.0],[8,1032.0,945.0]]},"mountain-range|1.000000|Shiga|":{"n":1,"p":[[9,-32.0,945.0]]},"mountain-range|1.000000|Gunma|":{"n":0,"p":[]},"mountain-range|1.000000|Miyagi|":{"n":2,"p":[[0,1032.0,560.0],[1,1032.0,595.0]]},"mountain-range|1.000000|Shizuoka|":{"n":1,"p":[[5,1032.0,910.0]]},"mountain-range|1.000000|Ibaraki|":{"n":0,"p":[]},"mountain-range|1.000000|Okinawa|":{"n":0,"p":[]},"mountain-range|1.000000|Yamagata|":{"n":2,"p":[[1,1032.0,595.0],[2,1032.0,630.0]]},"mountain-range|1.000000|Wakayama|":{"n":1,"p":[[10,-32.0,1050.0]]},"mountain-range|1.000000|Nagasaki|":{"n":0,"p":[]},"mountain-range|1.000000|Akita|":{"n":2,"p":[[13,1032.0,490.0],[1,1032.0,595.0]]},"mountain-range|1.000000|Okayama|":{"n":0,"p":[]},"mountain-range|1.000000|Fukuoka|":{"n":0,"p":[]},"mountain-range|1.000000|Gifu|":{"n":1,"p":[[3,1032.0,840.0]]},"mountain-range|1.000000|Aomori|":{"n":2,"p":[[13,1032.0,490.0],[1,1032.0,595.0]]},"mountain-range|1.000000|Osaka|":{"n":0,"p":[]},"mountain-range|1.000000|Nagano|":{"n":4,"p":[[3,1032.0,840.0],[6,1032.0,875.0],[4,1032.0,910.0],[5,1032.0,945.0]]},"mountain-range|1.000000|Oita|":{"n":0,"p":[]},"mountain-range|1.000000|Mie|":{"n":2,"p":[[9,-32.0,945.0],[10,-32.0,1050.0]]},"mountain-range|1.000000|Hiroshima|":{"n":0,"p":[]},"mountain-range|1.000000|Hokkaido|":{"n":0,"p":[]},"mountain-range|1.000000|Hyogo|":{"n":0,"p":[]},"mountain-range|1.000000|Chiba|":{"n":0,"p":[]},"mountain-range|1.000000|Toyama|":{"n":1,"p":[[3,1032.0,840.0]]},"mountain-range|1.000000|Tokyo|":{"n":0,"p":[]},"mountain-range|1.000000|Saitama|":{"n":0,"p":[]},"mountain-range|1.000000|Yamaguchi|":{"n":0,"p":[]},"mountain-range|1.000000|Fukushima|":{"n":1,"p":[[1,1032.0,595.0]]},"mountain-range|1.000000|Ishikawa|":{"n":0,"p":[]},"mountain-range|1.000000|Fukui|":{"n":0,"p":[]},"mountain-range|1.000000|Ehime|":{"n":1,"p":[[12,-32.0,1085.0]]},"mountain-range|1.000000|Nara|":{"n":2,"p":[[11,-32.0,1015.0],[10,-32.0,1050.0]]},"mountain-range|1.000000|Shimane|":{"n":0,"p":[]},"mountain-range|1.000000|Iwate|":{"n":2,"p":[[0,1032.0,560.0],[1,1032.0,595.0]]},"mountain-range|1.000000|Tottori|":{"n":0,"p":[]},"mountain-range|1.000000|Tokushima|":{"n":1,"p":[[12,-32.0,1085.0]]},"mountain-range|1.000000|Kagoshima|":{"n":0,"p":[]},"mountain-range|1.000000|Niigata|":{"n":0,"p":[]},"mountain-range|1.000000|Kochi|":{"n":1,"p":[[12,-32.0,1085.0]]},"mountain-range|1.000000|Miyazaki|":{"n":0,"p":[]},"mountain-range|1.000000|Kanagawa|":{"n":1,"p":[[7,1032.0,945.0]]},"sake-rice|0.500000||":{"n":97,"p":[[8,136.0,210.0],[51,136.0,245.0],[52,136.0,280.0],[11,136.0,315.0],[53,136.0,350.0],[7,136.0,385.0],[30,136.0,420.0],[71,136.0,455.0],[72,136.0,490.0],[73,136.0,525.0],[12,136.0,560.0],[13,136.0,595.0],[4,136.0,630.0],[5,136.0,665.0],[9,136.0,700.0],[1,136.0,735.0],[20,136.0,770.0],[15,136.0,805.0],[28,136.0,840.0],[21,136.0,875.0],[2,136.0,910.0],[37,136.0,945.0],[19,136.0,980.0],[34,136.0,1015.0],[10,136.0,1050.0],[0,136.0,1085.0],[3,136.0,1120.0],[6,136.0,1155.0],[40,136.0,1190.0],[31,136.0,1225.0],[50,136.0,1260.0],[69,136.0,1295.0],[70,136.0,1330.0]]},"sake-rice|0.591716||":{"n":97,"p":[[8,83.92,210.0],[51,83.92,245.0],[52,83.92,280.0],[11,83.92,315.0],[53,83.92,350.0],[7,83.92,385.0],[30,83.92,420.0],[71,83.92,455.0],[72,83.92,490.0],[73,83.92,525.0],[12,83.92,560.0],[13,83.92,595.0],[4,83.92,630.0],[5,83.92,665.0],[9,83.92,700.0],[1,83.92,735.0],[20,83.92,770.0],[15,83.92,805.0],[28,83.92,840.0],[21,83.92,875.0],[2,83.92,910.0],[37,83.92,945.0],[19,83.92,980.0],[34,83.92,1015.0],[10,83.92,1050.0],[0,83.92,1085.0],[3,83.92,1120.0],[6,83.92,1155.0],[40,83.92,1190.0],[31,83.92,1225.0],[50,83.92,1260.0],[69,83.92,1295.0],[70,83.92,1330.0]]},"sake-rice|0.769231||":{"n":97,"p":[[7,18.4,420.0],[30,18.4,455.0],[71,18.4,490.0],[72,18.4,525.0],[73,18.4,560.0],[4,18.4,595.0],[5,18.4,630.0],[9,18.4,665.0],[1,18.4,700.0],[20,18.4,735.0],[15,18.4,770.0],[28,18.4,805.0],[56,18.4,840.0],[21,18.4,875.0],[2,18.4,910.0],[37,18.4,945.0],[19,18.4,980.0],[34,18.4,1015.0],[10,18.4,1050.0],[0,18.4,1085.0],[3,18.4,1120.0],[6,18.4,1155.0],[40,18.4,1190.0],[31,18.4,1225.0],[50,18.4,1260.0],[69,18.4,1295.0],[70,18.4,1330.0],[8,1401.6,210.0],[51,1401.6,245.0],[52,1401.6,280.0],[11,1401.6,420.0],[53,1401.6,455.0],[12,1401.6,525.0],[36,1401.6,560.0],[54,1401.6,595.0],[13,1401.6,630.0],[14,1401.6,665.0]]},"sake-rice|1.000000||":{"n":97,"p":[[28,-32.0,700.0],[82,-32.0,735.0],[83,-32.0,770.0],[41,-32.0,805.0],[34,-32.0,840.0],[10,-32.0,875.0],[0,-32.0,910.0],[45,-32.0,945.0],[3,-32.0,980.0],[6,-32.0,1015.0],[26,-32.0,1050.0],[40,-32.0,1085.0],[31,-32.0,1120.0],[92,-32.0,1155.0],[93,-32.0,1190.0],[50,-32.0,1225.0],[95,-32.0,1260.0],[69,-32.0,1295.0],[70,-32.0,1330.0],[8,1032.0,210.0],[51,1032.0,245.0],[52,1032.0,280.0],[11,1032.0,315.0],[53,1032.0,350.0],[7,1032.0,385.0],[30,1032.0,420.0],[71,1032.0,455.0],[72,1032.0,490.0],[73,1032.0,525.0],[12,1032.0,560.0],[13,1032.0,595.0],[4,1032.0,630.0],[5,1032.0,665.0],[9,1032.0,700.0],[1,1032.0,735.0],[20,1032.0,770.0],[15,1032.0,805.0],[56,1032.0,840.0],[21,1032.0,875.0],[2,1032.0,910.0],[39,1032.0,945.0],[37,1032.0,980.0],[19,1032.0,1015.0],[47,1032.0,1050.0],[29,1032.0,1085.0],[42,1032.0,1120.0],[43,1032.0,1155.0],[44,1032.0,1190.0]]},"sake-rice|1.300000||":{"n":84,"p":[[34,-70.769,805.0],[45,-70.769,840.0],[48,-70.769,875.0],[65,-70.769,910.0],[3,-70.769,945.0],[6,-70.769,980.0],[26,-70.769,1015.0],[25,-70.769,1050.0],[8,747.692,210.0],[51,747.692,245.0],[52,747.692,280.0],[11,747.692,315.0],[53,747.692,350.0],[7,747.692,385.0],[30,747.692,420.0],[71,747.692,455.0],[72,747.692,490.0],[73,747.692,525.0],[12,747.692,560.0],[13,747.692,595.0],[4,747.692,630.0],[5,747.692,665.0],[9,747.692,700.0],[1,747.692,735.0],[20,747.692,770.0],[15,747.692,805.0],[28,747.692,840.0],[56,747.692,875.0],[21,747.692,910.0],[2,747.692,945.0],[37,747.692,980.0],[10,747.692,1015.0],[0,747.692,1050.0]]},"sake-rice|1.690000||":{"n":11,"p":[[1,528.994,525.0],[20,528.994,560.0],[78,528.994,595.0],[79,528.994,630.0],[80,528.994,665.0],[81,528.994,700.0],[32,528.994,735.0],[28,528.994,770.0],[56,528.994,805.0]]},"sake-rice|2.197000||":{"n":0,"p":[]},"sake-rice|2.856100||":{"n":0,"p":[]},"sake-rice|3.712930||":{"n":0,"p":[]},"sake-rice|4.826809||":{"n":0,"p":[]},"sake-rice|5.000000||":{"n":0,"p":[]},"sake-rice|1.000000|Kyoto|":{"n":1,"p":[[10,-32.0,945.0]]},"sake-rice|1.000000|Saga|":{"n":2,"p":[[95,-32.0,1085.0],[96,-32.0,1120.0]]},"sake-rice|1.000000|Kumamoto|":{"n":1,"p":[[70,-32.0,1155.0]]},"sake-rice|1.000000|Kagawa|":{"n":3,"p":[[33,-32.0,980.0],[67,-32.0,1015.0],[68,-32.0,1050.0]]},"sake-rice|1.000000|Aichi|":{"n":4,"p":[[42,1032.0,910.0],[43,1032.0,945.0],[44,1032.0,980.0],[59,1032.0,1015.0]]},"sake-rice|1.000000|Tochigi|":{"n":2,"p":[[46,1032.0,805.0],[77,1032.0,840.0]]},"sake-rice|1.000000|Yamanashi|":{"n":0,"p":[]},"sake-rice|1.000000|Shiga|":{"n":3,"p":[[17,-32.0,910.0],[22,-32.0,945.0],[64,-32.0,980.0]]},"sake-rice|1.000000|Gunma|":{"n":2,"p":[[35,1032.0,805.0],[55,1032.0,840.0]]},"sake-rice|1.000000|Miyagi|":{"n":2,"p":[[13,1032.0,630.0],[14,1032.0,665.0]]},"sake-rice|1.000000|Shizuoka|":{"n":1,"p":[[29,1032.0,945.0]]},"sake-rice|1.000000|Ibaraki|":{"n":2,"p":[[21,1032.0,805.0],[76,1032.0,840.0]]},"sake-rice|1.000000|Okinawa|":{"n":0,"p":[]},"sake-rice|1.000000|Yamagata|":{"n":5,"p":[[4,1032.0,595.0],[5,1032.0,630.0],[9,1032.0,665.0],[27,1032.0,700.0],[74,1032.0,735.0]]},"sake-rice|1.000000|Wakayama|":{"n":0,"p":[]},"sake-rice|1.000000|Nagasaki|":{"n":0,"p":[]},"sake-rice|1.000000|Akita|":{"n":5,"p":[[7,1032.0,490.0],[30,1032.0,525.0],[71,1032.0,560.0],[72,1032.0,595.0],[73,1032.0,630.0]]},"sake-rice|1.000000|Okayama|":{"n":1,"p":[[3,-32.0,980.0]]},"sake-rice|1.000000|Fukuoka|":{"n":4,"p":[[31,-32.0,1050.0],[92,-32.0,1085.0],[93,-32.0,1120.0],[94,-32.0,1155.0]]},"sake-rice|1.000000|Gifu|":{"n":1,"p":[[19,1032.0,910.0]]},"sake-rice|1.000000|Aomori|":{"n":2,"p":[[11,1032.0,420.0],[53,1032.0,455.0]]},"sake-rice|1.000000|Osaka|":{"n":0,"p":[]},"sake-rice|1.000000|Nagano|":{"n":6,"p":[[2,1032.0,770.0],[39,1032.0,805.0],[84,1032.0,840.0],[85,1032.0,875.0],[86,1032.0,910.0],[16,1032.0,945.0]]},"sake-rice|1.000000|Oita|":{"n":0,"p":[]},"sake-rice|1.000000|Mie|":{"n":4,"p":[[60,-32.0,980.0],[61,-32.0,1015.0],[62,-32.0,1050.0],[63,-32.0,1085.0]]},"sake-rice|1.000000|Hiroshima|":{"n":3,"p":[[6,-32.0,980.0],[26,-32.0,1015.0],[25,-32.0,1050.0]]},"sake-rice|1.000000|Hokkaido|":{"n":3,"p":[[8,1032.0,210.0],[51,1032.0,245.0],[52,1032.0,280.0]]},"sake-rice|1.000000|Hyogo|":{"n":4,"p":[[0,-32.0,910.0],[18,-32.0,945.0],[23,-32.0,980.0],[24,-32.0,1015.0]]},"sake-rice|1.000000|Chiba|":{"n":1,"p":[[47,1032.0,910.0]]},"sake-rice|1.000000|Toyama|":{"n":2,"p":[[56,1032.0,805.0],[38,1032.0,840.0]]},"sake-rice|1.000000|Tokyo|":{"n":0,"p":[]},"sake-rice|1.000000|Saitama|":{"n":1,"p":[[37,1032.0,875.0]]},"sake-rice|1.000000|Yamaguchi|":{"n":2,"p":[[49,-32.0,1015.0],[66,-32.0,1050.0]]},"sake-rice|1.000000|Fukushima|":{"n":2,"p":[[15,1032.0,735.0],[75,1032.0,770.0]]},"sake-rice|1.000000|Ishikawa|":{"n":2,"p":[[28,-32.0,770.0],[82,-32.0,805.0]]},"sake-rice|1.000000|Fukui|":{"n":4,"p":[[83,-32.0,840.0],[41,-32.0,875.0],[57,-32.0,910.0],[58,-32.0,945.0]]},"sake-rice|1.000000|Ehime|":{"n":2,"p":[[50,-32.0,1085.0],[88,-32.0,1120.0]]},"sake-rice|1.000000|Nara|":{"n":2,"p":[[40,-32.0,1015.0],[87,-32.0,1050.0]]},"sake-rice|1.000000|Shimane|":{"n":3,"p":[[45,-32.0,910.0],[48,-32.0,945.0],[65,-32.0,980.0]]},"sake-rice|1.000000|Iwate|":{"n":3,"p":[[12,1032.0,525.0],[36,1032.0,560.0],[54,1032.0,595.0]]},"sake-rice|1.000000|Tottori|":{"n":1,"p":[[34,-32.0,945.0]]},"sake-rice|1.000000|Tokushima|":{"n":0,"p":[]},"sake-rice|1.000000|Kagoshima|":{"n":0,"p":[]},"sake-rice|1.000000|Niigata|":{"n":7,"p":[[1,1032.0,630.0],[20,1032.0,665.0],[78,1032.0,700.0],[79,1032.0,735.0],[80,1032.0,770.0],[81,1032.0,805.0],[32,1032.0,840.0]]},"sake-rice|1.000000|Kochi|":{"n":4,"p":[[69,-32.0,1050.0],[89,-32.0,1085.0],[90,-32.0,1120.0],[91,-32.0,1155.0]]},"sake-rice|1.000000|Miyazaki|":{"n":0,"p":[]},"sake-rice|1.000000|Kanagawa|":{"n":0,"p":[]},"sake-rice|0.500000||top":{"n":28,"p":[[8,136.0,245.0],[11,136.0,455.0],[7,136.0,560.0],[12,136.0,595.0],[13,136.0,630.0],[4,136.0,665.0],[5,136.0,700.0],[9,136.0,735.0],[1,136.0,770.0],[15,136.0,805.0],[28,136.0,840.0],[21,136.0,875.0],[2,136.0,910.0],[37,136.0,945.0],[19,136.0,980.0],[34,136.0,1015.0],[10,136.0,1050.0],[0,136.0,1085.0],[3,136.0,1120.0],[6,136.0,1155.0],[40,136.0,1190.0],[31,136.0,1225.0],[50,136.0,1260.0],[69,136.0,1295.0],[70,136.0,1330.0]]},"sake-rice|0.591716||top":{"n":28,"p":[[8,83.92,245.0],[11,83.92,455.0],[7,83.92,560.0],[12,83.92,595.0],[13,83.92,630.0],[4,83.92,665.0],[5,83.92,700.0],[9,83.92,735.0],[1,83.92,770.0],[15,83.92,805.0],[28,83.92,840.0],[21,83.92,875.0],[2,83.92,910.0],[37,83.92,945.0],[19,83.92,980.0],[34,83.92,1015.0],[10,83.92,1050.0],[0,83.92,1085.0],[3,83.92,1120.0],[6,83.92,1155.0],[40,83.92,1190.0],[31,83.92,1225.0],[50,83.92,1260.0],[69,83.92,1295.0],[70,83.92,1330.0]]},"sake-rice|0.769231||top":{"n":28,"p":[[7,18.4,560.0],[4,18.4,630.0],[5,18.4,665.0],[9,18.4,700.0],[1,18.4,735.0],[15,18.4,770.0],[28,18.4,805.0],[56,18.4,840.0],[21,18.4,875.0],[2,18.4,910.0],[37,18.4,945.0],[19,18.4,980.0],[34,18.4,1015.0],[10,18.4,1050.0],[0,18.4,1085.0],[3,18.4,1120.0],[6,18.4,1155.0],[40,18.4,1190.0],[31,18.4,1225.0],[50,18.4,1260.0],[69,18.4,1295.0],[70,18.4,1330.0],[8,1401.6,245.0],[11,1401.6,455.0],[12,1401.6,560.0],[13,1401.6,665.0]]},"sake-rice|1.000000||top":{"n":28,"p":[[28,-32.0,805.0],[34,-32.0,875.0],[10,-32.0,910.0],[0,-32.0,945.0],[3,-32.0,980.0],[6,-32.0,1015.0],[40,-32.0,1050.0],[31,-32.0,1085.0],[50,-32.0,1120.0],[69,-32.0,1155.0],[70,-32.0,1190.0],[8,1032.0,245.0],[11,1032.0,455.0],[7,1032.0,560.0],[12,1032.0,595.0],[13,1032.0,630.0],[4,1032.0,665.0],[5,1032.0,700.0],[9,1032.0,735.0],[1,1032.0,770.0],[15,1032.0,805.0],[56,1032.0,840.0],[21,1032.0,875.0],[2,1032.0,910.0],[37,1032.0,945.0],[19,1032.0,980.0],[47,1032.0,1015.0],[29,1032.0,1050.0]]},"sake-rice|1.300000||top":{"n":24,"p":[[34,-70.769,945.0],[3,-70.769,980.0],[6,-70.769,1015.0],[8,747.692,245.0],[11,747.692,455.0],[7,747.692,560.0],[12,747.692,595.0],[13,747.692,630.0],[4,747.692,665.0],[5,747.692,700.0],[9,747.692,735.0],[1,747.692,770.0],[15,747.692,805.0],[28,747.692,840.0],[56,747.692,875.0],[21,747.692,910.0],[2,747.692,945.0],[37,747.692,980.0],[10,747.692,1015.0],[0,747.692,1050.0]]},"sake-rice|1.690000||top":{"n":3,"p":[[1,528.994,735.0],[28,528.994,770.0],[56,528.994,805.0]]},"sake-rice|2.197000||top":{"n":0,"p":[]},"sake-rice|2.856100||top":{"n":0,"p":[]},"sake-rice|3.712930||top":{"n":0,"p":[]},"sake-rice|4.826809||top":{"n":0,"p":[]},"sake-rice|5.000000||top":{"n":0,"p":[]},"sake-rice|1.000000|Kyoto|top":{"n":1,"p":[[10,-32.0,945.0]]},"sake-rice|1.000000|Saga|top":{"n":0,"p":[]},"sake-rice|1.000000|Kumamoto|top":{"n":1,"p":[[70,-32.0,1155.0]]},"sake-rice|1.000000|Kagawa|top":{"n":0,"p":[]},"sake-rice|1.000000|Aichi|top":{"n":0,"p":[]},"sake-rice|1.000000|Tochigi|top":{"n":0,"p":[]},"sake-rice|1.000000|Yamanashi|top":{"n":0,"p":[]},"sake-rice|1.000000|Shiga|top":{"n":0,"p":[]},"sake-rice|1.000000|Gunma|top":{"n":0,"p":[]},"sake-rice|1.000000|Miyagi|top":{"n":1,"p":[[13,1032.0,665.0]]},"sake-rice|1.000000|Shizuoka|top":{"n":1,"p":[[29,1032.0,945.0]]},"sake-rice|1.000000|Ibaraki|top":{"n":1,"p":[[21,1032.0,840.0]]},"sake-rice|1.000000|Okinawa|top":{"n":0,"p":[]},"sake-rice|1.000000|Yamagata|top":{"n":3,"p":[[4,1032.0,630.0],[5,1032.0,665.0],[9,1032.0,700.0]]},"sake-rice|1.000000|Wakayama|top":{"n":0,"p":[]},"sake-rice|1.000000|Nagasaki|top":{"n":0,"p":[]},"sake-rice|1.000000|Akita|top":{"n":1,"p":[[7,1032.0,560.0]]},"sake-rice|1.000000|Okayama|top":{"n":1,"p":[[3,-32.0,980.0]]},"sake-rice|1.000000|Fukuoka|top":{"n":1,"p":[[31,-32.0,1085.0]]},"sake-rice|1.000000|Gifu|top":{"n":1,"p":[[19,1032.0,910.0]]},"sake-rice|1.000000|Aomori|top":{"n":1,"p":[[11,1032.0,455.0]]},"sake-rice|1.000000|Osaka|top":{"n":0,"p":[]},"sake-rice|1.000000|Nagano|top":{"n":1,"p":[[2,1032.0,875.0]]},"sake-rice|1.000000|Oita|top":{"n":0,"p":[]},"sake-rice|1.000000|Mie|top":{"n":0,"p":[]},"sake-rice|1.000000|Hiroshima|top":{"n":1,"p":[[6,-32.0,1015.0]]},"sake-rice|1.000000|Hokkaido|top":{"n":1,"p":[[8,1032.0,245.0]]},"sake-rice|1.000000|Hyogo|top":{"n":1,"p":[[0,-32.0,945.0]]},"sake-rice|1.000000|Chiba|top":{"n":1,"p":[[47,1032.0,910.0]]},"sake-rice|1.000000|Toyama|top":{"n":1,"p":[[56,1032.0,805.0]]},"sake-rice|1.000000|Tokyo|top":{"n":0,"p":[]},"sake-rice|1.000000|Saitama|top":{"n":1,"p":[[37,1032.0,875.0]]},"sake-rice|1.000000|Yamaguchi|top":{"n":0,"p":[]},"sake-rice|1.000000|Fukushima|top":{"n":1,"p":[[15,1032.0,770.0]]},"sake-rice|1.000000|Ishikawa|top":{"n":1,"p":[[28,-32.0,805.0]]},"sake-rice|1.000000|Fukui|top":{"n":0,"p":[]},"sake-rice|1.000000|Ehime|top":{"n":1,"p":[[50,-32.0,1085.0]]},"sake-rice|1.000000|Nara|top":{"n":1,"p":[[40,-32.0,1015.0]]},"sake-rice|1.000000|Shimane|top":{"n":0,"p":[]},"sake-rice|1.000000|Iwate|top":{"n":1,"p":[[12,1032.0,560.0]]},"sake-rice|1.000000|Tottori|top":{"n":1,"p":[[34,-32.0,945.0]]},"sake-rice|1.000000|Tokushima|top":{"n":0,"p":[]},"sake-rice|1.000000|Kagoshima|top":{"n":0,"p":[]},"sake-rice|1.000000|Niigata|top":{"n":1,"p":[[1,1032.0,735.0]]},"sake-rice|1.000000|Kochi|top":{"n":1,"p":[[69,-32.0,1120.0]]},"sake-rice|1.000000|Miyazaki|top":{"n":0,"p":[]},"sake-rice|1.000000|Kanagawa|top":{"n":0,"p":[]}}};
@@ -3,7 +3,7 @@
 Add Japanese names to sake rice CSV file.
 """
 
-import csv
+from csv_store import CsvStore
 
 # Japanese names for sake rice varieties
 japanese_names = {
@@ -80,31 +80,16 @@ japanese_names = {
     'Hana nishiki': '華錦'
 }
 
-# Read current CSV
-rows = []
-with open('sake_rice.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    fieldnames = reader.fieldnames
+# Update sake_rice.csv in one atomic write
+store = CsvStore()
+with store.transaction('add_japanese_names_sake'):
+    rows = store.table('sake_rice.csv')
 
     # Add Japanese Name after Name if not already there
-    if 'Japanese Name' not in fieldnames:
-        new_fieldnames = ['Name', 'Japanese Name'] + [f for f in fieldnames if f != 'Name']
-    else:
-        new_fieldnames = fieldnames
+    if 'Japanese Name' not in rows.fieldnames:
+        rows.set_fieldnames(['Name', 'Japanese Name'] + [f for f in rows.fieldnames if f != 'Name'])
 
-    for row in reader:
-        # Add Japanese name if available
-        if row['Name'] in japanese_names:
-            row['Japanese Name'] = japanese_names[row['Name']]
-        elif 'Japanese Name' not in row:
-            row['Japanese Name'] = ''
-        rows.append(row)
-
-# Write updated CSV
-with open('sake_rice.csv', 'w', newline='', encoding='utf-8') as f:
-    writer = csv.DictWriter(f, fieldnames=new_fieldnames)
-    writer.writeheader()
-    writer.writerows(rows)
+    rows.apply_patches({name: {'Japanese Name': japanese} for name, japanese in japanese_names.items()})
 
 print(f"✓ Updated sake_rice.csv with Japanese names")
 print(f"  Added {sum(1 for r in rows if r.get('Japanese Name'))} Japanese names")
@@ -3,7 +3,7 @@
 Add new sake rice varieties to sake_rice.csv - all importance level 2
 """
 
-import csv
+from csv_store import CsvStore
 
 # New varieties with researched data
 new_varieties = [
@@ -294,31 +294,19 @@ new_varieties = [
     },
 ]
 
-# Read existing CSV
-existing_varieties = []
-with open('sake_rice.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    fieldnames = reader.fieldnames
-    for row in reader:
-        existing_varieties.append(row)
+# Add the new varieties in one atomic write, skipping names already present
+store = CsvStore()
+with store.transaction('add_new_sake_varieties'):
+    existing_varieties = store.table('sake_rice.csv')
+    added_count = 0
 
-# Check for duplicates and add new varieties
-existing_names = {v['Name'] for v in existing_varieties}
-added_count = 0
-
-for new_var in new_varieties:
-    if new_var['Name'] not in existing_names:
-        existing_varieties.append(new_var)
-        added_count += 1
-        print(f"✓ Added: {new_var['Name']} ({new_var['Japanese Name']}) - {new_var['Prefecture']}")
-    else:
-        print(f"  Skipped (already exists): {new_var['Name']}")
-
-# Write updated CSV
-with open('sake_rice.csv', 'w', newline='', encoding='utf-8') as f:
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(existing_varieties)
+    for new_var in new_varieties:
+        if new_var['Name'] not in existing_varieties:
+            existing_varieties.upsert(new_var)
+            added_count += 1
+            print(f"✓ Added: {new_var['Name']} ({new_var['Japanese Name']}) - {new_var['Prefecture']}")
+        else:
+            print(f"  Skipped (already exists): {new_var['Name']}")
 
 print(f"\n✓ Added {added_count} new sake rice varieties")
 print(f"✓ Total varieties: {len(existing_varieties)}")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Sake rice production choropleth, aggregated at build time.
+
+choropleth_section() sums the sake rice rows per region twice: by
+prefecture JIS code and by old province ID. Each region gets three
+totals:
+- tonnes: Production_Tonnes, for the varieties that report it
+- varieties: the number of varieties
+- importance: the varieties weighted by Importance tier (IMPORTANCE_WEIGHTS)
+
+A variety spread over several regions adds an equal share to each. For
+provinces, each prefecture's share is split evenly among the provinces
+that cover it (entity_ids.NameResolver.province_prefectures), since the
+rows only name prefectures.
+
+Each MEASURES total is cut into CLASSES quantile classes over the
+regions that have a value. The result is a string with one colour index
+per region, in the order of "ids": 0 means none, then 1 to CLASSES.
+Everything is computed for all varieties and again for the top tier
+(Importance 1). The page's "top varieties" filter then only switches
+arrays.
+"""
+
+import math
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Importance tier -> weight in the importance total (tier 1 is the most important)
+IMPORTANCE_WEIGHTS = {1: 3, 2: 2, 3: 1}
+
+# Quantile classes per measure (colour indexes 1..CLASSES; 0 = no value)
+CLASSES = 5
+
+MEASURES = ('tonnes', 'importance')
+
+# Variety subsets aggregated separately: name -> row filter
+VARIETY_SETS: Dict[str, Callable[[Dict], bool]] = {
+    'all': lambda row: True,
+    'top': lambda row: row.get('Importance') == 1,
+}
+
+
+def quantile_breaks(values: Sequence[float], classes: int = CLASSES) -> List[float]:
+    """
+    Upper bounds of the quantile classes of the positive values (nearest
+    rank), without repeats, so there may be fewer than classes; the last
+    bound is the largest value.
+    """
+    ranked = sorted(v for v in values if v > 0)
+    if not ranked:
+        return []
+    breaks = []
+    for i in range(1, classes + 1):
+        bound = ranked[max(0, math.ceil(i / classes * len(ranked)) - 1)]
+        if not breaks or bound > breaks[-1]:
+            breaks.append(bound)
+    return breaks
+
+
+def classify(values: Sequence[float], breaks: Sequence[float]) -> str:
+    """One colour index digit per value: 0 for none, else 1 + its class."""
+    digits = []
+    for value in values:
+        if value <= 0:
+            digits.append('0')
+        else:
+            digits.append(str(1 + next(i for i, bound in enumerate(breaks) if value <= bound)))
+    return ''.join(digits)
+
+
+def region_totals(rows: Sequence[Dict], row_regions: Sequence[Sequence[Tuple[int, float]]],
+                  ids: Sequence[int]) -> Dict[str, List[float]]:
+    """tonnes, varieties and importance per region id; row_regions holds each row's (region, share) pairs."""
+    position = {region: i for i, region in enumerate(ids)}
+    totals = {'tonnes': [0.0] * len(ids), 'varieties': [0.0] * len(ids), 'importance': [0.0] * len(ids)}
+    for row, regions in zip(rows, row_regions):
+        shares = {}
+        for region, share in regions:
+            if region in position:
+                shares[position[region]] = shares.get(position[region], 0.0) + share
+        for i, share in shares.items():
+            totals['tonnes'][i] += (row.get('Production_Tonnes') or 0) * share
+            totals['varieties'][i] += share
+            totals['importance'][i] += IMPORTANCE_WEIGHTS.get(row.get('Importance'), 0) * share
+    return {key: [round(v, 2) for v in values] for key, values in totals.items()}
+
+
+def region_layer(rows: Sequence[Dict], row_regions: Sequence, ids: Sequence[int]) -> Dict:
+    """Totals, breaks and colour indexes of every variety set for one kind of region."""
+    layer = {'ids': list(ids)}
+    for name, keep in VARIETY_SETS.items():
+        kept = [(row, regions) for row, regions in zip(rows, row_regions) if keep(row)]
+        totals = region_totals([row for row, _ in kept], [regions for _, regions in kept], ids)
+        for measure in MEASURES:
+            breaks = quantile_breaks(totals[measure])
+            totals[f"{measure}_breaks"] = breaks
+            totals[f"{measure}_classes"] = classify(totals[measure], breaks)
+        layer[name] = totals
+    return layer
+
+
+def choropleth_section(rows: Sequence[Dict], row_codes: Sequence[Sequence[int]],
+                       prefecture_ids: Sequence[int], province_prefectures: Dict[int, List[int]]) -> Dict:
+    """
+    The sake_rice_choropleth section, from the sake rice rows, their
+    prefecture codes (entity_index) and the prefectures of each province.
+    """
+    covering: Dict[int, List[int]] = {}
+    for province, codes in sorted(province_prefectures.items()):
+        for code in codes:
+            covering.setdefault(code, []).append(province)
+
+    prefecture_regions = []
+    province_regions = []
+    for codes in row_codes:
+        share = 1 / len(codes) if codes else 0
+        prefecture_regions.append([(code, share) for code in codes])
+        province_regions.append([(province, share / len(covering[code]))
+                                 for code in codes for province in covering.get(code, ())])
+    return {
+        'classes': CLASSES,
+        'measures': list(MEASURES),
+        'prefectures': region_layer(rows, prefecture_regions, prefecture_ids),
+        'provinces': region_layer(rows, province_regions, sorted(province_prefectures)),
+    }
@@ -4,9 +4,12 @@ Clean river coordinate data by removing outlier points that are far
 from the expected prefecture location.
 """
 
+import argparse
 import csv
 import math
 
+from pipeline_stats import RunReport, add_instrumentation_args, count_vertices
+
 # Expected prefecture coordinates (approximate centers)
 PREFECTURE_COORDS = {
     'Niigata': (37.9, 139.0),
@@ -46,105 +49,129 @@ def distance(lat1, lon1, lat2, lon2):
     # Rough conversion: 1 degree lat ≈ 111km, 1 degree lon ≈ 91km at lat 36
     return math.sqrt((dlat * 111)**2 + (dlon * 91)**2)
 
-# Read river metadata
-print("Reading river metadata...")
-river_metadata = {}
-with open('rivers.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        if row['Name']:
-            river_metadata[row['Name']] = {
-                'prefecture': row['Prefecture'],
-                'japanese': row['Japanese Name']
-            }
-
-# Read and clean river geometry
-print("\nCleaning river coordinates...\n")
-cleaned_rivers = []
-stats = {'total': 0, 'cleaned': 0, 'removed_points': 0}
-
-with open('rivers_geo_new.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        if not row['Name']:
-            continue
-
-        stats['total'] += 1
-        name = row['Name']
-
-        if name not in river_metadata:
-            cleaned_rivers.append({'Name': name, 'Coordinates': row['Coordinates']})
-            continue
-
-        prefecture = river_metadata[name]['prefecture']
-        prefectures = [p.strip() for p in prefecture.split(';')]
-
-        # Get expected coordinates
-        expected_coords = []
-        for pref in prefectures:
-            if pref in PREFECTURE_COORDS:
-                expected_coords.append(PREFECTURE_COORDS[pref])
-
-        if not expected_coords:
-            cleaned_rivers.append({'Name': name, 'Coordinates': row['Coordinates']})
-            continue
-
-        # Parse coordinates
-        coords_str = row['Coordinates']
-        if not coords_str:
-            cleaned_rivers.append({'Name': name, 'Coordinates': ''})
-            continue
-
-        coord_pairs = coords_str.split(';')
-        cleaned_coords = []
-        removed = []
-
-        # Filter out outliers
-        for pair in coord_pairs:
-            try:
-                lat, lon = map(float, pair.split(','))
-
-                # Find minimum distance to any expected prefecture
-                min_dist = float('inf')
-                for exp_lat, exp_lon in expected_coords:
-                    dist = distance(lat, lon, exp_lat, exp_lon)
-                    min_dist = min(min_dist, dist)
-
-                # Keep only if within 200km of expected prefecture
-                # (rivers can be long, so give generous buffer)
-                if min_dist <= 200:
-                    cleaned_coords.append(pair)
-                else:
-                    removed.append((lat, lon, min_dist))
-                    stats['removed_points'] += 1
-            except:
-                pass
-
-        if removed:
-            stats['cleaned'] += 1
-            print(f"✓ {name} ({prefecture}): removed {len(removed)} outlier points, kept {len(cleaned_coords)}")
-
-        # Only add river if we have at least some coordinates left
-        if cleaned_coords:
-            cleaned_rivers.append({
-                'Name': name,
-                'Coordinates': ';'.join(cleaned_coords)
-            })
-        else:
-            print(f"⚠ {name}: all points were outliers, skipping river")
-
-# Write cleaned data
-output_file = 'rivers_geo_cleaned.csv'
-with open(output_file, 'w', newline='', encoding='utf-8') as f:
-    writer = csv.writer(f)
-    writer.writerow(['Name', 'Coordinates'])
-    for river in cleaned_rivers:
-        writer.writerow([river['Name'], river['Coordinates']])
-
-print(f"\n{'='*60}")
-print(f"Cleaning complete!")
-print(f"  Total rivers: {stats['total']}")
-print(f"  Rivers cleaned: {stats['cleaned']}")
-print(f"  Total outlier points removed: {stats['removed_points']}")
-print(f"  Output: {output_file}")
-print(f"{'='*60}")
+def main():
+    parser = argparse.ArgumentParser(description='Remove river points far from their prefecture')
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    run = RunReport.from_args('clean_river_data', args)
+
+    # Read river metadata
+    print("Reading river metadata...")
+    river_metadata = {}
+    with run.stage('load_metadata') as load_stats, open('rivers.csv', 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            load_stats['rows_in'] += 1
+            if row['Name']:
+                river_metadata[row['Name']] = {
+                    'prefecture': row['Prefecture'],
+                    'japanese': row['Japanese Name']
+                }
+        load_stats['rows_out'] = len(river_metadata)
+
+    # Read and clean river geometry
+    print("\nCleaning river coordinates...\n")
+    cleaned_rivers = []
+
+    with run.stage('remove_outliers') as stats, open('rivers_geo_new.csv', 'r', encoding='utf-8') as f:
+        stats.update({'total': 0, 'cleaned': 0, 'removed_points': 0})
+        reader = csv.DictReader(f)
+        for row in reader:
+            if not row['Name']:
+                continue
+
+            stats['total'] += 1
+            name = row['Name']
+            stats['vertices_in'] += count_vertices(row['Coordinates'])
+
+            if name not in river_metadata:
+                cleaned_rivers.append({'Name': name, 'Coordinates': row['Coordinates']})
+                continue
+
+            prefecture = river_metadata[name]['prefecture']
+            prefectures = [p.strip() for p in prefecture.split(';')]
+
+            # Get expected coordinates
+            expected_coords = []
+            for pref in prefectures:
+                if pref in PREFECTURE_COORDS:
+                    expected_coords.append(PREFECTURE_COORDS[pref])
+
+            if not expected_coords:
+                cleaned_rivers.append({'Name': name, 'Coordinates': row['Coordinates']})
+                continue
+
+            # Parse coordinates
+            coords_str = row['Coordinates']
+            if not coords_str:
+                cleaned_rivers.append({'Name': name, 'Coordinates': ''})
+                continue
+
+            coord_pairs = coords_str.split(';')
+            cleaned_coords = []
+            removed = []
+
+            # Filter out outliers
+            for pair in coord_pairs:
+                try:
+                    lat, lon = map(float, pair.split(','))
+
+                    # Find minimum distance to any expected prefecture
+                    min_dist = float('inf')
+                    for exp_lat, exp_lon in expected_coords:
+                        dist = distance(lat, lon, exp_lat, exp_lon)
+                        min_dist = min(min_dist, dist)
+
+                    # Keep only if within 200km of expected prefecture
+                    # (rivers can be long, so give generous buffer)
+                    if min_dist <= 200:
+                        cleaned_coords.append(pair)
+                    else:
+                        removed.append((lat, lon, min_dist))
+                        stats['removed_points'] += 1
+                except:
+                    pass
+
+            if removed:
+                stats['cleaned'] += 1
+                print(f"✓ {name} ({prefecture}): removed {len(removed)} outlier points, kept {len(cleaned_coords)}")
+
+            # Only add river if we have at least some coordinates left
+            if cleaned_coords:
+                cleaned_rivers.append({
+                    'Name': name,
+                    'Coordinates': ';'.join(cleaned_coords)
+                })
+            else:
+                print(f"⚠ {name}: all points were outliers, skipping river")
+
+        stats['rows_in'] = stats['total']
+        stats['rows_out'] = len(cleaned_rivers)
+        stats['vertices_out'] = sum(count_vertices(r['Coordinates']) for r in cleaned_rivers)
+
+    # Write cleaned data
+    output_file = 'rivers_geo_cleaned.csv'
+    with run.stage('write') as write_stats, open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Name', 'Coordinates'])
+        for river in cleaned_rivers:
+            writer.writerow([river['Name'], river['Coordinates']])
+        write_stats['rows_in'] = write_stats['rows_out'] = len(cleaned_rivers)
+        write_stats['vertices_in'] = write_stats['vertices_out'] = sum(
+            count_vertices(river['Coordinates']) for river in cleaned_rivers)
+
+    print(f"\n{'='*60}")
+    print(f"Cleaning complete!")
+    print(f"  Total rivers: {stats['total']}")
+    print(f"  Rivers cleaned: {stats['cleaned']}")
+    print(f"  Total outlier points removed: {stats['removed_points']}")
+    print(f"  Output: {output_file}")
+    print(f"{'='*60}")
+
+    if args.run_report or args.profile_dir:
+        run.print_summary()
+    run.write(args.run_report)
+
+
+if __name__ == '__main__':
+    main()
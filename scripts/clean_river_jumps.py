@@ -1,138 +1,186 @@
 #!/usr/bin/env python3
 """
 Clean river data by removing points that create unreasonably large jumps.
-Strategy: Find the largest connected segment and keep only that.
+
+Each river is segmented at jumps in one pass (see river_segments.py), the
+configured strategy picks the segments to keep, and the result is verified
+against the same jump threshold before it is written. This replaces the
+separate analyze_jumps.py / verify_final.py passes.
+
+Usage:
+    python3 clean_river_jumps.py [--strategy longest|longest_km|stitch]
+                                 [--input rivers_geo_cleaned.csv]
+                                 [--output rivers_geo_final.csv]
+                                 [--report jump_report.json]
+                                 [--run-report run.json] [--profile-dir profiles/]
 """
 
+import argparse
 import csv
-import math
+import json
+import sys
+
+from pipeline_stats import RunReport, add_instrumentation_args, count_vertices
+from river_segments import STRATEGIES, apply_ranges, segment_river
 
-def distance(lat1, lon1, lat2, lon2):
-    """Calculate approximate distance in km between two lat/lon points."""
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    return math.sqrt((dlat * 111)**2 + (dlon * 91)**2)
 
 def find_largest_connected_segment(coords, max_jump_km=50):
     """
     Find the largest segment of consecutive points where no jump exceeds max_jump_km.
     Returns list of indices forming the largest connected segment.
     """
-    if len(coords) <= 1:
-        return list(range(len(coords)))
-
-    # Build segments separated by large jumps
-    segments = []
-    current_segment = [0]
-
-    for i in range(len(coords) - 1):
-        lat1, lon1 = coords[i]
-        lat2, lon2 = coords[i + 1]
-        dist = distance(lat1, lon1, lat2, lon2)
-
-        if dist <= max_jump_km:
-            current_segment.append(i + 1)
-        else:
-            # Large jump - start new segment
-            if len(current_segment) > 0:
-                segments.append(current_segment)
-            current_segment = [i + 1]
-
-    # Add final segment
-    if len(current_segment) > 0:
-        segments.append(current_segment)
-
-    # Return largest segment
-    if not segments:
-        return []
-
-    largest = max(segments, key=len)
-    return largest
-
-# Read river metadata
-print("Reading river metadata...")
-river_metadata = {}
-with open('rivers.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        if row['Name']:
-            river_metadata[row['Name']] = {
-                'length_km': float(row['Length']) if row['Length'] else 0
-            }
-
-print("\nCleaning rivers by removing jump-causing points...\n")
-cleaned_rivers = []
-stats = {'total': 0, 'cleaned': 0, 'points_removed': 0}
-
-with open('rivers_geo_cleaned.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        if not row['Name']:
-            continue
-
-        stats['total'] += 1
-        name = row['Name']
-        coords_str = row['Coordinates']
-
-        if not coords_str:
-            cleaned_rivers.append({'Name': name, 'Coordinates': ''})
-            continue
-
-        # Parse coordinates
-        coord_pairs = coords_str.split(';')
-        coords = []
-        for pair in coord_pairs:
-            try:
-                lat, lon = map(float, pair.split(','))
-                coords.append((lat, lon))
-            except:
-                pass
-
-        if len(coords) <= 1:
-            cleaned_rivers.append({'Name': name, 'Coordinates': coords_str})
+    report = segment_river(coords, max_jump_km, strategy='longest')
+    return apply_ranges(range(len(coords)), report['kept'])
+
+
+def parse_coordinate_pairs(coords_str):
+    """Split a coordinate string, keeping the raw pairs parallel to the parsed points."""
+    coord_pairs = []
+    coords = []
+    for pair in coords_str.split(';'):
+        try:
+            lat, lon = map(float, pair.split(','))
+        except ValueError:
             continue
-
-        # For short rivers, use stricter threshold (30km)
-        # For longer rivers, allow up to 50km jumps
-        river_length = river_metadata.get(name, {}).get('length_km', 100)
-        max_jump = 30 if river_length < 100 else 50
-
-        # Find largest connected segment
-        keep_indices = find_largest_connected_segment(coords, max_jump)
-
-        # Filter coordinates
-        kept_coords = [coord_pairs[i] for i in keep_indices]
-        removed_count = len(coord_pairs) - len(kept_coords)
-
-        if removed_count > 0:
-            stats['cleaned'] += 1
-            stats['points_removed'] += removed_count
-            print(f"✓ {name}: removed {removed_count} points (from {len(coord_pairs)} to {len(kept_coords)})")
-
-            # Show what was removed if significant
-            if removed_count > 5 or removed_count / len(coord_pairs) > 0.3:
-                print(f"   Kept largest connected segment (indices {min(keep_indices)}-{max(keep_indices)})")
-
-        if kept_coords:
-            cleaned_rivers.append({
-                'Name': name,
-                'Coordinates': ';'.join(kept_coords)
-            })
-        else:
-            print(f"⚠ {name}: no valid connected segment found")
-
-# Write cleaned data
-output_file = 'rivers_geo_final.csv'
-with open(output_file, 'w', newline='', encoding='utf-8') as f:
-    writer = csv.writer(f)
-    writer.writerow(['Name', 'Coordinates'])
-    for river in cleaned_rivers:
-        writer.writerow([river['Name'], river['Coordinates']])
-
-print(f"\n{'='*60}")
-print(f"Jump cleaning complete!")
-print(f"  Total rivers: {stats['total']}")
-print(f"  Rivers cleaned: {stats['cleaned']}")
-print(f"  Total points removed: {stats['points_removed']}")
-print(f"  Output: {output_file}")
-print(f"{'='*60}")
+        coord_pairs.append(pair)
+        coords.append((lat, lon))
+    return coord_pairs, coords
+
+
+def load_river_lengths(filename='rivers.csv'):
+    """Read river lengths (km) from the metadata file."""
+    lengths = {}
+    with open(filename, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            if row['Name']:
+                lengths[row['Name']] = float(row['Length']) if row['Length'] else 0
+    return lengths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remove large jumps from river geometry')
+    parser.add_argument('--strategy', choices=STRATEGIES, default='longest',
+                        help='How to choose the segments to keep (default: longest)')
+    parser.add_argument('--input', default='rivers_geo_cleaned.csv')
+    parser.add_argument('--output', default='rivers_geo_final.csv')
+    parser.add_argument('--report', help='Write the per-river segment report as JSON')
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    run = RunReport.from_args('clean_river_jumps', args)
+
+    print("Reading river metadata...")
+    with run.stage('load_metadata') as load_stats:
+        river_lengths = load_river_lengths()
+        load_stats['rows_in'] = load_stats['rows_out'] = len(river_lengths)
+
+    print(f"\nCleaning rivers by removing jump-causing points (strategy: {args.strategy})...\n")
+    cleaned_rivers = []
+    reports = []
+
+    with run.stage('segment') as stats, open(args.input, 'r', encoding='utf-8') as f:
+        stats.update({'total': 0, 'cleaned': 0, 'points_removed': 0, 'unverified': 0})
+        reader = csv.DictReader(f)
+        for row in reader:
+            if not row['Name']:
+                continue
+
+            stats['total'] += 1
+            name = row['Name']
+            coords_str = row['Coordinates']
+
+            if not coords_str:
+                cleaned_rivers.append({'Name': name, 'Coordinates': ''})
+                continue
+
+            coord_pairs, coords = parse_coordinate_pairs(coords_str)
+            stats['vertices_in'] += len(coords)
+
+            if len(coords) <= 1:
+                cleaned_rivers.append({'Name': name, 'Coordinates': coords_str})
+                stats['vertices_out'] += len(coords)
+                continue
+
+            # For short rivers, use stricter threshold (30km)
+            # For longer rivers, allow up to 50km jumps
+            river_length = river_lengths.get(name, 100)
+            max_jump = 30 if river_length < 100 else 50
+
+            report = segment_river(coords, max_jump, strategy=args.strategy, name=name)
+            reports.append(report)
+
+            kept_coords = apply_ranges(coord_pairs, report['kept'])
+            removed_count = report['points_in'] - report['points_out']
+
+            if len(report['segments']) > 1:
+                print(f"⚠ {name}: {len(report['segments'])} segments, "
+                      f"max jump {report['max_jump_in']:.1f} km")
+                if river_length > 0:
+                    print(f"   River length: {river_length:g} km "
+                          f"(max jump is {report['max_jump_in'] / river_length * 100:.0f}% of total)")
+
+            if removed_count > 0:
+                stats['cleaned'] += 1
+                stats['points_removed'] += removed_count
+                print(f"✓ {name}: removed {removed_count} points "
+                      f"(from {report['points_in']} to {report['points_out']})")
+
+                # Show what was kept if significant
+                if removed_count > 5 or removed_count / report['points_in'] > 0.3:
+                    kept = ', '.join(f"{start}-{end - 1}{' (reversed)' if rev else ''}"
+                                     for start, end, rev in report['kept'])
+                    print(f"   Kept segment indices {kept}")
+
+            if report['max_jump_out'] > max_jump:
+                stats['unverified'] += 1
+                print(f"✗ {name}: cleaned data still has a {report['max_jump_out']:.1f} km jump")
+
+            stats['vertices_out'] += len(kept_coords)
+            if kept_coords:
+                cleaned_rivers.append({
+                    'Name': name,
+                    'Coordinates': ';'.join(kept_coords)
+                })
+            else:
+                print(f"⚠ {name}: no valid connected segment found")
+
+        stats['rows_in'] = stats['total']
+        stats['rows_out'] = len(cleaned_rivers)
+
+    # Write cleaned data
+    with run.stage('write') as write_stats, open(args.output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Name', 'Coordinates'])
+        for river in cleaned_rivers:
+            writer.writerow([river['Name'], river['Coordinates']])
+        write_stats['rows_in'] = write_stats['rows_out'] = len(cleaned_rivers)
+        write_stats['vertices_in'] = write_stats['vertices_out'] = sum(
+            count_vertices(river['Coordinates']) for river in cleaned_rivers)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'stats': stats, 'rivers': reports}, f, ensure_ascii=False, indent=2)
+
+    print(f"\n{'='*60}")
+    print(f"Jump cleaning complete!")
+    print(f"  Total rivers: {stats['total']}")
+    print(f"  Rivers cleaned: {stats['cleaned']}")
+    print(f"  Total points removed: {stats['points_removed']}")
+    if stats['unverified']:
+        print(f"  ⚠ Rivers still over the jump threshold: {stats['unverified']}")
+    else:
+        print(f"  ✓ Verified: no remaining jump exceeds its threshold")
+    print(f"  Output: {args.output}")
+    if args.report:
+        print(f"  Report: {args.report}")
+    print(f"{'='*60}")
+
+    if args.run_report or args.profile_dir:
+        run.print_summary()
+    run.write(args.run_report)
+
+    return 1 if stats['unverified'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Columnar encoding for the tables emitted by data/convert_csv_to_js.py.
+
+A table of row dicts (as coerced by scripts/csv_schema.py) becomes
+
+    {"columns": ["Name", "Region", "Population", ...],
+     "types":   ["s",    "d",      "n",          ...],
+     "strings": ["Hokkaido", "Tohoku", ...],
+     "values":  [[...Name of each row...], [...], [...]]}
+
+with one value array per column, so keys such as "Japanese Name" are
+written once per table instead of once per row. Column types:
+
+- n: numbers (null for an empty cell). Used for columns the schema
+     coerced to numbers, and for text columns whose every value is exactly
+     what JavaScript prints for the number ("3776", "12.5").
+- d: indexes into the table's "strings" dictionary. Used for repeated
+     values (Region, Prefecture, Mountain Range) when it is smaller.
+- s: plain strings.
+
+decodeTable in index.html turns a table back into row objects, with
+numbers for n columns and '' for their empty cells.
+"""
+
+import json
+import re
+from typing import Dict, List, Optional
+
+# Text a JavaScript number prints as itself (no exponents, leading zeros or trailing zeros)
+JS_NUMBER_TEXT = re.compile(r'^-?(0|[1-9]\d{0,14})(\.\d*[1-9])?$')
+
+# Columns kept as plain strings whatever their contents
+STRING_COLUMNS = {'Name', 'Japanese Name', 'Coordinates'}
+
+
+def js_number(text: str):
+    """The number a cell holds if it round-trips through a JS number unchanged, else None."""
+    if not JS_NUMBER_TEXT.match(text):
+        return None
+    value = float(text)
+    if value == 0 and text != '0':
+        return None
+    if value.is_integer() and '.' not in text:
+        return int(value)
+    return value if repr(value) == text else None
+
+
+def json_size(value) -> int:
+    return len(json.dumps(value, ensure_ascii=False))
+
+
+def is_number(cell) -> bool:
+    return isinstance(cell, (int, float)) and not isinstance(cell, bool)
+
+
+def column_type(name: str, cells: List[Optional[str]]) -> str:
+    """Pick n, d or s for a column."""
+    if any(is_number(cell) for cell in cells) and all(cell is None or is_number(cell) for cell in cells):
+        return 'n'
+    if name in STRING_COLUMNS or any(cell is None or not isinstance(cell, str) for cell in cells):
+        return 's'
+    filled = [cell for cell in cells if cell != '']
+    if filled and all(js_number(cell) is not None for cell in filled):
+        return 'n'
+    distinct = set(cells)
+    plain = sum(json_size(cell) for cell in cells)
+    # Dictionary entries plus one index (and comma) per row
+    encoded = sum(json_size(value) + 1 for value in distinct) + len(cells) * (len(str(len(distinct))) + 1)
+    return 'd' if encoded < plain else 's'
+
+
+def encode_table(rows: List[Dict]) -> Dict:
+    """Encode a list of row dicts (all with the same keys) as a columnar table."""
+    columns = list(rows[0].keys()) if rows else []
+    types = []
+    values = []
+    strings: List[str] = []
+    string_index: Dict[str, int] = {}
+    for column in columns:
+        cells = [row.get(column) for row in rows]
+        kind = column_type(column, cells)
+        if kind == 'n':
+            encoded = [cell if cell is None or is_number(cell) else js_number(cell) if cell != '' else None
+                       for cell in cells]
+        elif kind == 'd':
+            encoded = []
+            for cell in cells:
+                if cell not in string_index:
+                    string_index[cell] = len(strings)
+                    strings.append(cell)
+                encoded.append(string_index[cell])
+        else:
+            encoded = cells
+        types.append(kind)
+        values.append(encoded)
+    return {'columns': columns, 'types': types, 'strings': strings, 'values': values}
+
+
+def decode_table(table) -> List[Dict]:
+    """Inverse of encode_table (mirrors decodeTable in index.html); row lists pass through."""
+    if not isinstance(table, dict) or 'columns' not in table:
+        return table
+    columns, types, strings, values = table['columns'], table['types'], table['strings'], table['values']
+    count = len(values[0]) if values else 0
+    rows = []
+    for i in range(count):
+        row = {}
+        for column, kind, column_values in zip(columns, types, values):
+            value = column_values[i]
+            if kind == 'd':
+                value = strings[value]
+            elif kind == 'n' and value is None:
+                value = ''
+            row[column] = value
+        rows.append(row)
+    return rows
+
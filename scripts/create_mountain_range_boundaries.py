@@ -5,6 +5,8 @@ Create geographic boundaries for mountain ranges by using the prefecture areas t
 
 import csv
 
+from entity_ids import NameResolver, read_rows
+
 print("Loading data...")
 
 # Mountain ranges to create boundaries for
@@ -17,20 +19,12 @@ with open('mountains.csv', 'r', encoding='utf-8') as f:
 
 print(f"Found {len(mountain_ranges)} mountain ranges")
 
-# Load prefecture geometries
-prefecture_geo = {}
-with open('prefectures_geo.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        full_name = row['Name']
-        prefecture_geo[full_name] = row['Coordinates']
+# Load prefecture geometries keyed by JIS code; names resolve through the alias table
+prefecture_rows = read_rows('prefectures_geo.csv')
+prefecture_geo = {int(row['ID']): row['Coordinates'] for row in prefecture_rows}
+resolver = NameResolver(prefecture_rows)
 
-        # Also store without suffix
-        base_name = full_name.replace(' Ken', '').replace(' Fu', '').replace(' To', '').replace(' Do', '')
-        if base_name != full_name:
-            prefecture_geo[base_name] = row['Coordinates']
-
-print(f"Loaded {len(prefecture_geo)} prefecture name variations")
+print(f"Loaded {len(prefecture_geo)} prefectures ({len(resolver.prefecture_aliases)} name variations)")
 
 # Create range boundaries
 range_boundaries = []
@@ -51,18 +45,12 @@ for range_data in mountain_ranges:
     found_count = 0
 
     for pref in prefecture_list:
-        # Try various name formats
-        found = False
-        for suffix in ['', ' Ken', ' Fu', ' To', ' Do']:
-            pref_name = f"{pref}{suffix}" if suffix else pref
-            if pref_name in prefecture_geo:
-                all_coord_strings.append(prefecture_geo[pref_name])
-                found_count += 1
-                print(f"  ✓ Found {pref_name}")
-                found = True
-                break
-
-        if not found:
+        code = resolver.prefecture_id(pref)
+        if code in prefecture_geo:
+            all_coord_strings.append(prefecture_geo[code])
+            found_count += 1
+            print(f"  ✓ Found {resolver.prefecture_geo_names[code]} ({code:02d})")
+        else:
             print(f"  ✗ MISSING: {pref}")
 
     if found_count > 0:
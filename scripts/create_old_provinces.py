@@ -7,6 +7,8 @@ This is an approximation since historical boundaries don't match exactly.
 import csv
 from collections import defaultdict
 
+from entity_ids import NameResolver
+
 # Mapping of old provinces to modern prefectures
 # Format: old_province_name -> list of prefecture names (from prefectures_geo.csv)
 PROVINCE_TO_PREFECTURE = {
@@ -91,16 +93,10 @@ PROVINCE_TO_PREFECTURE = {
 }
 
 def load_prefecture_geometry():
-    """Load prefecture geometry from CSV."""
-    prefectures = {}
-
+    """Load prefecture geometry from CSV, keyed by JIS code, plus a resolver for the names."""
     with open('prefectures_geo.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = row['Name']
-            prefectures[name] = row
-
-    return prefectures
+        rows = list(csv.DictReader(f))
+    return {int(row['ID']): row for row in rows}, NameResolver(rows)
 
 def merge_coordinates(coord_strings):
     """Merge multiple coordinate strings into one (simple concatenation for now)."""
@@ -114,7 +110,7 @@ def merge_coordinates(coord_strings):
 def create_old_provinces_geometry():
     """Create old provinces geometry file."""
     print("Loading prefecture geometry...")
-    prefectures = load_prefecture_geometry()
+    prefectures, resolver = load_prefecture_geometry()
 
     print(f"Loaded {len(prefectures)} prefectures")
 
@@ -126,10 +122,11 @@ def create_old_provinces_geometry():
         japanese_name = ''
 
         for pref_name in pref_list:
-            if pref_name in prefectures:
-                coords_list.append(prefectures[pref_name]['Coordinates'])
+            code = resolver.prefecture_id(pref_name)
+            if code in prefectures:
+                coords_list.append(prefectures[code]['Coordinates'])
                 if not japanese_name:
-                    japanese_name = prefectures[pref_name].get('Japanese Name', '')
+                    japanese_name = prefectures[code].get('Japanese Name', '')
 
         if coords_list:
             old_provinces[province] = {
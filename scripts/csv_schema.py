@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Declarative schemas for the data/ CSV files, and a validator that coerces
+them to typed values.
+
+SCHEMAS maps each CSV file to its columns. A column spec is a dict:
+
+- type: str (default), int, float, years, coordinates or prefectures
+- required: the cell may not be empty
+- unique: no two rows may share the (non-empty) value
+- min / max: inclusive range for int and float columns
+- enum: the allowed values
+- references: (file, layer) - the value must be a Name in that CSV, after
+  strip_feature_prefix(name, layer)
+- separator: for prefectures columns, the list separator (default ';')
+- min_points: for coordinates columns, the fewest lat,lon pairs allowed
+
+load_table() checks one column of one table at a time, collecting
+every violation (file, CSV line, column, value, message) instead of
+stopping at the first, and returns the tables with typed cells:
+
+- int / float: Python numbers, None for an empty cell
+- years: "1923 / 1936" style text, with the separator spacing normalised
+  and "Released 2017" reduced to "2017"
+- prefectures: each name stripped, rejoined with the column's separator;
+  every name must resolve through entity_ids.NameResolver
+- everything else: the stripped string
+
+check_all_references() then checks the foreign keys across tables, and
+validate_tables() does both for a list of files. data/convert_csv_to_js.py
+runs them before building anything and fails the build if there are any
+violations.
+"""
+
+import csv
+import re
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+from entity_ids import NameResolver, strip_feature_prefix
+
+# Bounding box every coordinate must fall in (Yonaguni to Minamitorishima,
+# Okinotorishima to Etorofu)
+LAT_RANGE = (20.0, 46.0)
+LON_RANGE = (122.0, 154.0)
+
+REGIONS = ('Hokkaido', 'Tohoku', 'Kanto', 'Chubu', 'Kansai', 'Chugoku', 'Shikoku', 'Kyushu')
+REGIONS_KANJI = ('北海道', '東北', '関東', '中部', '関西', '中国', '四国', '九州')
+CIRCUITS = ('Kinai', 'Tokaido', 'Tosando', 'Hokurikudo', "San'indo", "San'yodo",
+            'Nankaido', 'Saikaido', 'Hokkaido')
+
+PREFECTURE = {'type': 'prefectures', 'required': True}
+
+SCHEMAS = {
+    'prefectures.csv': {
+        'Name': {'required': True, 'unique': True},
+        'Japanese Name': {'required': True, 'unique': True},
+        'Region': {'required': True, 'enum': REGIONS},
+        'Region Kanji': {'required': True, 'enum': REGIONS_KANJI},
+        'Old Provinces': {},
+        'Population': {'type': 'int', 'required': True, 'min': 0},
+        'Area': {'type': 'float', 'required': True, 'min': 0},
+    },
+    'prefectures_geo.csv': {
+        'Name': {'required': True, 'unique': True},
+        'Japanese Name': {'required': True},
+        'ID': {'type': 'int', 'required': True, 'unique': True, 'min': 1, 'max': 47},
+        'Coordinates': {'type': 'coordinates', 'required': True, 'min_points': 3},
+    },
+    'old_provinces.csv': {
+        # Two provinces are called "Awa"; their Japanese names differ
+        'Name': {'required': True},
+        'Japanese Name': {'required': True, 'unique': True},
+        'Prefectures': PREFECTURE,
+        'Region': {'required': True, 'enum': CIRCUITS},
+    },
+    'old_provinces_geo.csv': {
+        'Name': {'required': True, 'references': ('old_provinces.csv', 'old_provinces')},
+        'Japanese Name': {'required': True},
+        'Modern Prefecture': {'type': 'prefectures', 'required': True, 'separator': ','},
+        'Coordinates': {'type': 'coordinates', 'required': True, 'min_points': 3},
+    },
+    'lakes.csv': {
+        'Name': {'required': True, 'unique': True},
+        'Japanese Name': {'required': True},
+        'Prefecture': PREFECTURE,
+        'Area': {'type': 'float', 'min': 0},
+        'Depth': {'type': 'float', 'min': 0},
+    },
+    'lakes_geo.csv': {
+        'Name': {'required': True, 'unique': True, 'references': ('lakes.csv', 'lakes')},
+        'Coordinates': {'type': 'coordinates', 'required': True, 'min_points': 3},
+    },
+    'rivers.csv': {
+        'Name': {'required': True, 'unique': True},
+        'Japanese Name': {'required': True},
+        'Prefecture': PREFECTURE,
+        'Length': {'type': 'float', 'min': 0},
+        'Basin': {'type': 'float', 'min': 0},
+    },
+    'rivers_geo_final.csv': {
+        'Name': {'required': True, 'unique': True, 'references': ('rivers.csv', 'rivers')},
+        'Coordinates': {'type': 'coordinates', 'required': True, 'min_points': 2},
+    },
+    'mountains.csv': {
+        'Name': {'required': True, 'unique': True},
+        'Japanese Name': {'required': True},
+        'Prefecture': PREFECTURE,
+        'Elevation': {'type': 'int', 'required': True, 'min': 0, 'max': 3776},
+        'Mountain Range': {'required': True},
+    },
+    'mountains_geo.csv': {
+        'Name': {'required': True, 'unique': True, 'references': ('mountains.csv', 'mountains')},
+        'Latitude': {'type': 'float', 'required': True, 'min': LAT_RANGE[0], 'max': LAT_RANGE[1]},
+        'Longitude': {'type': 'float', 'required': True, 'min': LON_RANGE[0], 'max': LON_RANGE[1]},
+        'Elevation': {'type': 'int', 'min': 0, 'max': 3776},
+    },
+    'mountain_ranges_geo.csv': {
+        'Name': {'required': True, 'unique': True},
+        'Japanese Name': {'required': True},
+        'Prefectures': PREFECTURE,
+        'Coordinates': {'type': 'coordinates', 'required': True, 'min_points': 3},
+    },
+    'sake_rice.csv': {
+        'Name': {'required': True, 'unique': True},
+        'Japanese Name': {'required': True},
+        'Prefecture': PREFECTURE,
+        'Parents': {},
+        'Year': {'type': 'years'},
+        'Production_Tonnes': {'type': 'int', 'min': 0},
+        'Importance': {'type': 'int', 'required': True, 'enum': (1, 2, 3)},
+        'Notes': {},
+    },
+    'municipalities.csv': {
+        # Built by build_municipalities.py; Code is the 5-digit local government code
+        'Code': {'type': 'int', 'required': True, 'unique': True, 'min': 1000, 'max': 47999},
+        'Name': {'required': True},
+        'Japanese Name': {'required': True},
+        'Prefecture': PREFECTURE,
+        'Province ID': {'type': 'int', 'min': 1},
+    },
+}
+
+Violation = namedtuple('Violation', 'file line column value message')
+
+# "1923", "1923/ 1936", "Released 2017", "Early 2000s"
+YEAR = re.compile(r'^(?:(Early|Mid|Late) (\d{3}0s)|(?:Released )?(\d{4})(?:\s*/\s*(\d{4}))?)$')
+YEAR_RANGE = (1800, 2100)
+
+
+def coerce_int(text: str, spec: Dict) -> int:
+    try:
+        return int(text.replace(',', ''))
+    except ValueError:
+        raise ValueError('not an integer')
+
+
+def coerce_float(text: str, spec: Dict) -> float:
+    try:
+        value = float(text.replace(',', ''))
+    except ValueError:
+        raise ValueError('not a number')
+    # "83424" stays an integer; "34.0" keeps its float
+    return int(value) if value.is_integer() and '.' not in text else value
+
+
+def coerce_years(text: str, spec: Dict) -> str:
+    """A year, "first / second" years, or an approximate decade."""
+    match = YEAR.match(text)
+    if not match:
+        raise ValueError('not a year, "YYYY / YYYY" or "Early YYYYs"')
+    qualifier, decade, first, second = match.groups()
+    if decade:
+        return f"{qualifier} {decade}"
+    years = [int(first)] + ([int(second)] if second else [])
+    if not all(YEAR_RANGE[0] <= year <= YEAR_RANGE[1] for year in years):
+        raise ValueError(f"year outside {YEAR_RANGE[0]}-{YEAR_RANGE[1]}")
+    if len(years) == 2 and years[1] < years[0]:
+        raise ValueError('second year before the first')
+    return ' / '.join(str(year) for year in years)
+
+
+def coerce_coordinates(text: str, spec: Dict) -> str:
+    """A "lat,lon;lat,lon" string whose points all lie in Japan."""
+    pairs = text.split(';')
+    for number, pair in enumerate(pairs, 1):
+        try:
+            lat, lon = map(float, pair.split(','))
+        except ValueError:
+            raise ValueError(f"point {number} ({pair[:40]!r}) is not lat,lon")
+        if not (LAT_RANGE[0] <= lat <= LAT_RANGE[1] and LON_RANGE[0] <= lon <= LON_RANGE[1]):
+            raise ValueError(f"point {number} ({lat}, {lon}) is outside Japan")
+    if len(pairs) < spec.get('min_points', 1):
+        raise ValueError(f"{len(pairs)} points, need at least {spec['min_points']}")
+    return text
+
+
+def coerce_prefectures(text: str, spec: Dict) -> str:
+    """Strip each name of a prefecture list (resolved later, in check_references)."""
+    separator = spec.get('separator', ';')
+    names = [name.strip() for name in text.split(separator)]
+    if not all(names):
+        raise ValueError('empty name in prefecture list')
+    return (separator + (' ' if separator == ',' else '')).join(names)
+
+
+COERCERS = {
+    'str': lambda text, spec: text,
+    'int': coerce_int,
+    'float': coerce_float,
+    'years': coerce_years,
+    'coordinates': coerce_coordinates,
+    'prefectures': coerce_prefectures,
+}
+
+NUMERIC_TYPES = ('int', 'float')
+
+
+def read_table(filename: str) -> Tuple[List[str], List[Dict[str, str]], List[int]]:
+    """
+    Header, rows and the CSV line each row ends on, skipping blank rows.
+    Errors opening or parsing the file are raised, not swallowed.
+    """
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        rows = []
+        lines = []
+        for row in reader:
+            if any((v or '').strip() for v in row.values() if isinstance(v, str)):
+                rows.append(row)
+                lines.append(reader.line_num)
+        return list(reader.fieldnames or []), rows, lines
+
+
+def validate_columns(filename: str, header: List[str], rows: List[Dict[str, str]],
+                     lines: List[int], schema: Dict[str, Dict]) -> Tuple[List[Dict], List[Violation]]:
+    """Coerce and check every column of one table; returns (typed rows, violations)."""
+    violations = []
+
+    def report(i, column, value, message):
+        violations.append(Violation(filename, lines[i] if i is not None else 1, column, value, message))
+
+    for column in header:
+        if column not in schema:
+            report(None, column, '', 'column not in schema')
+    for column in schema:
+        if column not in header:
+            report(None, column, '', 'missing column')
+    for i, row in enumerate(rows):
+        if None in row:
+            report(i, '', '', f"{len(row[None])} more cells than the header")
+
+    typed_columns = {}
+    for column, spec in schema.items():
+        if column not in header:
+            continue
+        kind = spec.get('type', 'str')
+        coerce = COERCERS[kind]
+        empty = None if kind in NUMERIC_TYPES else ''
+        enum = spec.get('enum')
+        low, high = spec.get('min'), spec.get('max')
+        seen = {}
+        typed = []
+        for i, cell in enumerate(row.get(column) for row in rows):
+            text = (cell or '').strip()
+            if not text:
+                if spec.get('required'):
+                    report(i, column, cell, 'required value is empty' if cell is not None else 'row is too short')
+                typed.append(empty)
+                continue
+            try:
+                value = coerce(text, spec)
+            except ValueError as e:
+                report(i, column, text, str(e))
+                typed.append(empty)
+                continue
+            if enum is not None and value not in enum:
+                report(i, column, text, f"not one of {', '.join(map(str, enum))}")
+            if low is not None and value < low:
+                report(i, column, text, f"below minimum {low}")
+            if high is not None and value > high:
+                report(i, column, text, f"above maximum {high}")
+            if spec.get('unique'):
+                if value in seen:
+                    report(i, column, text, f"duplicate of line {lines[seen[value]]}")
+                else:
+                    seen[value] = i
+            typed.append(value)
+        typed_columns[column] = typed
+
+    # Unknown columns pass through as stripped strings
+    for column in header:
+        if column not in typed_columns:
+            typed_columns[column] = [(row.get(column) or '').strip() for row in rows]
+    typed_rows = [{column: typed_columns[column][i] for column in header} for i in range(len(rows))]
+    return typed_rows, violations
+
+
+def check_references(filename: str, rows: List[Dict], lines: List[int], schema: Dict[str, Dict],
+                     tables: Dict[str, List[Dict]], resolver: Optional[NameResolver]) -> List[Violation]:
+    """Foreign keys: prefecture names must resolve and references must name an existing row."""
+    violations = []
+    for column, spec in schema.items():
+        if spec.get('type') == 'prefectures' and resolver is not None:
+            separator = spec.get('separator', ';')
+            for i, row in enumerate(rows):
+                for name in (row.get(column) or '').split(separator):
+                    if name.strip() and resolver.prefecture_id(name) is None:
+                        violations.append(Violation(filename, lines[i], column, name.strip(),
+                                                    'unknown prefecture'))
+        if 'references' in spec:
+            target, layer = spec['references']
+            if target not in tables:
+                continue
+            names = {strip_feature_prefix(row.get('Name') or '', layer) for row in tables[target]}
+            for i, row in enumerate(rows):
+                value = row.get(column) or ''
+                if value and strip_feature_prefix(value, layer) not in names:
+                    violations.append(Violation(filename, lines[i], column, value,
+                                                f"no row with this Name in {target}"))
+    return violations
+
+
+def load_table(filename: str, schemas: Dict[str, Dict] = SCHEMAS
+               ) -> Tuple[List[Dict], List[int], List[Violation]]:
+    """
+    Read, coerce and check one CSV: (typed rows, row lines, violations).
+    A file that cannot be read is reported as a violation and has no rows.
+    """
+    try:
+        header, rows, lines = read_table(filename)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        return [], [], [Violation(filename, 0, '', '', f"cannot read: {e}")]
+    schema = schemas.get(filename)
+    violations = []
+    if schema is None:
+        violations.append(Violation(filename, 0, '', '', 'no schema for this file'))
+        schema = {column: {} for column in header}
+    typed_rows, table_violations = validate_columns(filename, header, rows, lines, schema)
+    return typed_rows, lines, violations + table_violations
+
+
+def check_all_references(tables: Dict[str, List[Dict]], lines: Dict[str, List[int]],
+                         violations: List[Violation], schemas: Dict[str, Dict] = SCHEMAS
+                         ) -> List[Violation]:
+    """Foreign key violations across loaded tables (keyed by filename)."""
+    # Prefecture names can only be checked against valid prefecture tables
+    resolver = None
+    if (tables.get('prefectures_geo.csv')
+            and not any(v.file in ('prefectures_geo.csv', 'prefectures.csv') for v in violations)):
+        resolver = NameResolver(tables['prefectures_geo.csv'], tables.get('prefectures.csv', []))
+    # Files that could not be read are already reported; do not blame their referrers
+    unreadable = {v.file for v in violations if v.line == 0 and v.message.startswith('cannot read')}
+    targets = {filename: rows for filename, rows in tables.items() if filename not in unreadable}
+    found = []
+    for filename, rows in tables.items():
+        found += check_references(filename, rows, lines[filename], schemas.get(filename, {}),
+                                  targets, resolver)
+    return found
+
+
+def validate_tables(filenames: List[str], schemas: Dict[str, Dict] = SCHEMAS
+                    ) -> Tuple[Dict[str, List[Dict]], List[Violation]]:
+    """Load and check the given CSVs (in the current directory): ({filename: typed rows}, violations)."""
+    tables = {}
+    lines = {}
+    violations = []
+    for filename in filenames:
+        tables[filename], lines[filename], table_violations = load_table(filename, schemas)
+        violations += table_violations
+    violations += check_all_references(tables, lines, violations, schemas)
+    return tables, violations
+
+
+def format_violation(violation: Violation) -> str:
+    where = f"{violation.file}:{violation.line}" if violation.line else violation.file
+    column = f" {violation.column}" if violation.column else ''
+    value = f" {violation.value!r}" if violation.value else ''
+    return f"{where}{column}{value}: {violation.message}"
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Transactional read-modify-write access to the data/ CSV files.
+
+The enrichment and fix-up scripts used to read a CSV, change a few fields
+and rewrite it in place with open(..., 'w'), so an exception or a crash
+half way through the write left a truncated file. With a CsvStore:
+
+    store = CsvStore()
+    with store.transaction('enhance_importance2'):
+        sake = store.table('sake_rice.csv')
+        sake.apply_patches({'Koshi Tanrei': {'Year': '1989/2004'}, ...})
+
+- each file is read once, when the transaction first asks for it, and
+  kept in memory as rows keyed by a column (Name by default)
+- upsert / patch / apply_patches / delete / rename change rows by key and
+  record only what actually changed; a patch that sets a field to its
+  current value is not a change
+- at the end of the transaction every changed file is written to a
+  temporary file in the same directory, flushed to disk and moved over
+  the original with os.replace, so a reader sees the old file or the new
+  one and never a partial one. Unchanged files are not rewritten. If the
+  block raises, nothing is written
+- every change is appended to a journal (csv_journal.ndjson, one JSON
+  object per line) with the transaction, file, key and old and new values,
+  so a batch of patches can be audited or reverted by hand. The entries
+  are flushed to disk before the first file is replaced, and a final
+  {"txn", "committed": [files]} line is added once every file has been
+  replaced and the directory synced. Each file is replaced atomically,
+  but a transaction over several files is not: after a crash, a txn with
+  no "committed" line may have replaced some of its files and not others,
+  and its entries say which values to check
+
+Files keep their header order, line endings ('\\r\\n' or '\\n') and quoting,
+so a table written back without changes is byte-identical.
+"""
+
+import csv
+import io
+import json
+import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+
+JOURNAL = 'csv_journal.ndjson'
+
+
+class CsvTable:
+    """The rows of one CSV, keyed by a column, with a log of changes since loading."""
+
+    def __init__(self, path: str, key: str = 'Name', fieldnames: Optional[List[str]] = None):
+        self.path = path
+        self.key = key
+        self.fieldnames: List[str] = list(fieldnames or [])
+        self.rows: List[Dict[str, str]] = []
+        self.lineterminator = '\n'
+        self.changes: List[Dict] = []
+        self.exists = os.path.exists(path)
+        if self.exists:
+            self._load()
+        self._reindex()
+
+    def _load(self):
+        # utf-8-sig: some older exports start with a byte order mark
+        with open(self.path, 'r', encoding='utf-8-sig', newline='') as f:
+            text = f.read()
+        first_line = text.split('\n', 1)[0]
+        self.lineterminator = '\r\n' if first_line.endswith('\r') else '\n'
+        reader = csv.DictReader(io.StringIO(text))
+        self.rows = list(reader)
+        self.fieldnames = list(reader.fieldnames or self.fieldnames)
+
+    def _reindex(self):
+        self._index: Dict[str, int] = {}
+        for position, row in enumerate(self.rows):
+            self._index.setdefault(row.get(self.key) or '', position)
+
+    def _record(self, op: str, key: str, changes: Optional[Dict] = None, provenance: Optional[str] = None):
+        entry = {'op': op, 'key': key}
+        if changes:
+            entry['changes'] = changes
+        if provenance:
+            entry['provenance'] = provenance
+        self.changes.append(entry)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return iter(self.rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def keys(self) -> List[str]:
+        return [row.get(self.key) or '' for row in self.rows]
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """The (first) row with this key, or None."""
+        position = self._index.get(key)
+        return self.rows[position] if position is not None else None
+
+    def patch(self, key: str, fields: Dict[str, str], only_empty: bool = False,
+              provenance: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Set fields of the row with this key; returns {field: [old, new]} for the
+        fields that changed. Raises KeyError if there is no such row. With
+        only_empty, fields that already have a value are left alone. The
+        provenance, if given, is journaled with the change.
+        """
+        row = self.get(key)
+        if row is None:
+            raise KeyError(f"{os.path.basename(self.path)}: no row with {self.key} {key!r}")
+        changed = {}
+        for field, value in fields.items():
+            value = '' if value is None else str(value)
+            old = row.get(field) or ''
+            if old == value or (only_empty and old.strip()):
+                continue
+            if field not in self.fieldnames:
+                self.fieldnames.append(field)
+            row[field] = value
+            changed[field] = [old, value]
+        renamed = self.key in changed
+        if renamed:
+            self._reindex()
+        if changed:
+            self._record('rename' if renamed else 'update', key, changed, provenance)
+        return changed
+
+    def upsert(self, row: Dict[str, str], provenance: Optional[str] = None) -> str:
+        """Insert the row, or patch the existing row with its key; returns 'insert', 'update' or 'unchanged'."""
+        key = row.get(self.key) or ''
+        if key in self._index:
+            return 'update' if self.patch(key, row, provenance=provenance) else 'unchanged'
+        for field in row:
+            if field not in self.fieldnames:
+                self.fieldnames.append(field)
+        self.rows.append({field: ('' if value is None else str(value)) for field, value in row.items()})
+        self._index[key] = len(self.rows) - 1
+        self._record('insert', key, {field: ['', value] for field, value in self.rows[-1].items() if value},
+                     provenance)
+        return 'insert'
+
+    def apply_patches(self, patches: Dict[str, Dict[str, str]], only_empty: bool = False) -> Dict[str, int]:
+        """Patch many rows by key in one pass; returns counts of updated, unchanged and missing rows."""
+        counts = {'updated': 0, 'unchanged': 0, 'missing': 0}
+        for key, fields in patches.items():
+            if key not in self._index:
+                counts['missing'] += 1
+            elif self.patch(key, fields, only_empty=only_empty):
+                counts['updated'] += 1
+            else:
+                counts['unchanged'] += 1
+        return counts
+
+    def rename(self, old_key: str, new_key: str) -> bool:
+        """Change a row's key; returns False if there is no such row or the key is unchanged."""
+        if old_key == new_key or old_key not in self._index:
+            return False
+        self.patch(old_key, {self.key: new_key})
+        return True
+
+    def delete(self, key: str) -> int:
+        """Remove every row with this key; returns how many were removed."""
+        kept = [row for row in self.rows if (row.get(self.key) or '') != key]
+        removed = len(self.rows) - len(kept)
+        if removed:
+            self.rows = kept
+            self._reindex()
+            self._record('delete', key)
+        return removed
+
+    def rename_column(self, old: str, new: str):
+        """Rename a column in the header and every row, keeping its position."""
+        if old not in self.fieldnames or old == new:
+            return
+        self.fieldnames[self.fieldnames.index(old)] = new
+        for row in self.rows:
+            row[new] = row.pop(old, '')
+        self._reindex()
+        self._record('rename_column', '', {'column': [old, new]})
+
+    def set_fieldnames(self, fieldnames: List[str]):
+        """Reorder, add or drop columns (added columns start empty)."""
+        fieldnames = list(fieldnames)
+        if fieldnames == self.fieldnames:
+            return
+        for row in self.rows:
+            for field in fieldnames:
+                row.setdefault(field, '')
+        self._record('columns', '', {'columns': [self.fieldnames, fieldnames]})
+        self.fieldnames = fieldnames
+
+    def replace_rows(self, rows: Iterable[Dict[str, str]], fieldnames: Optional[List[str]] = None):
+        """
+        Replace the whole table (for scripts that rebuild a file from another
+        source), journaling the difference by key.
+        """
+        if fieldnames is not None:
+            self.set_fieldnames(fieldnames)
+        new_rows = [{field: ('' if row.get(field) is None else str(row.get(field)))
+                     for field in self.fieldnames} for row in rows]
+        new_keys = {row.get(self.key) or '' for row in new_rows}
+        for key in self.keys():
+            if key not in new_keys:
+                self._record('delete', key)
+        for row in new_rows:
+            key = row.get(self.key) or ''
+            old = self.get(key)
+            if old is None:
+                self._record('insert', key, {f: ['', v] for f, v in row.items() if v})
+            else:
+                changed = {f: [old.get(f) or '', v] for f, v in row.items() if (old.get(f) or '') != v}
+                if changed:
+                    self._record('update', key, changed)
+        if new_rows != self.rows:
+            self.rows = new_rows
+            self._reindex()
+
+    def serialise(self) -> str:
+        out = io.StringIO()
+        writer = csv.DictWriter(out, fieldnames=self.fieldnames, lineterminator=self.lineterminator,
+                                extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(self.rows)
+        return out.getvalue()
+
+
+def write_atomic(path: str, text: str) -> None:
+    """Write text to path via a flushed temporary file and os.replace, keeping the file mode."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def fsync_directory(directory: str) -> None:
+    """Flush a directory's entries (the renames done in it) to disk, where the OS allows it."""
+    if not hasattr(os, 'O_DIRECTORY'):  # Windows cannot open a directory
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class CsvStore:
+    """
+    The CSVs of one directory, loaded on first use and committed together.
+
+    Use transaction() for a batch of changes; commit() and rollback() are
+    available for scripts that manage the batch themselves.
+    """
+
+    def __init__(self, directory: str = '.', journal: Optional[str] = JOURNAL):
+        self.directory = directory
+        self.journal = os.path.join(directory, journal) if journal else None
+        self.tables: Dict[str, CsvTable] = {}
+        self.source = None
+
+    def table(self, filename: str, key: str = 'Name', fieldnames: Optional[List[str]] = None) -> CsvTable:
+        """The table for a CSV in the store's directory (read once, then reused)."""
+        if filename not in self.tables:
+            self.tables[filename] = CsvTable(os.path.join(self.directory, filename), key, fieldnames)
+        return self.tables[filename]
+
+    @contextmanager
+    def transaction(self, source: Optional[str] = None):
+        """Commit every change made in the block when it exits normally; discard them if it raises."""
+        self.source = source
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
+
+    def rollback(self):
+        """Forget all loaded tables and their changes; nothing has been written."""
+        self.tables = {}
+
+    def commit(self) -> Dict[str, int]:
+        """
+        Journal the changes, then write every changed table (temporary file
+        + os.replace each). Returns {filename: number of changes}.
+        """
+        dirty = {name: table for name, table in self.tables.items() if table.dirty}
+        # Serialise everything first so a bad value fails before any file is replaced
+        texts = {name: table.serialise() for name, table in dirty.items()}
+        transaction = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        if dirty and self.journal:
+            entries = []
+            for name, table in dirty.items():
+                for change in table.changes:
+                    entry = {'txn': transaction, 'source': self.source, 'file': name}
+                    entry.update(change)
+                    entries.append(entry)
+            self._append_journal(entries)
+
+        for name, table in dirty.items():
+            write_atomic(table.path, texts[name])
+            table.exists = True
+        if dirty:
+            for directory in sorted({os.path.dirname(os.path.abspath(table.path)) for table in dirty.values()}):
+                fsync_directory(directory)
+            if self.journal:
+                self._append_journal([{'txn': transaction, 'source': self.source, 'committed': list(dirty)}])
+
+        counts = {name: len(table.changes) for name, table in dirty.items()}
+        for table in dirty.values():
+            table.changes = []
+        return counts
+
+    def _append_journal(self, entries: List[Dict]) -> None:
+        """Append entries to the journal and flush them to disk."""
+        with open(self.journal, 'a', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
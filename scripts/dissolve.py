@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Dissolve adjacent polygons into the outline of their union.
+
+Municipal boundaries from one source share their border vertices exactly,
+so the union of a set of municipalities is what is left after every edge
+that two of them share is removed:
+
+1. Each ring is turned counter-clockwise and broken into edges between
+   node keys (coordinates rounded as in osm_stitch.node_key).
+2. Edges are counted regardless of direction; an edge seen twice is an
+   inner border and is dropped.
+3. The remaining edges are chained head to tail into closed rings.
+
+This is one pass over the vertices plus a dictionary per dissolve, and it
+needs no geometry library. simplify_ring() then thins the outlines for
+display. Slivers from borders that do not quite match
+survive as small extra rings; callers usually keep the largest rings.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from osm_stitch import node_key
+
+Point = Tuple[float, float]
+
+
+def ring_area(ring: Sequence[Point]) -> float:
+    """Signed shoelace area in degrees² (positive when counter-clockwise in lon/lat)."""
+    area = 0.0
+    for i in range(len(ring)):
+        lat1, lon1 = ring[i - 1]
+        lat2, lon2 = ring[i]
+        area += lon1 * lat2 - lon2 * lat1
+    return area / 2
+
+
+def ring_centroid(ring: Sequence[Point]) -> Point:
+    """Area centroid of a ring (the vertex mean for degenerate rings)."""
+    area = ring_area(ring)
+    if abs(area) < 1e-12:
+        return (sum(p[0] for p in ring) / len(ring), sum(p[1] for p in ring) / len(ring))
+    lat_sum = lon_sum = 0.0
+    for i in range(len(ring)):
+        lat1, lon1 = ring[i - 1]
+        lat2, lon2 = ring[i]
+        cross = lon1 * lat2 - lon2 * lat1
+        lat_sum += (lat1 + lat2) * cross
+        lon_sum += (lon1 + lon2) * cross
+    return (lat_sum / (6 * area), lon_sum / (6 * area))
+
+
+def point_in_ring(point: Point, ring: Sequence[Point]) -> bool:
+    """Even-odd ray test of a (lat, lon) point against a ring."""
+    lat, lon = point
+    inside = False
+    for i in range(len(ring)):
+        lat1, lon1 = ring[i - 1]
+        lat2, lon2 = ring[i]
+        if (lat1 > lat) != (lat2 > lat):
+            crossing = lon1 + (lat - lat1) * (lon2 - lon1) / (lat2 - lat1)
+            if lon < crossing:
+                inside = not inside
+    return inside
+
+
+def dissolve(rings: Iterable[Sequence[Point]]) -> List[List[Point]]:
+    """
+    Outer rings of the union of the given rings, largest first. Only edges
+    shared between rings are removed, so the input must be topologically
+    clean (shared borders use the same vertices).
+    """
+    counts: Dict[Tuple, int] = defaultdict(int)
+    edges: List[Tuple] = []
+    coords: Dict[Tuple, Point] = {}
+    for ring in rings:
+        if len(ring) < 3:
+            continue
+        if ring_area(ring) < 0:
+            ring = list(reversed(ring))
+        keys = [node_key(p) for p in ring]
+        for p, key in zip(ring, keys):
+            coords.setdefault(key, p)
+        for i in range(len(keys)):
+            a, b = keys[i - 1], keys[i]
+            if a == b:
+                continue
+            counts[(a, b) if a < b else (b, a)] += 1
+            edges.append((a, b))
+
+    # Outgoing boundary edges per node
+    outgoing: Dict[Tuple, List[Tuple]] = defaultdict(list)
+    for a, b in edges:
+        if counts[(a, b) if a < b else (b, a)] == 1:
+            outgoing[a].append(b)
+
+    result = []
+    for start in list(outgoing):
+        while outgoing[start]:
+            ring = [start]
+            node = outgoing[start].pop()
+            while node != start:
+                ring.append(node)
+                if not outgoing[node]:
+                    # Open chain (unclean input): close it where it stopped
+                    break
+                node = outgoing[node].pop()
+            points = [coords[key] for key in ring]
+            # Clockwise rings are holes in the union (e.g. around an enclave)
+            if len(points) >= 3 and ring_area(points) > 0:
+                result.append(points)
+    result.sort(key=lambda r: -ring_area(r))
+    return result
+
+
+def simplify_ring(ring: Sequence[Point], epsilon: float) -> List[Point]:
+    """
+    Douglas-Peucker simplification of a closed ring (tolerance in degrees),
+    split at the vertex farthest from the first one. Iterative, since
+    national boundary rings are far longer than the recursion limit.
+    Returns [] when fewer than 3 points survive.
+    """
+    n = len(ring)
+    if n < 4:
+        return list(ring) if n == 3 else []
+    first = ring[0]
+    far = max(range(n), key=lambda i: (ring[i][0] - first[0]) ** 2 + (ring[i][1] - first[1]) ** 2)
+    closed = list(ring) + [first]
+    keep = [False] * (n + 1)
+    keep[0] = keep[far] = keep[n] = True
+    stack = [(0, far), (far, n)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        (lat1, lon1), (lat2, lon2) = closed[start], closed[end]
+        d_lat, d_lon = lat2 - lat1, lon2 - lon1
+        length = (d_lat * d_lat + d_lon * d_lon) ** 0.5
+        worst, worst_distance = -1, epsilon
+        for i in range(start + 1, end):
+            lat, lon = closed[i]
+            if length == 0:
+                distance = ((lat - lat1) ** 2 + (lon - lon1) ** 2) ** 0.5
+            else:
+                distance = abs(d_lon * (lat - lat1) - d_lat * (lon - lon1)) / length
+            if distance > worst_distance:
+                worst, worst_distance = i, distance
+        if worst != -1:
+            keep[worst] = True
+            stack.append((start, worst))
+            stack.append((worst, end))
+    simplified = [closed[i] for i in range(n) if keep[i]]
+    return simplified if len(simplified) >= 3 else []
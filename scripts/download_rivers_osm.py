@@ -10,6 +10,8 @@ import csv
 import time
 from typing import List, Tuple
 
+from osm_stitch import stitch_ways
+
 def query_overpass(river_name: str, japanese_name: str = None) -> dict:
     """
     Query Overpass API for a specific river in Japan.
@@ -47,28 +49,34 @@ def query_overpass(river_name: str, japanese_name: str = None) -> dict:
         print(f"  Error querying {river_name}: {e}", flush=True)
         return None
 
-def extract_coordinates(element: dict) -> List[Tuple[float, float]]:
+def extract_ways(element: dict) -> List[Tuple[int, List[Tuple[float, float]]]]:
     """
-    Extract coordinates from an OSM element.
-    Returns list of (lat, lon) tuples.
+    Extract the ways from an OSM element.
+    Returns list of (way id, [(lat, lon), ...]) in the order OSM lists them.
     """
-    coords = []
+    ways = []
 
     if element['type'] == 'way':
         # Direct way with geometry
         if 'geometry' in element:
-            for node in element['geometry']:
-                coords.append((node['lat'], node['lon']))
+            ways.append((element['id'], [(node['lat'], node['lon']) for node in element['geometry']]))
 
     elif element['type'] == 'relation':
-        # Relation containing multiple ways
+        # Relation containing multiple ways (in arbitrary order)
         if 'members' in element:
             for member in element['members']:
                 if member['type'] == 'way' and 'geometry' in member:
-                    for node in member['geometry']:
-                        coords.append((node['lat'], node['lon']))
+                    ways.append((member['ref'], [(node['lat'], node['lon']) for node in member['geometry']]))
+
+    return ways
 
-    return coords
+def extract_coordinates(element: dict) -> List[Tuple[float, float]]:
+    """
+    Extract coordinates from an OSM element.
+    Returns the main stem as a list of (lat, lon) tuples, stitched from source to mouth.
+    """
+    parts = stitch_ways([coords for _, coords in extract_ways(element)])
+    return parts[0]['coords'] if parts else []
 
 def coords_to_csv_string(coords: List[Tuple[float, float]]) -> str:
     """
@@ -98,9 +106,10 @@ def simplify_coordinates(coords: List[Tuple[float, float]], max_points: int = 50
 
     return simplified
 
-def download_river(river_name: str, japanese_name: str = None, max_points: int = 50) -> str:
+def download_river(river_name: str, japanese_name: str = None, max_points: int = 50):
     """
-    Download a river from OSM and return as CSV coordinate string.
+    Download a river from OSM and return its CSV coordinate strings.
+    Returns (main stem, [tributary parts]) or None if nothing was found.
     """
     data = query_overpass(river_name, japanese_name)
 
@@ -108,22 +117,33 @@ def download_river(river_name: str, japanese_name: str = None, max_points: int =
         print(f"  No data found for {river_name}", flush=True)
         return None
 
-    # Collect all coordinates from all elements
-    all_coords = []
+    # Collect the ways from all elements; a way can appear both on its own
+    # and as a relation member
+    ways = {}
     for element in data['elements']:
-        coords = extract_coordinates(element)
-        all_coords.extend(coords)
+        for way_id, coords in extract_ways(element):
+            ways.setdefault(way_id, coords)
+
+    # Join the ways into continuous linestrings instead of appending them
+    # in arbitrary order
+    parts = stitch_ways(list(ways.values()))
 
-    if not all_coords:
+    if not parts:
         print(f"  No coordinates extracted for {river_name}", flush=True)
         return None
 
+    main_stem = parts[0]['coords']
+
     # Simplify to reduce file size
-    simplified = simplify_coordinates(all_coords, max_points)
+    simplified = simplify_coordinates(main_stem, max_points)
+    tributaries = [coords_to_csv_string(simplify_coordinates(part['coords'], max_points))
+                   for part in parts[1:]]
 
-    print(f"  Found {len(all_coords)} points -> simplified to {len(simplified)} points", flush=True)
+    print(f"  Stitched {len(ways)} ways into {len(parts)} parts; main stem "
+          f"{len(main_stem)} points ({parts[0]['km']:.0f} km) -> simplified to {len(simplified)} points",
+          flush=True)
 
-    return coords_to_csv_string(simplified)
+    return coords_to_csv_string(simplified), tributaries
 
 def main():
     """
@@ -152,12 +172,14 @@ def main():
 
         print(f"[{i}/{len(rivers)}] {name} ({japanese_name})")
 
-        coord_string = download_river(name, japanese_name)
+        downloaded = download_river(name, japanese_name)
 
-        if coord_string:
+        if downloaded:
+            coord_string, tributaries = downloaded
             results.append({
                 'Name': name,
-                'Coordinates': coord_string
+                'Coordinates': coord_string,
+                'Tributaries': tributaries
             })
 
         # Rate limiting - be nice to OSM servers
@@ -174,7 +196,17 @@ def main():
         for result in results:
             writer.writerow([result['Name'], result['Coordinates']])
 
+    # Tributaries are kept as separate parts rather than merged into the main stem
+    with open('rivers_geo_tributaries.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Name', 'Part', 'Coordinates'])
+
+        for result in results:
+            for part, coords in enumerate(result['Tributaries'], 1):
+                writer.writerow([result['Name'], part, coords])
+
     print(f"\n✓ Saved {len(results)} rivers to rivers_geo_new.csv")
+    print(f"✓ Saved {sum(len(r['Tributaries']) for r in results)} tributary parts to rivers_geo_tributaries.csv")
     print("\nNote: Rivers not found in OSM may need manual geometry data")
     print("=" * 60)
 
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Canonical IDs and name resolution for prefectures and old provinces.
+
+Prefectures are identified by their JIS X 0401 code (1 = Hokkaido ...
+47 = Okinawa, the ID column of prefectures_geo.csv) and old provinces by
+their 1-based row number in old_provinces.csv (new provinces are appended,
+so existing IDs never change). A NameResolver maps every known spelling of
+either to its ID with a single dict lookup:
+
+- the metadata name ("Kyoto") and the geometry name ("Kyoto Fu")
+- suffix variants ("Kyoto-fu", "Kyoto Prefecture", "Hokkai Do" / "Hokkaido")
+- the Japanese name with and without its 都/道/府/県 (or 国) suffix
+- "<name> Province" for old provinces
+
+Keys are folded with alias_key() (NFKC, lower case, hyphens and runs of
+whitespace collapsed to one space), which the page mirrors in its aliasKey
+so both sides resolve names the same way. Aliases that would point at two
+different IDs are dropped and listed in NameResolver.conflicts.
+
+Feature names (lakes, mountains) are joined after strip_feature_prefix()
+removes the "Lake " / "Mount " prefixes some sources add.
+"""
+
+import csv
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+PREFECTURE_SUFFIXES = ('ken', 'fu', 'to', 'do', 'prefecture')
+PREFECTURE_SUFFIXES_JA = ('都', '道', '府', '県')
+PROVINCE_SUFFIXES = ('province',)
+PROVINCE_SUFFIXES_JA = ('国',)
+
+# Prefixes that are not part of a feature's canonical name, per layer
+FEATURE_PREFIXES = {
+    'lakes': ('Lake ',),
+    'mountains': ('Mount ', 'Mt. '),
+}
+
+
+def alias_key(name: str) -> str:
+    """Fold a name for alias lookup (must match aliasKey in index.html)."""
+    folded = unicodedata.normalize('NFKC', name or '').lower().replace('-', ' ').replace('_', ' ')
+    return ' '.join(folded.split())
+
+
+def strip_feature_prefix(name: str, layer: str) -> str:
+    """Drop a leading "Lake " / "Mount " style prefix from a feature name."""
+    for prefix in FEATURE_PREFIXES.get(layer, ()):
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+def english_aliases(name: str, suffixes: Iterable[str]) -> List[str]:
+    """The folded name, its base without any suffix, the base with each suffix, and spaceless forms."""
+    key = alias_key(name)
+    base = key
+    for suffix in suffixes:
+        if key.endswith(' ' + suffix):
+            base = key[:-len(suffix) - 1]
+            break
+    aliases = [key, base] + [f"{base} {suffix}" for suffix in suffixes]
+    aliases += [a.replace(' ', '') for a in aliases]
+    return aliases
+
+
+def japanese_aliases(name: str, suffixes: Iterable[str]) -> List[str]:
+    """The folded Japanese name and the same name without its administrative suffix."""
+    key = alias_key(name)
+    if not key:
+        return []
+    aliases = [key]
+    for suffix in suffixes:
+        if key.endswith(suffix) and len(key) > len(suffix) + 1:
+            aliases.append(key[:-len(suffix)])
+    return aliases
+
+
+class NameResolver:
+    """
+    Alias tables for prefectures and old provinces.
+
+    prefectures_geo rows need Name, Japanese Name and ID (the JIS code);
+    prefectures (metadata) rows are joined to them by Japanese name, and
+    provinces rows take their row number as ID.
+    """
+
+    def __init__(self, prefectures_geo: Iterable[Dict[str, str]],
+                 prefectures: Iterable[Dict[str, str]] = (),
+                 provinces: Iterable[Dict[str, str]] = ()):
+        self.prefecture_aliases: Dict[str, int] = {}
+        self.province_aliases: Dict[str, int] = {}
+        self.conflicts: Dict[str, List[int]] = {}
+        self.prefecture_names: Dict[int, str] = {}
+        self.prefecture_geo_names: Dict[int, str] = {}
+        self.province_names: Dict[int, str] = {}
+        self.province_prefectures: Dict[int, List[int]] = {}
+        self.unmatched: List[str] = []
+
+        by_japanese = {}
+        for row in prefectures_geo:
+            code = int(row['ID'])
+            self.prefecture_geo_names[code] = row['Name'].strip()
+            by_japanese[alias_key(row.get('Japanese Name', ''))] = code
+            self._add(self.prefecture_aliases, code,
+                      english_aliases(row['Name'], PREFECTURE_SUFFIXES) +
+                      japanese_aliases(row.get('Japanese Name', ''), PREFECTURE_SUFFIXES_JA))
+
+        for row in prefectures:
+            code = by_japanese.get(alias_key(row.get('Japanese Name', '')))
+            if code is None:
+                code = self.prefecture_id(row['Name'])
+            if code is None:
+                self.unmatched.append(row['Name'])
+                continue
+            self.prefecture_names[code] = row['Name'].strip()
+            self._add(self.prefecture_aliases, code, english_aliases(row['Name'], PREFECTURE_SUFFIXES))
+
+        for number, row in enumerate(provinces, 1):
+            self.province_names[number] = row['Name'].strip()
+            self.province_prefectures[number] = self.prefecture_ids(row.get('Prefectures', ''))
+            self._add(self.province_aliases, number,
+                      english_aliases(row['Name'], PROVINCE_SUFFIXES) +
+                      japanese_aliases(row.get('Japanese Name', ''), PROVINCE_SUFFIXES_JA))
+
+    def _add(self, table: Dict[str, int], entity_id: int, aliases: Iterable[str]):
+        for alias in aliases:
+            if not alias or alias in self.conflicts:
+                continue
+            existing = table.get(alias)
+            if existing is None:
+                table[alias] = entity_id
+            elif existing != entity_id:
+                # Ambiguous spelling: resolve neither rather than guess
+                self.conflicts[alias] = [existing, entity_id]
+                del table[alias]
+
+    def prefecture_id(self, name: str) -> Optional[int]:
+        """JIS code of a prefecture name in any known spelling, or None."""
+        return self.prefecture_aliases.get(alias_key(name))
+
+    def prefecture_ids(self, value: str) -> List[int]:
+        """JIS codes of a ';'-separated prefecture list, in order, without repeats or unknowns."""
+        codes = []
+        for name in (value or '').split(';'):
+            code = self.prefecture_id(name)
+            if code is not None and code not in codes:
+                codes.append(code)
+        return codes
+
+    def province_id(self, name: str) -> Optional[int]:
+        """ID of an old province name in any known spelling, or None."""
+        return self.province_aliases.get(alias_key(name))
+
+    def prefecture_name(self, code: int) -> Optional[str]:
+        """Metadata name of a prefecture ("Kyoto"), falling back to its geometry name."""
+        return self.prefecture_names.get(code) or self.prefecture_geo_names.get(code)
+
+    def unresolved(self, value: str) -> List[str]:
+        """The names in a ';'-separated prefecture list that do not resolve."""
+        return [name.strip() for name in (value or '').split(';')
+                if name.strip() and self.prefecture_id(name) is None]
+
+
+def read_rows(filename: str) -> List[Dict[str, str]]:
+    with open(filename, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def load_resolver(prefectures_geo: str = 'prefectures_geo.csv',
+                  prefectures: Optional[str] = 'prefectures.csv',
+                  provinces: Optional[str] = 'old_provinces.csv') -> NameResolver:
+    """Build a resolver from the CSVs in the current (data/) directory."""
+    return NameResolver(read_rows(prefectures_geo),
+                        read_rows(prefectures) if prefectures else (),
+                        read_rows(provinces) if provinces else ())
@@ -1,38 +1,15 @@
 #!/usr/bin/env python3
 """
 Fix Ezo entry in old_provinces_geo.csv by copying Hokkaido coordinates.
-"""
-
-import csv
 
-# Read Hokkaido coordinates from prefectures_geo.csv
-hokkaido_coords = None
-with open('prefectures_geo.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        if row['Name'] == 'Hokkaido':
-            hokkaido_coords = row['Coordinates']
-            break
-
-print(f"Hokkaido coordinates: {len(hokkaido_coords)} characters")
+The copy is declared in data/patches/ezo.json; data/apply_patches.py
+applies it together with all other curation.
+"""
 
-# Read old provinces
-provinces = []
-with open('old_provinces_geo.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        if row['Name'] == 'Ezo':
-            # Replace with full Hokkaido coordinates
-            row['Coordinates'] = hokkaido_coords
-            print(f"Updated Ezo with Hokkaido coordinates")
-        provinces.append(row)
+from patch_engine import apply_patch_files
 
-# Write back
-with open('old_provinces_geo.csv', 'w', newline='', encoding='utf-8') as f:
-    fieldnames = ['Name', 'Japanese Name', 'Modern Prefecture', 'Coordinates']
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(provinces)
+counts = apply_patch_files(['patches/ezo.json'], source='fix_ezo')
 
+if counts['changed']:
+    print(f"Updated Ezo with Hokkaido coordinates")
 print(f"✓ Fixed Ezo in old_provinces_geo.csv")
-print(f"✓ Total provinces: {len(provinces)}")
@@ -3,65 +3,35 @@
 Fix lakes data - handle field name variations.
 """
 
-import csv
+from csv_store import CsvStore
+from entity_ids import strip_feature_prefix
 
 print("Fixing lakes...")
 
-# Read lakes metadata with flexible field handling
-lakes_meta = []
-with open('lakes.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    fieldnames = reader.fieldnames
-    print(f"Original fieldnames: {fieldnames}")
+store = CsvStore()
+with store.transaction('fix_lakes'):
+    # Lakes metadata with flexible field handling
+    lakes_meta = store.table('lakes.csv')
+    print(f"Original fieldnames: {lakes_meta.fieldnames}")
 
-    for row in reader:
-        # Create clean row with trimmed keys
-        clean_row = {}
-        for key, value in row.items():
-            clean_key = key.strip()
-            clean_row[clean_key] = value
-
-        name = clean_row.get('Name', '')
-        if not name:
-            continue
+    # Trim stray spaces from column names (" Prefecture" -> "Prefecture")
+    for key in list(lakes_meta.fieldnames):
+        lakes_meta.rename_column(key, key.strip())
+    lakes_meta.set_fieldnames(['Name', 'Japanese Name', 'Prefecture', 'Area', 'Depth'])
+    lakes_meta.delete('')
 
+    for name in lakes_meta.keys():
         # Remove "Lake " prefix
-        if name.startswith('Lake '):
-            new_name = name.replace('Lake ', '')
+        new_name = strip_feature_prefix(name, 'lakes')
+        if lakes_meta.rename(name, new_name):
             print(f"  Renaming: {name} → {new_name}")
-            clean_row['Name'] = new_name
-
-        lakes_meta.append(clean_row)
 
-# Write cleaned lakes metadata
-with open('lakes.csv', 'w', newline='', encoding='utf-8') as f:
-    fieldnames = ['Name', 'Japanese Name', 'Prefecture', 'Area', 'Depth']
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(lakes_meta)
+    # Lakes geo
+    lakes_geo = store.table('lakes_geo.csv')
+    lakes_geo.delete('')
+    for name in lakes_geo.keys():
+        # Remove "Lake " prefix (and surrounding spaces)
+        lakes_geo.rename(name, strip_feature_prefix(name.strip(), 'lakes'))
 
 print(f"✓ Cleaned lakes.csv: {len(lakes_meta)} lakes")
-
-# Read lakes geo
-lakes_geo = []
-with open('lakes_geo.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        name = row.get('Name', '').strip()
-        if not name:
-            continue
-
-        # Remove "Lake " prefix
-        if name.startswith('Lake '):
-            row['Name'] = name.replace('Lake ', '')
-
-        lakes_geo.append(row)
-
-# Write cleaned lakes geo
-with open('lakes_geo.csv', 'w', newline='', encoding='utf-8') as f:
-    fieldnames = ['Name', 'Coordinates']
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(lakes_geo)
-
 print(f"✓ Cleaned lakes_geo.csv: {len(lakes_geo)} lakes")
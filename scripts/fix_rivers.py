@@ -3,14 +3,7 @@
 Simplify the river data for Kuma, Watarase, and Katsura rivers.
 """
 
-import csv
-
-# Read all rivers
-rivers = []
-with open('rivers_geo_final.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        rivers.append(row)
+from csv_store import CsvStore
 
 # Simplified river data (keeping key points along the path)
 simplified_rivers = {
@@ -21,17 +14,12 @@ simplified_rivers = {
     'Katsura': '34.953,135.732;35.012,135.686;35.018,135.626;35.072,135.536;35.115,135.518;35.141,135.639;35.187,135.676;35.207,135.775;35.244,135.767'
 }
 
-# Update the rivers
-for river in rivers:
-    if river['Name'] in simplified_rivers:
-        river['Coordinates'] = simplified_rivers[river['Name']]
-        print(f"Simplified {river['Name']}: {len(river['Coordinates'].split(';'))} points")
-
-# Write back to file
-with open('rivers_geo_final.csv', 'w', newline='', encoding='utf-8') as f:
-    fieldnames = ['Name', 'Coordinates']
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(rivers)
+# Update the rivers in one atomic write
+store = CsvStore()
+with store.transaction('fix_rivers'):
+    rivers = store.table('rivers_geo_final.csv')
+    for name, coordinates in simplified_rivers.items():
+        if name in rivers and rivers.patch(name, {'Coordinates': coordinates}):
+            print(f"Simplified {name}: {len(coordinates.split(';'))} points")
 
 print(f"\n✓ Updated rivers_geo_final.csv")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Read the features of a GeoJSON FeatureCollection one at a time.
+
+National boundary files (e.g. MLIT's N03 administrative areas, several
+hundred MB uncompressed) are too large to json.load() in one go.
+iter_features() reads the file in blocks, skips to the "features" array
+and decodes one feature object at a time with JSONDecoder.raw_decode, so
+memory use is bounded by the largest single feature. Files ending in .gz
+are decompressed on the fly.
+
+polygon_rings() turns a Polygon / MultiPolygon geometry into outer rings
+of (lat, lon) points, the order used by every CSV in data/.
+"""
+
+import gzip
+import json
+from typing import Dict, Iterator, List, Tuple
+
+Point = Tuple[float, float]
+
+# Characters read from the file per block
+BLOCK_SIZE = 1 << 20
+
+_decoder = json.JSONDecoder()
+
+
+def _open(path: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def iter_features(path: str) -> Iterator[Dict]:
+    """
+    Yield each feature of a FeatureCollection in file order. Raises
+    ValueError if there is no features array or the file is truncated.
+    """
+    with _open(path) as f:
+        buffer = f.read(BLOCK_SIZE).lstrip('\ufeff')
+        position = 0
+
+        def fill() -> bool:
+            # Drop the consumed text and append the next block; False at end of file
+            nonlocal buffer, position
+            block = f.read(BLOCK_SIZE)
+            buffer = buffer[position:] + block
+            position = 0
+            return bool(block)
+
+        # Skip to the start of the features array
+        while True:
+            start = buffer.find('"features"')
+            bracket = buffer.find('[', start) if start != -1 else -1
+            if bracket != -1:
+                position = bracket + 1
+                break
+            if not fill():
+                raise ValueError(f"{path}: no features array")
+
+        while True:
+            # Skip the separators between features
+            while True:
+                while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                    position += 1
+                if position < len(buffer) or not fill():
+                    break
+            if position >= len(buffer) or buffer[position] == ']':
+                return
+            while True:
+                try:
+                    feature, end = _decoder.raw_decode(buffer, position)
+                    break
+                except json.JSONDecodeError:
+                    # The feature runs past the buffer: read more and retry
+                    if not fill():
+                        raise ValueError(f"{path}: truncated feature")
+            position = end
+            if feature.get('type') == 'Feature':
+                yield feature
+
+
+def polygon_rings(geometry: Dict) -> List[List[Point]]:
+    """
+    The outer rings of a Polygon or MultiPolygon as (lat, lon) lists, with
+    the closing point dropped. Holes and other geometry types are ignored.
+    """
+    if not geometry:
+        return []
+    if geometry.get('type') == 'Polygon':
+        polygons = [geometry.get('coordinates') or []]
+    elif geometry.get('type') == 'MultiPolygon':
+        polygons = geometry.get('coordinates') or []
+    else:
+        return []
+    rings = []
+    for polygon in polygons:
+        if not polygon:
+            continue
+        ring = [(point[1], point[0]) for point in polygon[0]]
+        if len(ring) > 1 and ring[0] == ring[-1]:
+            ring.pop()
+        if len(ring) >= 3:
+            rings.append(ring)
+    return rings
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+On-disk geometry store, read through mmap without copying or parsing.
+
+A store is a directory (by convention <name>.geom/) holding:
+
+    meta.json      counts, attribute columns and byte order
+    coords.f64     every point as two float64s (lat, lon), feature after feature
+    parts.u64      point offset of each part (ring / line), plus the total
+    features.u64   part offset of each feature, plus the total
+    bbox.f64       [min_lat, min_lon, max_lat, max_lon] of each feature
+    features.csv   the feature table: one row of attributes per feature
+
+Feature i owns parts features[i]..features[i+1] and part j owns points
+parts[j]..parts[j+1], so a feature's coordinates are a slice of the
+mapped coords file. GeometryStore hands out those slices as memoryviews
+of flat [lat, lon, lat, lon, ...] doubles; nothing is read until it is
+touched, so a store larger than RAM can be streamed feature by feature.
+coordinate_array() wraps the same file in numpy.memmap when numpy is
+installed.
+
+GeometryStoreWriter appends features one at a time (coordinates go
+straight to disk), and import_csv() converts a geometry CSV
+("lat,lon;lat,lon" Coordinates, or Latitude/Longitude points) row by row.
+meta.json is written last, and only when the writer closes normally, so
+a store without it is incomplete and GeometryStore refuses to open it.
+
+data/convert_csv_to_js.py (--geometry-dir) reads only bounding boxes and
+vertex counts from stores so far; encoding, tiling and the other stages
+still parse the Coordinates strings of the CSVs.
+
+Usage (from the data/ directory):
+    python3 ../scripts/geometry_store.py import prefectures_geo.csv build/prefectures_geo.geom
+    python3 ../scripts/geometry_store.py info build/prefectures_geo.geom
+    python3 ../scripts/geometry_store.py export build/prefectures_geo.geom out.csv
+"""
+
+import argparse
+import csv
+import json
+import mmap
+import os
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from pipeline_stats import RunReport, add_instrumentation_args
+
+FORMAT_VERSION = 1
+# Points buffered before each write to coords.f64
+FLUSH_POINTS = 65536
+
+Point = Tuple[float, float]
+
+
+def parse_coordinates(text: str) -> List[List[Point]]:
+    """Parts of a coordinate string: "lat,lon;lat,lon" with parts separated by '|'."""
+    parts = []
+    for part_text in (text or '').split('|'):
+        points = []
+        for pair in part_text.split(';'):
+            try:
+                lat, lon = map(float, pair.split(','))
+            except ValueError:
+                continue
+            points.append((lat, lon))
+        if points:
+            parts.append(points)
+    return parts
+
+
+def format_part(flat: Sequence[float]) -> str:
+    """A flat [lat, lon, ...] sequence as "lat,lon;lat,lon" (shortest round-trip decimals)."""
+    return ';'.join(f"{flat[k]!r},{flat[k + 1]!r}" for k in range(0, len(flat), 2))
+
+
+class GeometryStoreWriter:
+    """Streams features into a new store directory; use as a context manager."""
+
+    def __init__(self, path: str, columns: Sequence[str]):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        # A store being rewritten is incomplete until close() writes meta.json again
+        if os.path.exists(os.path.join(path, 'meta.json')):
+            os.remove(os.path.join(path, 'meta.json'))
+        self.columns = list(columns)
+        self.features = 0
+        self.parts = 0
+        self.points = 0
+        self._coords = open(os.path.join(path, 'coords.f64'), 'wb')
+        self._parts = open(os.path.join(path, 'parts.u64'), 'wb')
+        self._features = open(os.path.join(path, 'features.u64'), 'wb')
+        self._bbox = open(os.path.join(path, 'bbox.f64'), 'wb')
+        self._table_file = open(os.path.join(path, 'features.csv'), 'w', encoding='utf-8', newline='')
+        self._table = csv.DictWriter(self._table_file, fieldnames=self.columns, extrasaction='ignore')
+        self._table.writeheader()
+        self._buffer = array('d')
+
+    def add(self, attributes: Dict[str, str], parts: Iterable[Iterable[Point]]) -> int:
+        """Append a feature; returns its index. Parts are iterables of (lat, lon)."""
+        array('Q', [self.parts]).tofile(self._features)
+        min_lat = min_lon = float('inf')
+        max_lat = max_lon = float('-inf')
+        for part in parts:
+            array('Q', [self.points]).tofile(self._parts)
+            for lat, lon in part:
+                self._buffer.append(lat)
+                self._buffer.append(lon)
+                self.points += 1
+                if lat < min_lat:
+                    min_lat = lat
+                if lat > max_lat:
+                    max_lat = lat
+                if lon < min_lon:
+                    min_lon = lon
+                if lon > max_lon:
+                    max_lon = lon
+                if len(self._buffer) >= 2 * FLUSH_POINTS:
+                    self._flush()
+            self.parts += 1
+        if min_lat == float('inf'):
+            # No points: an all-NaN box, read back as None
+            min_lat = min_lon = max_lat = max_lon = float('nan')
+        array('d', [min_lat, min_lon, max_lat, max_lon]).tofile(self._bbox)
+        self._table.writerow(attributes)
+        self.features += 1
+        return self.features - 1
+
+    def _flush(self):
+        self._buffer.tofile(self._coords)
+        self._buffer = array('d')
+
+    def _close_files(self):
+        for f in (self._coords, self._parts, self._features, self._bbox, self._table_file):
+            f.close()
+
+    def close(self):
+        """Finish the store: write the end offsets and meta.json."""
+        self._flush()
+        array('Q', [self.points]).tofile(self._parts)
+        array('Q', [self.parts]).tofile(self._features)
+        self._close_files()
+        meta = {'version': FORMAT_VERSION, 'byteorder': sys.byteorder, 'features': self.features,
+                'parts': self.parts, 'points': self.points, 'columns': self.columns}
+        with open(os.path.join(self.path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Leave the store without meta.json so it cannot be opened half-written
+            self._close_files()
+
+
+def _map(path: str, typecode: str) -> Tuple[Optional[mmap.mmap], memoryview]:
+    """Map a file read-only and view it as an array of typecode (empty files give an empty view)."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return None, memoryview(array(typecode))
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return mapped, memoryview(mapped).cast('B').cast(typecode)
+
+
+class GeometryStore:
+    """Read-only, memory-mapped view of a store directory."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('version') != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported geometry store version {self.meta.get('version')}")
+        if self.meta.get('byteorder') != sys.byteorder:
+            raise ValueError(f"{path}: written on a {self.meta.get('byteorder')}-endian machine")
+        self.columns = self.meta['columns']
+        self._maps = []
+        self.coords = self._open('coords.f64', 'd')
+        self.part_offsets = self._open('parts.u64', 'Q')
+        self.feature_offsets = self._open('features.u64', 'Q')
+        self.bboxes = self._open('bbox.f64', 'd')
+        self._attributes: Optional[List[Dict[str, str]]] = None
+
+    def _open(self, name: str, typecode: str) -> memoryview:
+        mapped, view = _map(os.path.join(self.path, name), typecode)
+        self._maps.append((mapped, view))
+        return view
+
+    def __len__(self) -> int:
+        return self.meta['features']
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Unmap the files. A file whose slices are still held elsewhere stays mapped until they go."""
+        for mapped, view in self._maps:
+            try:
+                view.release()
+                if mapped is not None:
+                    mapped.close()
+            except BufferError:
+                pass
+        self._maps = []
+
+    def attributes(self, index: int) -> Dict[str, str]:
+        """The feature-table row of a feature (the table is read on first use)."""
+        if self._attributes is None:
+            with open(os.path.join(self.path, 'features.csv'), 'r', encoding='utf-8', newline='') as f:
+                self._attributes = list(csv.DictReader(f))
+        return self._attributes[index]
+
+    def part_range(self, index: int) -> range:
+        return range(self.feature_offsets[index], self.feature_offsets[index + 1])
+
+    def part(self, part_index: int) -> memoryview:
+        """Flat [lat, lon, ...] doubles of one part, as a view into the mapped file."""
+        start, end = self.part_offsets[part_index], self.part_offsets[part_index + 1]
+        return self.coords[2 * start:2 * end]
+
+    def parts(self, index: int) -> List[memoryview]:
+        return [self.part(j) for j in self.part_range(index)]
+
+    def points(self, index: int) -> Iterator[Point]:
+        """(lat, lon) of every point of a feature, part after part."""
+        for j in self.part_range(index):
+            flat = self.part(j)
+            for k in range(0, len(flat), 2):
+                yield flat[k], flat[k + 1]
+
+    def vertex_count(self, index: int) -> int:
+        parts = self.part_range(index)
+        return self.part_offsets[parts.stop] - self.part_offsets[parts.start]
+
+    def bounds(self, index: int) -> Optional[Tuple[float, float, float, float]]:
+        """[min_lat, min_lon, max_lat, max_lon] of a feature, or None if it has no points."""
+        box = tuple(self.bboxes[4 * index:4 * index + 4])
+        return None if box[0] != box[0] else box
+
+    def coordinate_string(self, index: int) -> str:
+        """The feature's coordinates in the CSV format (parts joined with '|')."""
+        return '|'.join(format_part(part) for part in self.parts(index))
+
+    def coordinate_array(self):
+        """All points as a (points, 2) numpy.memmap, or None without numpy."""
+        if numpy is None or not self.meta['points']:
+            return None
+        return numpy.memmap(os.path.join(self.path, 'coords.f64'), dtype=numpy.float64, mode='r',
+                            shape=(self.meta['points'], 2))
+
+
+def import_csv(csv_path: str, store_path: str) -> Tuple[int, int]:
+    """
+    Convert a geometry CSV to a store, one row at a time. Rows with a
+    Coordinates column become line/polygon features, rows with Latitude and
+    Longitude single-point features; the other columns form the feature
+    table. Returns (features, points).
+    """
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        columns = [c for c in fields if c not in ('Coordinates', 'Latitude', 'Longitude')]
+        with GeometryStoreWriter(store_path, columns) as writer:
+            for row in reader:
+                if 'Coordinates' in fields:
+                    parts = parse_coordinates(row.get('Coordinates') or '')
+                else:
+                    parts = parse_coordinates(f"{row.get('Latitude')},{row.get('Longitude')}")
+                writer.add(row, parts)
+            return writer.features, writer.points
+
+
+def export_csv(store_path: str, csv_path: str):
+    """Write a store back out as a geometry CSV (Coordinates last)."""
+    with GeometryStore(store_path) as store, open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=store.columns + ['Coordinates'])
+        writer.writeheader()
+        for i in range(len(store)):
+            writer.writerow(dict(store.attributes(i), Coordinates=store.coordinate_string(i)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and inspect memory-mapped geometry stores')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('import', help='Convert a geometry CSV to a store')
+    build.add_argument('csv')
+    build.add_argument('store')
+    add_instrumentation_args(build)
+    info = commands.add_parser('info', help='Print counts and the overall bounding box of a store')
+    info.add_argument('store')
+    dump = commands.add_parser('export', help='Write a store back out as a geometry CSV')
+    dump.add_argument('store')
+    dump.add_argument('csv')
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        run = RunReport.from_args('geometry_store', args)
+        with run.stage('import') as stats:
+            features, points = import_csv(args.csv, args.store)
+            stats['rows_in'] = stats['rows_out'] = features
+            stats['vertices_in'] = stats['vertices_out'] = points
+        print(f"✓ Created {args.store}: {features} features, {points} points")
+        if args.run_report or args.profile_dir:
+            run.print_summary()
+        run.write(args.run_report)
+    elif args.command == 'info':
+        with GeometryStore(args.store) as store:
+            boxes = [b for b in (store.bounds(i) for i in range(len(store))) if b]
+            print(f"{args.store}: {len(store)} features, {store.meta['parts']} parts, "
+                  f"{store.meta['points']} points; columns: {', '.join(store.columns)}")
+            if boxes:
+                print(f"  bounds: {min(b[0] for b in boxes)}, {min(b[1] for b in boxes)} - "
+                      f"{max(b[2] for b in boxes)}, {max(b[3] for b in boxes)}")
+    else:
+        export_csv(args.store, args.csv)
+        print(f"✓ Wrote {args.csv}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
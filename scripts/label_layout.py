@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Leader-line label layout, ported from index.html.
+
+This is a line-for-line port of the page's label pipeline for the default
+(English, unpanned) view: the equirectangular projection, the per-layer
+anchor points and priorities, and the layoutLabels placement engine. A
+layout computed here is identical to the one the page would compute, so it
+can be precomputed at build time and looked up by the page (see
+data/precompute_label_layouts.py).
+
+Keep this file in step with JapanGeoExplorer in index.html:
+projectPoint, getVisibleBounds, labelPriority, layoutLabels and the
+render*Labels methods.
+"""
+
+import math
+import re
+from typing import Dict, List, Optional, Tuple
+
+from entity_ids import alias_key
+
+# Map projection and view box (JapanGeoExplorer.bounds / the <svg> viewBox)
+MIN_LAT, MAX_LAT = 30, 46
+MIN_LON, MAX_LON = 128, 146
+VIEWBOX_X, VIEWBOX_Y = -200, 0
+VIEWBOX_WIDTH, VIEWBOX_HEIGHT = 1400, 1400
+
+LABEL_SPACING = 35
+MAX_DISPLACEMENT = 6   # labelMaxDisplacement
+LABEL_INSET = 0.12     # label column inset, as a fraction of the view width
+
+# Zoom levels reachable with the +/- buttons from the default view: zoomIn and
+# zoomOut multiply by 1.3 and clamp to [0.5, 5]
+ZOOM_STEP = 1.3
+MIN_ZOOM, MAX_ZOOM = 0.5, 5
+
+Point = Tuple[float, float]
+
+
+def zoom_bands() -> List[float]:
+    """Every zoom level the +/- buttons can reach from zoom 1, computed as the page does."""
+    bands = {1}
+    zoom = 1
+    while zoom < MAX_ZOOM:
+        zoom = min(MAX_ZOOM, zoom * ZOOM_STEP)
+        bands.add(zoom)
+    zoom = 1
+    while zoom > MIN_ZOOM:
+        zoom = max(MIN_ZOOM, zoom / ZOOM_STEP)
+        bands.add(zoom)
+    return sorted(bands)
+
+
+def project_point(lat: float, lon: float) -> Point:
+    x = ((lon - MIN_LON) / (MAX_LON - MIN_LON)) * 1000
+    y = (1 - (lat - MIN_LAT) / (MAX_LAT - MIN_LAT)) * 1400
+    return x, y
+
+
+def visible_bounds(zoom: float, pan_x: float = 0, pan_y: float = 0) -> Dict[str, float]:
+    """getVisibleBounds for a zoom/pan."""
+    min_x = VIEWBOX_X - (pan_x / zoom)
+    min_y = VIEWBOX_Y - (pan_y / zoom)
+    return {'minX': min_x, 'maxX': min_x + (VIEWBOX_WIDTH / zoom),
+            'minY': min_y, 'maxY': min_y + (VIEWBOX_HEIGHT / zoom)}
+
+
+def js_parse_float(value) -> Optional[float]:
+    """JavaScript parseFloat: the longest numeric prefix, or None for NaN."""
+    match = re.match(r'\s*[+-]?(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)', str(value))
+    return float(match.group(0)) if match else None
+
+
+def js_parse_int(value) -> Optional[int]:
+    match = re.match(r'\s*([+-]?\d+)', str(value))
+    return int(match.group(1)) if match else None
+
+
+def js_round(value: float) -> int:
+    """Math.round (halves round up, unlike Python's round)."""
+    return math.floor(value + 0.5)
+
+
+def coords_to_points(coord_string: str) -> List[Point]:
+    points = []
+    for pair in coord_string.split(';'):
+        parts = pair.split(',')
+        lat = js_parse_float(parts[0]) if parts else None
+        lon = js_parse_float(parts[1]) if len(parts) > 1 else None
+        if lat is None or lon is None:
+            continue
+        points.append(project_point(lat, lon))
+    return points
+
+
+def calculate_center(points: List[Point]) -> Point:
+    sum_x = 0.0
+    sum_y = 0.0
+    for x, y in points:
+        sum_x += x
+        sum_y += y
+    return sum_x / len(points), sum_y / len(points)
+
+
+def calculate_area(points: List[Point]) -> float:
+    """Bounding-box area, as calculateArea."""
+    if len(points) < 3:
+        return 0
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (max(xs) - min(xs)) * (max(ys) - min(ys))
+
+
+def label_priority(item: Dict[str, str], feature_type: str) -> float:
+    """labelPriority: higher wins when labels compete for the same space."""
+    def number(value):
+        parsed = js_parse_float(re.sub(r'[^\d.]', '', str(value or '')))
+        return parsed or 0
+
+    if feature_type == 'sake-rice':
+        importance = js_parse_int(item.get('Importance', '')) or 4
+        return (4 - importance) * 1e6 + number(item.get('Production_Tonnes'))
+    if feature_type == 'mountain':
+        return number(item.get('Elevation'))
+    if feature_type == 'river':
+        return number(item.get('Length'))
+    if feature_type == 'lake':
+        return number(item.get('Area'))
+    return 0
+
+
+def layout_labels(features: List[Dict], bounds: Dict[str, float],
+                  label_spacing: float = LABEL_SPACING,
+                  max_shift: int = MAX_DISPLACEMENT) -> List[Dict]:
+    """
+    layoutLabels: collision-aware placement in two label columns.
+
+    Each feature is a dict with 'point' (x, y) and 'priority'. Returns one
+    placement per labelled feature: {'feature', 'isLeftSide', 'labelX', 'labelY'}.
+    """
+    min_x, max_x = bounds['minX'], bounds['maxX']
+    min_y, max_y = bounds['minY'], bounds['maxY']
+    center_x = (min_x + max_x) / 2
+    inset = (max_x - min_x) * LABEL_INSET
+    top = min_y + label_spacing
+    slot_count = max(0, math.floor((max_y - label_spacing / 2 - top) / label_spacing) + 1)
+
+    sides = [
+        {'isLeftSide': True, 'labelX': min_x + inset, 'features': []},
+        {'isLeftSide': False, 'labelX': max_x - inset, 'features': []},
+    ]
+    for feature in features:
+        x, y = feature['point']
+        if x < min_x or x > max_x or y < min_y or y > max_y:
+            continue
+        sides[0 if x < center_x else 1]['features'].append(feature)
+
+    placements = []
+    for side in sides:
+        occupied = bytearray(slot_count)
+        placed = []
+        slots = []
+
+        by_priority = sorted(side['features'],
+                             key=lambda f: (-(f.get('priority') or 0), f['point'][1], f['point'][0]))
+        for feature in by_priority:
+            exact = (feature['point'][1] - top) / label_spacing
+            ideal = min(slot_count - 1, max(0, js_round(exact)))
+            first_step = 1 if exact >= ideal else -1
+            for shift in range(max_shift + 1):
+                candidates = [ideal] if shift == 0 else [ideal + first_step * shift, ideal - first_step * shift]
+                slot = next((s for s in candidates if 0 <= s < slot_count and not occupied[s]), None)
+                if slot is not None:
+                    occupied[slot] = 1
+                    placed.append(feature)
+                    slots.append(slot)
+                    break
+
+        placed.sort(key=lambda f: (f['point'][1], f['point'][0]))
+        slots.sort()
+        for feature, slot in zip(placed, slots):
+            placements.append({
+                'feature': feature,
+                'isLeftSide': side['isLeftSide'],
+                'labelX': side['labelX'],
+                'labelY': top + slot * label_spacing,
+            })
+    return placements
+
+
+def count_overlaps(placements: List[Dict], label_spacing: float = LABEL_SPACING) -> int:
+    """Pairs of adjacent labels in a column closer than one label height."""
+    overlaps = 0
+    for is_left in (True, False):
+        ys = sorted(p['labelY'] for p in placements if p['isLeftSide'] == is_left)
+        overlaps += sum(1 for a, b in zip(ys, ys[1:]) if b - a < label_spacing - 1e-9)
+    return overlaps
+
+
+class LabelSources:
+    """
+    Label anchors and priorities for each layer, built from the emitted data.
+
+    Mirrors how the page collects label features: river midpoints, lake and
+    mountain range centres, mountain points and the prefecture centre of
+    each sake rice variety. Prefecture filters and metadata joins go through
+    the build's entity_index section, as they do in the page.
+    """
+
+    # Label layer -> table its rows come from
+    TABLES = {
+        'rivers': 'rivers_geo', 'lakes': 'lakes_geo', 'mountains': 'mountains_geo',
+        'mountain_ranges': 'mountain_ranges', 'sake_rice': 'sake_rice',
+    }
+
+    def __init__(self, data: Dict[str, List[Dict[str, str]]]):
+        self.data = data
+        self.index = data['entity_index']
+        self.aliases = self.index['aliases']['prefectures']
+
+        # JIS code -> metadata name / centre of the prefecture's geometry
+        self.prefecture_names = {}
+        for row, codes in zip(data['prefectures'], self.index['prefectures']['prefectures']):
+            if codes:
+                self.prefecture_names.setdefault(codes[0], row['Name'])
+        self.prefecture_centers = {}
+        for geo, codes in zip(data['prefectures_geo'], self.index['prefectures']['prefectures_geo']):
+            points = coords_to_points(geo.get('Coordinates') or '')
+            if codes and points and codes[0] not in self.prefecture_centers:
+                self.prefecture_centers[codes[0]] = calculate_center(points)
+
+    def prefecture_codes(self, value: str) -> List[int]:
+        """prefectureCodesFor: JIS codes of a ';'-separated prefecture value."""
+        codes = []
+        for name in (value or '').split(';'):
+            code = self.aliases.get(alias_key(name))
+            if code is not None and code not in codes:
+                codes.append(code)
+        return codes
+
+    def normalize(self, name: str) -> str:
+        """normalizePrefectureName: any spelling -> the metadata name."""
+        codes = self.prefecture_codes((name or '').strip())
+        return self.prefecture_names.get(codes[0], name.strip()) if codes else (name or '').strip()
+
+    def rows_in_prefecture(self, table: str, prefecture: str) -> set:
+        """rowsInPrefecture: row indexes of a table in the given prefecture(s)."""
+        inverted = self.index['tables'].get(table, {})
+        rows = set()
+        for code in self.prefecture_codes(prefecture):
+            rows.update(inverted.get(str(code), []))
+        return rows
+
+    def _metadata(self, table: str, index: int) -> Optional[Dict[str, str]]:
+        """metadataRecord: the metadata row joined to a geometry row at build time."""
+        joins = self.index['metadata'].get(table)
+        if joins is None or joins[index] < 0:
+            return None
+        return self.data[table[:-len('_geo')]][joins[index]]
+
+    def features(self, layer: str, prefecture_filter: Optional[str] = None,
+                 top_tier_only: bool = False) -> List[Dict]:
+        """
+        Label features for one layer, in the order the page builds them.
+
+        Each feature carries the index of its row in the array the page
+        labels from (geometry for rivers, lakes, mountains and ranges; the
+        sake rice metadata for sake rice).
+        """
+        table = self.TABLES.get(layer)
+        if table is None:
+            raise ValueError(f"Unknown label layer: {layer}")
+        rows = self.data[table]
+        if prefecture_filter:
+            selected = sorted(self.rows_in_prefecture(table, prefecture_filter))
+        else:
+            selected = range(len(rows))
+
+        features = []
+        for index in selected:
+            item = rows[index]
+            if layer in ('rivers', 'lakes'):
+                feature_type = 'river' if layer == 'rivers' else 'lake'
+                points = coords_to_points(item.get('Coordinates') or '')
+                if not points:
+                    continue
+                point = points[len(points) // 2] if layer == 'rivers' else calculate_center(points)
+                meta = self._metadata(table, index)
+                features.append({'index': index, 'point': point,
+                                 'priority': label_priority(meta or item, feature_type)})
+            elif layer == 'mountains':
+                lat = js_parse_float(item.get('Latitude', ''))
+                lon = js_parse_float(item.get('Longitude', ''))
+                if lat is None or lon is None:
+                    continue
+                meta = self._metadata(table, index)
+                features.append({'index': index, 'point': project_point(lat, lon),
+                                 'priority': label_priority(meta or item, 'mountain')})
+            elif layer == 'mountain_ranges':
+                points = coords_to_points(item.get('Coordinates') or '')
+                if not points:
+                    continue
+                features.append({'index': index, 'point': calculate_center(points),
+                                 'priority': calculate_area(points)})
+            else:
+                codes = self.index['prefectures'][table][index]
+                center = self.prefecture_centers.get(codes[0]) if codes else None
+                if center is None:
+                    continue
+                if top_tier_only and js_parse_int(item.get('Importance', '')) != 1:
+                    continue
+                features.append({'index': index, 'point': center,
+                                 'priority': label_priority(item, 'sake-rice')})
+        return features
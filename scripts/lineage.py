@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Sake rice lineage: the parent crosses in sake_rice.csv as a DAG with
+precomputed ancestor and descendant closures.
+
+The Parents column is free text such as "Yamadaho x Tankan-wataribune",
+"Yamada Nishiki (one parent confirmed)" or "?? Hida Minori x Fuku no
+hana". parse_parents() splits it on " x ", drops editorial marks and
+parenthesised remarks, and skips agents that are not varieties (gamma
+rays) and bare numbers: in "Akikeishu 251 x 306" the 306 is a second
+breeding line of the same series, not a variety name. The Notes column
+adds the one other form the data uses, "A (also) descended from B".
+
+Parent names are resolved to variety IDs with the same long-vowel folding
+as the name search (scripts/name_search.py), ignoring spaces, hyphens and
+parenthesised prefixes, so "Yamada Nishiki", "Yamadanishiki" and
+"Yamadaho" / "(Shin) Yamada Ho" meet; a name still unmatched is compared
+with difflib to catch typos ("Gohykumangoku"). A variety's ID is its row
+in sake_rice.csv. Parents that are not in the table get the IDs after the
+last row, in order of first mention, so they still connect their
+descendants.
+
+Closures are Python ints used as bitsets (bit i = variety i), filled in
+one pass in topological order. encode_bitset() writes them as base64 of
+the little-endian bytes without trailing zero bytes, which the page reads
+with atob; "" is the empty set. An edge that would close a cycle is
+reported and left out, so the graph stays a DAG.
+
+Usage:
+    python3 lineage.py ../data/sake_rice.csv                # every variety with parents
+    python3 lineage.py ../data/sake_rice.csv --descendants Omachi
+"""
+
+import argparse
+import base64
+import csv
+import difflib
+import re
+import sys
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from name_search import romaji_key
+
+# Cross separators, editorial marks and remarks in the Parents column
+CROSS_SEPARATOR = re.compile(r'\s+[x×]\s+', re.IGNORECASE)
+REMARK = re.compile(r'\([^)]*\)|\?+')
+
+# "A also descended from B" in the Notes column
+DESCENDED_FROM = re.compile(r"([A-Z][\w'-]*(?: [\w'-]+)*?) (?:also )?descended from ([A-Z][\w'-]*(?: [A-Z][\w'-]*)*)")
+
+# Least difflib ratio for resolving a misspelled parent
+FUZZY_CUTOFF = 0.9
+
+
+def variety_key(name: str) -> str:
+    """Fold a variety name for matching: long vowels, case, spaces and hyphens."""
+    return romaji_key(name).replace(' ', '')
+
+
+# Mutation agents and similar that appear in place of a parent (folded like names)
+NOT_VARIETIES = {variety_key(name) for name in ('Gamma Rays', 'Gamma Ray')}
+
+
+def parse_parents(text: str) -> List[str]:
+    """The parent names of a Parents value (empty for a blank or unknown cross)."""
+    parents = []
+    for part in CROSS_SEPARATOR.split(REMARK.sub(' ', text or '')):
+        name = ' '.join(part.split())
+        if name and not name.isdigit() and variety_key(name) not in NOT_VARIETIES:
+            parents.append(name)
+    return parents
+
+
+def note_parents(notes: str) -> List[Tuple[str, str]]:
+    """(child, parent) name pairs stated as "A (also) descended from B" in a note."""
+    return [(m.group(1), m.group(2)) for m in DESCENDED_FROM.finditer(notes or '')]
+
+
+def encode_bitset(bits: int) -> str:
+    """Base64 of a bitset's little-endian bytes, trailing zero bytes dropped."""
+    if not bits:
+        return ''
+    return base64.b64encode(bits.to_bytes((bits.bit_length() + 7) // 8, 'little')).decode('ascii')
+
+
+def decode_bitset(text: str) -> int:
+    return int.from_bytes(base64.b64decode(text), 'little') if text else 0
+
+
+def bit_ids(bits: int) -> List[int]:
+    """The set bits of a bitset, ascending."""
+    ids = []
+    while bits:
+        low = bits & -bits
+        ids.append(low.bit_length() - 1)
+        bits ^= low
+    return ids
+
+
+class Lineage:
+    """Variety IDs, parent edges and ancestor/descendant closures of sake rice rows."""
+
+    def __init__(self, rows: Sequence[Dict]):
+        self.names: List[str] = [row.get('Name') or '' for row in rows]
+        self.rows = len(rows)
+        self.keys: Dict[str, int] = {}
+        for i, name in enumerate(self.names):
+            for key in (variety_key(name), variety_key(REMARK.sub(' ', name))):
+                self.keys.setdefault(key, i)
+        self.table_keys = list(self.keys)
+        self.parents: List[List[int]] = [[] for _ in rows]
+        # Kept in step with parents, for the cycle check in add_edge
+        self.children: List[List[int]] = [[] for _ in rows]
+        self.rejected: List[Tuple[str, str, str]] = []
+
+        for i, row in enumerate(rows):
+            for parent in parse_parents(row.get('Parents')):
+                self.add_edge(self.resolve(parent), i, 'Parents')
+        for row in rows:
+            for child, parent in note_parents(row.get('Notes')):
+                self.add_edge(self.resolve(parent), self.resolve(child), 'Notes')
+        self.ancestors, self.descendants = self.closures()
+
+    def resolve(self, name: str) -> int:
+        """The ID of a variety name, adding a node for a variety not in the table."""
+        key = variety_key(name)
+        if key not in self.keys:
+            close = difflib.get_close_matches(key, self.table_keys, 1, FUZZY_CUTOFF)
+            if close:
+                self.keys[key] = self.keys[close[0]]
+            else:
+                self.keys[key] = len(self.names)
+                self.names.append(name)
+                self.parents.append([])
+                self.children.append([])
+        return self.keys[key]
+
+    def add_edge(self, parent: int, child: int, source: str):
+        """parent -> child, unless it is a repeat or would close a cycle."""
+        if parent == child or parent in self.parents[child]:
+            return
+        if parent in self._reachable(child):
+            self.rejected.append((self.names[parent], self.names[child], source))
+            return
+        self.parents[child].append(parent)
+        self.children[parent].append(child)
+
+    def _reachable(self, start: int) -> set:
+        """Descendants of start, by walking the edges added so far."""
+        seen, stack = set(), [start]
+        while stack:
+            for child in self.children[stack.pop()]:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return seen
+
+    def topological_order(self) -> List[int]:
+        """Every variety after all of its parents (Kahn; ties by ID)."""
+        pending = [len(parents) for parents in self.parents]
+        ready = deque(i for i, count in enumerate(pending) if count == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for child in self.children[node]:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    ready.append(child)
+        return order
+
+    def closures(self) -> Tuple[List[int], List[int]]:
+        """(ancestors, descendants) bitsets per variety."""
+        order = self.topological_order()
+        ancestors = [0] * len(self.names)
+        descendants = [0] * len(self.names)
+        for node in order:
+            for parent in self.parents[node]:
+                ancestors[node] |= ancestors[parent] | (1 << parent)
+        for node in reversed(order):
+            for parent in self.parents[node]:
+                descendants[parent] |= descendants[node] | (1 << node)
+        return ancestors, descendants
+
+    def find(self, name: str) -> Optional[int]:
+        return self.keys.get(variety_key(name))
+
+    def section(self) -> Dict:
+        """The sake_rice_lineage section: names, parents and base64 closures per ID."""
+        return {
+            'rows': self.rows,
+            'names': self.names,
+            'parents': self.parents,
+            'ancestors': [encode_bitset(bits) for bits in self.ancestors],
+            'descendants': [encode_bitset(bits) for bits in self.descendants],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show the sake rice lineage graph')
+    parser.add_argument('csv', help='sake_rice.csv')
+    parser.add_argument('--descendants', metavar='NAME', help='List the descendants of a variety')
+    parser.add_argument('--ancestors', metavar='NAME', help='List the ancestors of a variety')
+    args = parser.parse_args()
+
+    with open(args.csv, encoding='utf-8') as f:
+        lineage = Lineage(list(csv.DictReader(f)))
+    for name, closure in ((args.descendants, lineage.descendants), (args.ancestors, lineage.ancestors)):
+        if name is None:
+            continue
+        node = lineage.find(name)
+        if node is None:
+            print(f"✗ Unknown variety: {name}")
+            return 1
+        print(', '.join(lineage.names[i] for i in bit_ids(closure[node])) or '(none)')
+        return 0
+
+    for child, parents in enumerate(lineage.parents):
+        if parents:
+            print(f"  {lineage.names[child]} <- {' x '.join(lineage.names[p] for p in parents)}")
+    external = len(lineage.names) - lineage.rows
+    print(f"✓ {sum(map(len, lineage.parents))} edges over {len(lineage.names)} varieties "
+          f"({external} known only as parents)")
+    for parent, child, source in lineage.rejected:
+        print(f"✗ Left out {parent} -> {child} ({source}): it would close a cycle")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
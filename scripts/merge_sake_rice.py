@@ -5,6 +5,10 @@ Merge sake rice data - keep all varieties from backup, add production/importance
 
 import csv
 
+from csv_store import CsvStore
+from lineage import variety_key
+from patch_engine import load_patches
+
 print("Loading backup data...")
 
 # Load backup data (has all varieties)
@@ -18,32 +22,16 @@ with open('sake_rice_backup.csv', 'r', encoding='utf-8-sig') as f:
 
 print(f"Loaded {len(backup_data)} varieties from backup")
 
-# Production data from research (tonnes per year)
-production_data = {
-    'Yamadanishiki': 22916,
-    'Gohyakumangoku': 21000,
-    'Miyama Nishiki': 6408,
-    'Omachi': 2723,
-    'Dewasansan': 1436,
-    'Hanafubuki': 1044,
-    'Hattan Nishiki': 900,
-    'Akita Sake Komachi': 800,
-    'Ginpu': 700,
-    'Dewa no sato': 600,
-    'Kame no O': 500,
-    'Iwai': 400,
-    'Ginginga': 350,
-    'Kura no Hana': 320,
-}
-
-# Enhanced notes for key varieties
-enhanced_notes = {
-    'Yamadanishiki': 'Known as the "King of Sake Rice." A cross between Yamadaho and Tankan-wataribune developed in 1923, distributed 1936. Prized for its large uniform starch core (shinpaku). Used to produce premium highly aromatic sakes. Cannot grow above 300m. Tankan-wataribune also descended from Omachi. Accounts for 35% of all sake rice production in Japan.',
-    'Gohyakumangoku': 'Second most cultivated sakamai. Produces clean crisp light sake with simple refreshing profile. Developed 1938 by crossing Kikusui (ancestor of Omachi) and Shin No. 200 (ancestor of Kame no O). Name from 1957 bumper crop yielding 5 million koku (Gohyakumangoku). Developed for Niigata\'s cold climate. Easy to make koji with lends itself to Echigo toji\'s tsuki haze koji creating sharp crisp light clean sake - foundation of Niigata\'s tanre karakuchi style. Large round shinpaku cannot be polished below 50% without cracking. Yoshikawa ward in southern Joetsu is largest cultivation area.',
-    'Miyama Nishiki': 'Third most produced sake rice. Creates rich bold slightly earthy-flavored sake. Well-suited for winter brewing in colder climates. Miyama means Beautiful Mountain. Developed through gamma ray mutation of Takane Nishiki.',
-    'Omachi': 'Considered heirloom variety dating to 19th century (discovered 1859). Creates complex rich sake with earthy herbal notes. Parent variety of many modern sake rices. Table rice variety also used for sake.',
-    'Kame no O': 'Heirloom rice variety with strong distinct flavor profile. Discovered 1893. Revived in recent years for craft sake. Table rice variety.',
-}
+# Production (tonnes per year) and enhanced notes come from the curation patches.
+# They are keyed by folded name: the patches use the canonical spellings
+# ("Dewa no Sato") and the backup does not always ("Dewa no sato").
+production_data = {}
+enhanced_notes = {}
+for path, field, values in (('patches/sake_rice_production.json', 'Production_Tonnes', production_data),
+                            ('patches/sake_rice_notes.json', 'Notes', enhanced_notes)):
+    for (table, name, patched_field), assignment in load_patches([path]).items():
+        if table == 'sake_rice.csv' and patched_field == field:
+            values[variety_key(name)] = int(assignment.value) if field == 'Production_Tonnes' else assignment.value
 
 # Determine exclusive prefecture rices (only rice for that prefecture in dataset)
 prefecture_counts = {}
@@ -59,15 +47,16 @@ merged_data = []
 
 for row in backup_data:
     name = row['Name']
+    key = variety_key(name)
 
     # Add production tonnes
-    production = production_data.get(name, '')
+    production = production_data.get(key, '')
 
     # Determine importance
     # 1 = top 15 by production OR exclusive prefecture rice OR has detailed parents/year/notes in backup
     # 2 = has some data
     # 3 = minimal data
-    is_top_producer = name in production_data
+    is_top_producer = key in production_data
     is_exclusive = row['Prefecture'].strip() in exclusive_prefectures if row['Prefecture'].strip() else False
     has_details = bool(row.get('Parents') or row.get('Year') or (row.get('Notes') and len(row.get('Notes', '').strip()) > 20))
 
@@ -79,7 +68,7 @@ for row in backup_data:
         importance = 3
 
     # Use enhanced notes if available, otherwise use backup notes
-    notes = enhanced_notes.get(name, row.get('Notes', ''))
+    notes = enhanced_notes.get(key, row.get('Notes', ''))
 
     merged_data.append({
         'Name': name,
@@ -96,11 +85,10 @@ print(f"  Importance 1: {sum(1 for r in merged_data if r['Importance'] == 1)}")
 print(f"  Importance 2: {sum(1 for r in merged_data if r['Importance'] == 2)}")
 print(f"  Importance 3: {sum(1 for r in merged_data if r['Importance'] == 3)}")
 
-# Write merged data
-with open('sake_rice.csv', 'w', newline='', encoding='utf-8') as f:
+# Replace sake_rice.csv in one atomic write (the journal records what changed)
+store = CsvStore()
+with store.transaction('merge_sake_rice'):
     fieldnames = ['Name', 'Prefecture', 'Parents', 'Year', 'Production_Tonnes', 'Importance', 'Notes']
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(merged_data)
+    store.table('sake_rice.csv').replace_rows(merged_data, fieldnames)
 
 print(f"\n✓ Written to sake_rice.csv")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Bilingual name search index over the Name and Japanese Name columns.
+
+build_search_index() turns (layer, row, name, japanese name) entries into
+a compact JSON-ready index with two parts:
+
+- keys: a sorted array of folded search keys, each with its entry. Every
+  entry has its folded romaji name, each later word of it ("nishiki" for
+  Miyama Nishiki) and its folded Japanese name, so a prefix lookup is a
+  binary search for the first key >= the query and a scan while keys
+  still start with it, stopping once there are enough results.
+- grams: n-gram postings (gram -> entries) for fuzzy matching: trigrams
+  of the padded romaji name, and single characters and bigrams of the
+  Japanese name. An entry matches when it has at least FUZZY_THRESHOLD of
+  the query's grams, and matches are ranked by the Dice coefficient of
+  the two gram sets, so misspellings ("yamadanishki") and substrings
+  ("錦") are found too.
+
+Romaji is folded so that the spellings of a long vowel meet: diacritics
+are dropped (Tōhoku -> tohoku), doubled vowels, "ou" and "oh" before a
+consonant collapse to one vowel (Touhoku, Oomachi, Ohmachi -> tohoku,
+omachi), and "m" before b/m/p becomes "n" (Gumma -> gunma). Japanese is
+NFKC-normalised, katakana folded to hiragana and the long-vowel mark
+dropped. The page folds queries the same way (romajiKey and kanaKey in
+index.html), so the two must be changed together.
+
+SearchIndex runs the same lookup in Python, for the benchmark and for
+trying out an index from the command line.
+
+Usage:
+    python3 name_search.py ../chunks/search.json Ōmachi
+    python3 name_search.py ../chunks/search.json 山田 --limit 5
+"""
+
+import argparse
+import bisect
+import json
+import re
+import sys
+import unicodedata
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+FORMAT_VERSION = 1
+
+# Gram lengths for romaji (padded with ^ and $) and for Japanese names
+ROMAJI_GRAMS = (3,)
+KANA_GRAMS = (1, 2)
+
+# Least share of the query's grams an entry must have to match
+FUZZY_THRESHOLD = 0.6
+
+DEFAULT_LIMIT = 10
+
+_LONG_VOWELS = [
+    (re.compile(r'([aeiou])\1+'), r'\1'),
+    (re.compile(r'ou'), 'o'),
+    (re.compile(r'oh(?=[^aeiouy]|$)'), 'o'),
+    (re.compile(r'm(?=[bmp])'), 'n'),
+]
+
+
+def romaji_key(text: str) -> str:
+    """Fold a romanised name for search (must match romajiKey in index.html)."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    folded = ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    folded = ' '.join(re.sub(r'[^a-z0-9]+', ' ', folded).split())
+    for pattern, replacement in _LONG_VOWELS:
+        folded = pattern.sub(replacement, folded)
+    return folded
+
+
+def kana_key(text: str) -> str:
+    """Fold a Japanese name for search (must match kanaKey in index.html)."""
+    folded = unicodedata.normalize('NFKC', text or '')
+    folded = ''.join(chr(ord(c) - 0x60) if 'ァ' <= c <= 'ヶ' else c for c in folded)
+    return ''.join(folded.replace('ー', '').split())
+
+
+def is_romaji(text: str) -> bool:
+    """True if a query is written in Latin letters (with or without diacritics)."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return all(ord(c) < 128 or unicodedata.combining(c) for c in decomposed)
+
+
+def grams(key: str, romaji: bool) -> List[str]:
+    """The distinct n-grams of a folded key, in order."""
+    if not key:
+        return []
+    if romaji:
+        key = f"^{key.replace(' ', '')}$"
+    sizes = ROMAJI_GRAMS if romaji else KANA_GRAMS
+    found = [key[i:i + n] for n in sizes for i in range(len(key) - n + 1)]
+    return list(dict.fromkeys(found or [key]))
+
+
+def search_keys(name: str, japanese: str) -> List[str]:
+    """
+    The prefix keys of a name: the folded romaji name, each later word of
+    it onwards and the folded Japanese name.
+    """
+    romaji = romaji_key(name)
+    words = romaji.split(' ')
+    keys = {romaji, kana_key(japanese)} | {' '.join(words[i:]) for i in range(1, len(words))}
+    return sorted(key for key in keys if key)
+
+
+def query_key(query: str) -> Tuple[str, bool]:
+    """(folded key, is romaji) of a search query."""
+    romaji = is_romaji(query)
+    return (romaji_key(query) if romaji else kana_key(query)), romaji
+
+
+def build_search_index(layers: Sequence[str],
+                       entries: Iterable[Tuple[str, int, str, str]]) -> Dict:
+    """
+    The search index of (layer, row, name, japanese name) entries: entries
+    as [layer index, row, name, japanese name, romaji grams, kana grams],
+    the sorted keys as parallel key/entry arrays, and the gram postings.
+    """
+    layer_ids = {layer: i for i, layer in enumerate(layers)}
+    index_entries = []
+    keys = []
+    postings: Dict[str, List[int]] = {}
+    for entry_id, (layer, row, name, japanese) in enumerate(entries):
+        romaji = romaji_key(name)
+        kana = kana_key(japanese)
+        keys += [(key, entry_id) for key in search_keys(name, japanese)]
+        entry_grams = []
+        for key, is_latin in ((romaji, True), (kana, False)):
+            key_grams = grams(key, is_latin)
+            for gram in key_grams:
+                postings.setdefault(gram, []).append(entry_id)
+            entry_grams.append(len(key_grams))
+        index_entries.append([layer_ids[layer], row, name, japanese] + entry_grams)
+    keys.sort()
+    return {
+        'format': FORMAT_VERSION,
+        'grams_romaji': list(ROMAJI_GRAMS),
+        'grams_kana': list(KANA_GRAMS),
+        'threshold': FUZZY_THRESHOLD,
+        'layers': list(layers),
+        'entries': index_entries,
+        'keys': [key for key, _ in keys],
+        'key_entries': [entry_id for _, entry_id in keys],
+        'grams': dict(sorted(postings.items())),
+    }
+
+
+class SearchIndex:
+    """Prefix-then-fuzzy lookups over an index from build_search_index()."""
+
+    def __init__(self, index: Dict):
+        self.index = index
+        self.keys = index['keys']
+        self.key_entries = index['key_entries']
+
+    @classmethod
+    def load(cls, path: str) -> 'SearchIndex':
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        # A chunk file wraps the index in its section name
+        return cls(data.get('search_index', data))
+
+    def prefix(self, key: str, limit: int) -> List[int]:
+        """Entries with a key starting with key, in key order (so an exact match first)."""
+        results = []
+        for i in range(bisect.bisect_left(self.keys, key), len(self.keys)):
+            if len(results) >= limit or not self.keys[i].startswith(key):
+                break
+            if self.key_entries[i] not in results:
+                results.append(self.key_entries[i])
+        return results
+
+    def fuzzy(self, key: str, romaji: bool, limit: int) -> List[Tuple[float, int]]:
+        """(score, entry) pairs sharing enough n-grams with key, best first."""
+        query_grams = grams(key, romaji)
+        if not query_grams:
+            return []
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for entry_id in self.index['grams'].get(gram, ()):
+                shared[entry_id] = shared.get(entry_id, 0) + 1
+        size = 4 if romaji else 5
+        scored = []
+        for entry_id, count in shared.items():
+            if count >= self.index['threshold'] * len(query_grams):
+                score = 2 * count / (len(query_grams) + self.index['entries'][entry_id][size])
+                scored.append((-score, entry_id))
+        return [(-score, entry_id) for score, entry_id in sorted(scored)[:limit]]
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[int]:
+        """Entry ids for a query: prefix matches, topped up with fuzzy ones."""
+        key, romaji = query_key(query)
+        if not key:
+            return []
+        results = self.prefix(key, limit)
+        if len(results) < limit:
+            for _, entry_id in self.fuzzy(key, romaji, limit):
+                if entry_id not in results:
+                    results.append(entry_id)
+        return results[:limit]
+
+    def describe(self, entry_id: int) -> Tuple[str, int, str, str]:
+        """(layer, row, name, japanese name) of an entry."""
+        layer, row, name, japanese = self.index['entries'][entry_id][:4]
+        return self.index['layers'][layer], row, name, japanese
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Look up names in a search index')
+    parser.add_argument('index', help='Search index JSON (e.g. ../chunks/search.json)')
+    parser.add_argument('query', help='Name, prefix or misspelling, in romaji or Japanese')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help=f'Results (default {DEFAULT_LIMIT})')
+    args = parser.parse_args()
+
+    index = SearchIndex.load(args.index)
+    results = index.search(args.query, args.limit)
+    if not results:
+        print(f"✗ No names match '{args.query}'")
+        return 1
+    for entry_id in results:
+        layer, row, name, japanese = index.describe(entry_id)
+        print(f"  {name} ({japanese}) - {layer} row {row}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
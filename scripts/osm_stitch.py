@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Stitch the member ways of an OSM waterway into continuous linestrings.
+
+Overpass returns the ways of a river relation in no particular order, so
+simply concatenating them produces the long "jumps" that the cleaning
+scripts used to delete. Instead, way endpoints are hashed into a node
+table and ways are joined head-to-tail:
+
+1. Ways are deduplicated and oriented. Where exactly two ways meet, one
+   has to end and the other start there, so orientation spreads
+   breadth-first from a seed way along each chain of such joins. The
+   chain keeps the orientation most of its ways were drawn in (OSM
+   waterways are drawn in flow direction), so every way ends up running
+   upstream to downstream regardless of input order. A confluence does
+   not say which of its ways flows out, so each branch votes on its own.
+2. Each way's successor is the way that starts where it ends. Together these
+   links form a set of trees draining towards one or more mouths.
+3. The longest upstream path is computed for every way in topological
+   order, then each tree is decomposed into parts: the main stem follows
+   the longest branch from the mouth to its source, and every branch it
+   passes becomes a separate tributary part.
+
+Every step is a single pass over the ways, so stitching is O(n).
+"""
+
+from collections import defaultdict, deque
+from typing import Dict, List, Sequence, Tuple
+
+from river_segments import jump_distances
+
+Coord = Tuple[float, float]
+
+# OSM stores coordinates with 7 decimal places
+NODE_PRECISION = 7
+
+
+def node_key(coord: Coord) -> Tuple[float, float]:
+    """Hashable key for a way endpoint."""
+    return (round(coord[0], NODE_PRECISION), round(coord[1], NODE_PRECISION))
+
+
+def _orient_ways(ways: List[List[Coord]]) -> None:
+    """Flip ways against the majority of their chain (in place)."""
+    # Way ends at each node: (way index, True if it is the way's last point)
+    at_node = defaultdict(list)
+    for i, way in enumerate(ways):
+        at_node[node_key(way[0])].append((i, False))
+        at_node[node_key(way[-1])].append((i, True))
+
+    flip: List = [None] * len(ways)
+    for seed in range(len(ways)):
+        if flip[seed] is not None:
+            continue
+        flip[seed] = False
+        chain = [seed]
+        queue = deque([seed])
+        while queue:
+            i = queue.popleft()
+            for at_end in (False, True):
+                meeting = at_node[node_key(ways[i][-1 if at_end else 0])]
+                if len(meeting) != 2:
+                    continue
+                j, j_at_end = meeting[1] if meeting[0][0] == i else meeting[0]
+                if j == i or flip[j] is not None:
+                    continue
+                # If way i (as it will run) ends here, way j has to start here
+                i_ends_here = at_end != flip[i]
+                flip[j] = j_at_end == i_ends_here
+                chain.append(j)
+                queue.append(j)
+        # Keep the orientation most of the chain was drawn in (ties: the seed's)
+        if 2 * sum(flip[i] for i in chain) > len(chain):
+            for i in chain:
+                flip[i] = not flip[i]
+
+    for i, way in enumerate(ways):
+        if flip[i]:
+            ways[i] = way[::-1]
+
+
+def _join(ways: List[List[Coord]], order: Sequence[int]) -> List[Coord]:
+    """Concatenate ways that meet head-to-tail, dropping the shared node."""
+    coords: List[Coord] = []
+    for i in order:
+        way = ways[i]
+        if coords and node_key(coords[-1]) == node_key(way[0]):
+            coords.extend(way[1:])
+        else:
+            coords.extend(way)
+    return coords
+
+
+def stitch_ways(ways: Sequence[Sequence[Coord]]) -> List[Dict]:
+    """
+    Join ways into continuous, source-to-mouth linestrings.
+
+    Args:
+        ways: Each way is a sequence of (lat, lon) points. Duplicate ways
+              (same geometry) are ignored.
+
+    Returns:
+        A list of parts, longest first. Each part is a dict with 'coords',
+        'km', 'ways' (indices into the deduplicated way list) and 'parent'
+        (index of the part it flows into, or None for a main stem).
+    """
+    # Deduplicate while preserving order
+    seen = set()
+    unique: List[List[Coord]] = []
+    for way in ways:
+        if len(way) < 2:
+            continue
+        key = tuple(node_key(c) for c in way)
+        if key in seen or key[::-1] in seen:
+            continue
+        seen.add(key)
+        unique.append(list(way))
+
+    if not unique:
+        return []
+
+    _orient_ways(unique)
+    n = len(unique)
+    way_km = [sum(jump_distances(way)) for way in unique]
+
+    # Hash way starts, then link every way to the way starting at its end
+    starting_at = defaultdict(list)
+    for i, way in enumerate(unique):
+        starting_at[node_key(way[0])].append(i)
+
+    successor = [None] * n
+    upstream = [[] for _ in range(n)]
+    for i, way in enumerate(unique):
+        candidates = [j for j in starting_at.get(node_key(way[-1]), ()) if j != i]
+        if candidates:
+            successor[i] = candidates[0]
+            upstream[candidates[0]].append(i)
+
+    # Longest upstream length per way, in topological order (Kahn)
+    pending = [len(upstream[i]) for i in range(n)]
+    longest = list(way_km)
+    queue = deque(i for i in range(n) if pending[i] == 0)
+    processed = 0
+    while queue:
+        i = queue.popleft()
+        processed += 1
+        j = successor[i]
+        if j is not None:
+            longest[j] = max(longest[j], way_km[j] + longest[i])
+            pending[j] -= 1
+            if pending[j] == 0:
+                queue.append(j)
+
+    if processed < n:
+        # Ways in a cycle never reach zero; cut their outgoing links so each
+        # one drains on its own
+        for i in range(n):
+            if pending[i] > 0:
+                j = successor[i]
+                if j is not None and i in upstream[j]:
+                    upstream[j].remove(i)
+                successor[i] = None
+
+    # Decompose from each mouth, longest network first
+    mouths = sorted((i for i in range(n) if successor[i] is None),
+                    key=lambda i: longest[i], reverse=True)
+    assigned = [False] * n
+    parts: List[Dict] = []
+
+    for mouth in mouths:
+        work = [(mouth, None)]
+        while work:
+            bottom, parent = work.pop()
+            if assigned[bottom]:
+                continue
+            part_index = len(parts)
+            chain = []
+            cur = bottom
+            while cur is not None and not assigned[cur]:
+                assigned[cur] = True
+                chain.append(cur)
+                branches = [u for u in upstream[cur] if not assigned[u]]
+                if not branches:
+                    break
+                branches.sort(key=lambda u: longest[u], reverse=True)
+                for u in branches[1:]:
+                    work.append((u, part_index))
+                cur = branches[0]
+            chain.reverse()  # source -> mouth
+            parts.append({
+                'coords': _join(unique, chain),
+                'km': sum(way_km[i] for i in chain),
+                'ways': chain,
+                'parent': parent,
+            })
+
+    # Longest first, keeping parent references valid
+    order = sorted(range(len(parts)), key=lambda k: parts[k]['km'], reverse=True)
+    remap = {old: new for new, old in enumerate(order)}
+    result = []
+    for old in order:
+        part = parts[old]
+        if part['parent'] is not None:
+            part['parent'] = remap[part['parent']]
+        result.append(part)
+    return result
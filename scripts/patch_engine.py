@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Declarative curation patches for the data/ CSV files.
+
+Curated corrections live in JSON patch files (data/patches/*.json)
+instead of inside one-off scripts:
+
+    {
+      "provenance": "Where these values come from",
+      "patches": [
+        {"table": "sake_rice.csv", "id": "Koshi Tanrei",
+         "set": {"Year": "1989/2004", "Production_Tonnes": "1200"}},
+        {"table": "mountains.csv", "id": "Akaishi", "insert": true,
+         "set": {"Japanese Name": "赤石岳", "Prefecture": "Nagano;Shizuoka"}},
+        {"table": "old_provinces_geo.csv", "id": "Ezo",
+         "copy": {"Coordinates": {"table": "prefectures_geo.csv", "id": "Hokkai Do"}}}
+      ]
+    }
+
+- id is the row's Name (the table's key column)
+- set assigns field values; copy takes a field's value from another row
+  (after that row's own patches); insert creates the row if it is missing
+- a patch may carry its own "provenance", overriding the file's
+
+load_patches() flattens any number of patch files into one assignment
+per (table, id, field). Two patches that assign different values to the
+same field are a conflict, reported with both origins, whatever order the
+files are listed in; identical assignments are merged. apply_patches()
+then applies every assignment through csv_store.CsvStore: each table is
+read once, rows are found through its key index, and a field that
+already has the patched value is not a change, so applying the same
+patches twice changes nothing. Tables with a schema in csv_schema.py are
+validated before anything is written.
+"""
+
+import glob
+import json
+import os
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+from csv_schema import SCHEMAS, validate_columns
+from csv_store import CsvStore
+
+# One field assignment; value is None for copies, source is (table, id) for copies
+Assignment = namedtuple('Assignment', 'table id field value source insert provenance origin')
+
+
+class PatchError(Exception):
+    """A patch file is malformed, or patches conflict or cannot be applied."""
+
+    def __init__(self, problems: List[str]):
+        super().__init__('\n'.join(problems))
+        self.problems = problems
+
+
+def patch_files(directory: str = 'patches') -> List[str]:
+    """The patch files of a directory, in name order."""
+    return sorted(glob.glob(os.path.join(directory, '*.json')))
+
+
+def load_patches(paths: List[str]) -> Dict[Tuple[str, str, str], Assignment]:
+    """
+    Flatten patch files into {(table, id, field): Assignment}.
+    Raises PatchError listing every malformed patch and conflict.
+    """
+    assignments: Dict[Tuple[str, str, str], Assignment] = {}
+    problems = []
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+        except (OSError, ValueError) as e:
+            problems.append(f"{path}: cannot read: {e}")
+            continue
+        default_provenance = document.get('provenance')
+        for number, patch in enumerate(document.get('patches', []), 1):
+            origin = f"{os.path.basename(path)}#{number}"
+            table, entity = patch.get('table'), patch.get('id')
+            provenance = patch.get('provenance', default_provenance)
+            if not table or not entity:
+                problems.append(f"{origin}: needs a table and an id")
+                continue
+            if not provenance:
+                problems.append(f"{origin}: no provenance")
+            fields = [(field, str(value), None) for field, value in patch.get('set', {}).items()]
+            fields += [(field, None, (source.get('table', table), source.get('id')))
+                       for field, source in patch.get('copy', {}).items()]
+            if not fields:
+                problems.append(f"{origin}: nothing to set or copy")
+            for field, value, source in fields:
+                assignment = Assignment(table, entity, field, value, source,
+                                        bool(patch.get('insert')), provenance, origin)
+                existing = assignments.get((table, entity, field))
+                if existing is None:
+                    assignments[(table, entity, field)] = assignment
+                elif (existing.value, existing.source) != (value, source):
+                    problems.append(f"conflict: {table} {entity!r} {field} is "
+                                    f"{describe(existing)} in {existing.origin} but "
+                                    f"{describe(assignment)} in {origin}")
+                elif assignment.insert and not existing.insert:
+                    assignments[(table, entity, field)] = existing._replace(insert=True)
+    if problems:
+        raise PatchError(problems)
+    return assignments
+
+
+def describe(assignment: Assignment) -> str:
+    if assignment.source:
+        return f"a copy of {assignment.source[0]} {assignment.source[1]!r}"
+    value = assignment.value
+    return repr(value if len(value) <= 40 else value[:37] + '...')
+
+
+def apply_patches(assignments: Dict[Tuple[str, str, str], Assignment], store: CsvStore,
+                  validate: bool = True) -> Dict[str, int]:
+    """
+    Apply assignments to the store's tables (without committing). Returns
+    counts of fields changed and unchanged and rows inserted; raises
+    PatchError if a row is missing, a copy source does not exist or a
+    changed table no longer matches its schema.
+    """
+    problems = []
+    counts = {'changed': 0, 'unchanged': 0, 'inserted': 0}
+
+    def resolve(assignment: Assignment) -> Optional[str]:
+        if assignment.source is None:
+            return assignment.value
+        table, entity = assignment.source
+        patched = assignments.get((table, entity, assignment.field))
+        if patched is not None and patched.source is None:
+            return patched.value
+        row = store.table(table).get(entity)
+        if row is None or assignment.field not in row:
+            problems.append(f"{assignment.origin}: no {assignment.field} for {entity!r} in {table}")
+            return None
+        return row[assignment.field]
+
+    # Group by row so each row is looked up and patched once
+    by_row: Dict[Tuple[str, str], List[Assignment]] = {}
+    for (table, entity, field), assignment in sorted(assignments.items()):
+        by_row.setdefault((table, entity), []).append(assignment)
+
+    for (table_name, entity), row_assignments in by_row.items():
+        table = store.table(table_name)
+        values = {a.field: resolve(a) for a in row_assignments}
+        if any(value is None for value in values.values()):
+            continue
+        provenance = '; '.join(sorted({a.provenance for a in row_assignments if a.provenance}))
+        if entity not in table:
+            if not any(a.insert for a in row_assignments):
+                origins = ', '.join(a.origin for a in row_assignments)
+                problems.append(f"{origins}: no row {entity!r} in {table_name}")
+                continue
+            table.upsert(dict({table.key: entity}, **values), provenance=provenance)
+            counts['inserted'] += 1
+            counts['changed'] += len(values)
+            continue
+        changed = table.patch(entity, values, provenance=provenance)
+        counts['changed'] += len(changed)
+        counts['unchanged'] += len(values) - len(changed)
+
+    if validate:
+        for name, table in store.tables.items():
+            if table.dirty and name in SCHEMAS:
+                lines = list(range(2, len(table.rows) + 2))
+                _, violations = validate_columns(name, table.fieldnames, table.rows, lines, SCHEMAS[name])
+                problems += [f"{v.file}:{v.line} {v.column} {v.value!r}: {v.message}" for v in violations]
+    if problems:
+        raise PatchError(problems)
+    return counts
+
+
+def apply_patch_files(paths: List[str], store: Optional[CsvStore] = None, dry_run: bool = False,
+                      source: str = 'patch_engine') -> Dict[str, int]:
+    """Load, apply and (unless dry_run) commit patch files in one transaction."""
+    store = store or CsvStore()
+    assignments = load_patches(paths)
+    if dry_run:
+        counts = apply_patches(assignments, store)
+        store.rollback()
+        return counts
+    with store.transaction(source):
+        counts = apply_patches(assignments, store)
+    return counts
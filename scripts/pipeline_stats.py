@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Per-stage timing and memory instrumentation for the pipeline scripts.
+
+Wrap each stage of a script in a RunReport stage. The stage yields a plain
+stats dict - the same kind of dict the cleaning scripts already keep - and
+records wall time, CPU time and memory around it:
+
+    report = RunReport('clean_river_jumps', profile_dir=args.profile_dir)
+    with report.stage('segment') as stats:
+        stats['rows_in'] = len(rows)
+        ...
+        stats['points_removed'] += removed
+    report.write(args.run_report)
+
+Recorded for every stage:
+- wall_s, cpu_s:        time.perf_counter / time.process_time
+- py_peak_bytes:        peak Python allocation during the stage (tracemalloc;
+                        only with --run-report, since tracing slows a run
+                        down several times - None otherwise)
+- rss_peak_bytes:       peak resident set size of the process so far
+- rows_in / rows_out / vertices_in / vertices_out, plus any other counters
+  the script puts in the stats dict
+
+With a profile directory, every stage also runs under cProfile and its
+stats are dumped to <profile_dir>/<run>.<stage>.prof (view them with
+`python3 -m pstats` or snakeviz).
+"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+COUNTERS = ('rows_in', 'rows_out', 'vertices_in', 'vertices_out')
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def count_vertices(coords_str):
+    """Number of points in a "lat,lon;lat,lon" coordinate string."""
+    return coords_str.count(';') + 1 if coords_str else 0
+
+
+def add_instrumentation_args(parser):
+    """Add the --run-report and --profile-dir options to an argparse parser."""
+    parser.add_argument('--run-report', help='Write a JSON report with per-stage timing and memory')
+    parser.add_argument('--profile-dir', help='Dump a cProfile file for each stage into this directory')
+
+
+class RunReport:
+    """Collects per-stage measurements for one script run."""
+
+    def __init__(self, name, profile_dir=None, trace_memory=True):
+        self.name = name
+        self.profile_dir = profile_dir
+        self.trace_memory = trace_memory
+        self.stages = []
+        self.started = datetime.now(timezone.utc)
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+
+    @classmethod
+    def from_args(cls, name, args):
+        """Create a report configured from add_instrumentation_args options."""
+        return cls(name, profile_dir=getattr(args, 'profile_dir', None),
+                   trace_memory=bool(getattr(args, 'run_report', None)))
+
+    @contextmanager
+    def stage(self, name):
+        """Measure a stage; yields the stage's stats dict."""
+        stats = dict.fromkeys(COUNTERS, 0)
+
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+
+        profiler = cProfile.Profile() if self.profile_dir else None
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            yield stats
+        finally:
+            if profiler:
+                profiler.disable()
+            record = {
+                'stage': name,
+                'wall_s': round(time.perf_counter() - wall, 6),
+                'cpu_s': round(time.process_time() - cpu, 6),
+                'py_peak_bytes': None,
+                'rss_peak_bytes': peak_rss_bytes(),
+            }
+            if self.trace_memory:
+                record['py_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+            if profiler:
+                path = os.path.join(self.profile_dir, f"{self.name}.{name}.prof")
+                profiler.dump_stats(path)
+                record['profile'] = path
+            record.update(stats)
+            self.stages.append(record)
+
+    def to_dict(self):
+        return {
+            'run': self.name,
+            'started': self.started.isoformat(timespec='seconds'),
+            'wall_s': round(time.perf_counter() - self._start_wall, 6),
+            'cpu_s': round(time.process_time() - self._start_cpu, 6),
+            'rss_peak_bytes': peak_rss_bytes(),
+            'stages': self.stages,
+        }
+
+    def write(self, path):
+        """Write the machine-readable report (does nothing if path is empty)."""
+        if not path:
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"✓ Run report written to {path}")
+
+    def print_summary(self):
+        """Print a short per-stage table."""
+        print(f"\n{'Stage':<24}{'wall s':>10}{'cpu s':>10}{'peak MB':>10}{'rows':>14}{'vertices':>18}")
+        for s in self.stages:
+            peak = s['py_peak_bytes']
+            peak_mb = f"{peak / 1e6:.1f}" if peak is not None else '-'
+            rows = f"{s['rows_in']}→{s['rows_out']}"
+            vertices = f"{s['vertices_in']}→{s['vertices_out']}"
+            print(f"{s['stage']:<24}{s['wall_s']:>10.3f}{s['cpu_s']:>10.3f}{peak_mb:>10}{rows:>14}{vertices:>18}")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Split river polylines into connected segments at unreasonably large jumps.
+
+The jump mask is computed from the consecutive point distances in a single
+pass, and every segment is kept as a half-open offset range into the
+original coordinate buffer. A strategy then decides which segments make up
+the cleaned river:
+
+- longest:    the segment with the most points
+- longest_km: the segment with the greatest length in km
+- stitch:     start from the longest_km segment and repeatedly join the
+              segment whose nearest endpoint is closest, as long as the gap
+              stays within max_jump_km
+
+Nothing is copied until the chosen ranges are applied, so the same result
+can be used to slice either parsed (lat, lon) tuples or the raw
+"lat,lon" strings from the CSV.
+"""
+
+import math
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+
+# Approximate km per degree at Japan's latitudes (same constants as the
+# cleaning and verification scripts have always used)
+KM_PER_DEG_LAT = 111
+KM_PER_DEG_LON = 91
+
+STRATEGIES = ('longest', 'longest_km', 'stitch')
+
+# (start, end, reversed) - half-open offsets into the original buffer
+Range = Tuple[int, int, bool]
+
+
+def distance(lat1, lon1, lat2, lon2):
+    """Calculate approximate distance in km between two lat/lon points."""
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    return math.sqrt((dlat * KM_PER_DEG_LAT)**2 + (dlon * KM_PER_DEG_LON)**2)
+
+
+def jump_distances(coords: Sequence[Tuple[float, float]]) -> List[float]:
+    """Return the distance in km between each pair of consecutive points."""
+    if len(coords) < 2:
+        return []
+    lats = [c[0] for c in coords]
+    lons = [c[1] for c in coords]
+    return [
+        math.hypot((b_lat - a_lat) * KM_PER_DEG_LAT, (b_lon - a_lon) * KM_PER_DEG_LON)
+        for a_lat, b_lat, a_lon, b_lon in zip(lats, lats[1:], lons, lons[1:])
+    ]
+
+
+def segment_ranges(dists: Sequence[float], max_jump_km: float) -> List[Tuple[int, int]]:
+    """
+    Turn consecutive distances into half-open (start, end) point ranges.
+
+    A new segment starts after every distance greater than max_jump_km.
+    """
+    n_points = len(dists) + 1
+    breaks = [i + 1 for i, d in enumerate(dists) if d > max_jump_km]
+    starts = [0] + breaks
+    ends = breaks + [n_points]
+    return list(zip(starts, ends))
+
+
+def _segment_km(cumulative: Sequence[float], start: int, end: int) -> float:
+    """Length of the segment [start, end) from the cumulative distance table."""
+    # cumulative[i] is the distance from point 0 to point i
+    return cumulative[end - 1] - cumulative[start]
+
+
+def _endpoint_gap(coords, a: int, b: int) -> float:
+    return distance(coords[a][0], coords[a][1], coords[b][0], coords[b][1])
+
+
+def _stitch(coords, ranges, lengths_km, max_jump_km) -> List[Range]:
+    """
+    Greedily join segments by their nearest endpoints.
+
+    Starts from the longest segment (by km) and keeps attaching whichever
+    remaining segment has an endpoint closest to either end of the chain.
+    Segments that would need a gap larger than max_jump_km are dropped.
+    """
+    seed = max(range(len(ranges)), key=lambda i: lengths_km[i])
+    chain: List[Range] = [(ranges[seed][0], ranges[seed][1], False)]
+    remaining = set(range(len(ranges))) - {seed}
+
+    def head():
+        start, end, rev = chain[0]
+        return end - 1 if rev else start
+
+    def tail():
+        start, end, rev = chain[-1]
+        return start if rev else end - 1
+
+    while remaining:
+        best = None
+        h, t = head(), tail()
+        for i in remaining:
+            start, end = ranges[i]
+            first, last = start, end - 1
+            # (gap, segment, attach at tail?, reversed?)
+            options = (
+                (_endpoint_gap(coords, t, first), i, True, False),
+                (_endpoint_gap(coords, t, last), i, True, True),
+                (_endpoint_gap(coords, h, last), i, False, False),
+                (_endpoint_gap(coords, h, first), i, False, True),
+            )
+            candidate = min(options)
+            if best is None or candidate < best:
+                best = candidate
+
+        gap, i, at_tail, rev = best
+        if gap > max_jump_km:
+            break
+
+        remaining.discard(i)
+        start, end = ranges[i]
+        if at_tail:
+            chain.append((start, end, rev))
+        else:
+            chain.insert(0, (start, end, rev))
+
+    return chain
+
+
+def apply_ranges(items: Sequence, kept: Sequence[Range]) -> list:
+    """Build the cleaned sequence from any buffer parallel to the coordinates."""
+    result = []
+    for start, end, rev in kept:
+        part = items[start:end]
+        result.extend(reversed(part) if rev else part)
+    return result
+
+
+def segment_river(coords: Sequence[Tuple[float, float]], max_jump_km: float = 50,
+                  strategy: str = 'longest', name: str = '') -> Dict:
+    """
+    Segment a river at large jumps and choose the parts to keep.
+
+    Returns a report dict with every segment found, the ranges kept by the
+    strategy and the maximum jump before and after cleaning. Use
+    apply_ranges(items, report['kept']) to produce the cleaned buffer.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}' (expected one of {', '.join(STRATEGIES)})")
+
+    n_points = len(coords)
+    dists = jump_distances(coords)
+    report = {
+        'name': name,
+        'strategy': strategy,
+        'max_jump_km': max_jump_km,
+        'points_in': n_points,
+        'points_out': n_points,
+        'max_jump_in': max(dists, default=0.0),
+        'max_jump_out': 0.0,
+        'segments': [],
+        'kept': [],
+    }
+
+    if n_points == 0:
+        return report
+
+    ranges = segment_ranges(dists, max_jump_km)
+    cumulative = [0.0] + list(accumulate(dists))
+    lengths_km = [_segment_km(cumulative, start, end) for start, end in ranges]
+
+    report['segments'] = [
+        {'start': start, 'end': end, 'points': end - start, 'km': round(km, 1)}
+        for (start, end), km in zip(ranges, lengths_km)
+    ]
+
+    if strategy == 'longest':
+        # Ties go to the earliest segment, matching the original behaviour
+        i = max(range(len(ranges)), key=lambda k: ranges[k][1] - ranges[k][0])
+        kept = [(ranges[i][0], ranges[i][1], False)]
+    elif strategy == 'longest_km':
+        i = max(range(len(ranges)), key=lambda k: lengths_km[k])
+        kept = [(ranges[i][0], ranges[i][1], False)]
+    else:
+        kept = _stitch(coords, ranges, lengths_km, max_jump_km)
+
+    cleaned = apply_ranges(coords, kept)
+    report['kept'] = kept
+    report['points_out'] = len(cleaned)
+    report['max_jump_out'] = max(jump_distances(cleaned), default=0.0)
+    return report
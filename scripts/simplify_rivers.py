@@ -105,44 +105,48 @@ def coords_to_string(coords):
     """Convert list of (lat, lon) tuples to CSV string."""
     return ";".join(f"{lat:.4f},{lon:.4f}" for lat, lon in coords)
 
-# Read the messy OSM data
-print("Reading rivers_geo_new.csv...")
-rivers = []
-with open('rivers_geo_new.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        coords = parse_coordinates(row['Coordinates'])
-        if coords and len(coords) > 2:
-            rivers.append({
-                'name': row['Name'],
-                'coords': coords
-            })
-
-print(f"Found {len(rivers)} rivers with coordinates\n")
-
-# Simplify each river
-simplified_rivers = []
-for river in rivers:
-    original_count = len(river['coords'])
-    simplified = simplify_to_n_points(river['coords'], target_points=10)
-
-    # Ensure we have between 8-12 points for consistency with original data
-    if len(simplified) < 8:
-        simplified = simplify_to_n_points(river['coords'], target_points=8)
-
-    print(f"{river['name']}: {original_count} points -> {len(simplified)} points")
-
-    simplified_rivers.append({
-        'Name': river['name'],
-        'Coordinates': coords_to_string(simplified)
-    })
-
-# Write simplified data
-print(f"\nWriting simplified data to rivers_geo_simplified.csv...")
-with open('rivers_geo_simplified.csv', 'w', newline='', encoding='utf-8') as f:
-    writer = csv.writer(f)
-    writer.writerow(['Name', 'Coordinates'])
-    for river in simplified_rivers:
-        writer.writerow([river['Name'], river['Coordinates']])
-
-print(f"✓ Done! Created clean paths for {len(simplified_rivers)} rivers")
+def main():
+    # Read the messy OSM data
+    print("Reading rivers_geo_new.csv...")
+    rivers = []
+    with open('rivers_geo_new.csv', 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            coords = parse_coordinates(row['Coordinates'])
+            if coords and len(coords) > 2:
+                rivers.append({
+                    'name': row['Name'],
+                    'coords': coords
+                })
+
+    print(f"Found {len(rivers)} rivers with coordinates\n")
+
+    # Simplify each river
+    simplified_rivers = []
+    for river in rivers:
+        original_count = len(river['coords'])
+        simplified = simplify_to_n_points(river['coords'], target_points=10)
+
+        # Ensure we have between 8-12 points for consistency with original data
+        if len(simplified) < 8:
+            simplified = simplify_to_n_points(river['coords'], target_points=8)
+
+        print(f"{river['name']}: {original_count} points -> {len(simplified)} points")
+
+        simplified_rivers.append({
+            'Name': river['name'],
+            'Coordinates': coords_to_string(simplified)
+        })
+
+    # Write simplified data
+    print(f"\nWriting simplified data to rivers_geo_simplified.csv...")
+    with open('rivers_geo_simplified.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Name', 'Coordinates'])
+        for river in simplified_rivers:
+            writer.writerow([river['Name'], river['Coordinates']])
+
+    print(f"✓ Done! Created clean paths for {len(simplified_rivers)} rivers")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+In-memory indexes for querying the datasets: a static R-tree over
+bounding boxes and a prefix trie over names.
+
+RTree is bulk-loaded once with Sort-Tile-Recursive packing (sort by
+longitude into vertical slices, each slice by latitude, NODE_SIZE entries
+per node), which gives well-filled nodes with little overlap and needs no
+insert/split logic since the data never changes while it is served.
+search() walks the nodes a box touches; iter_nearest() is a best-first
+search over a heap of nodes and items keyed by their distance lower
+bound, so a caller that stops early never measures the far features.
+
+Distances are in km on a local equirectangular projection centred on the
+query point (km_per_degree). Over a query radius of a few hundred km in
+Japan that is within about 1% of the great-circle distance, and because
+the projection is linear the distance to a box's clamped point is an
+exact lower bound for anything inside the box.
+
+Boxes are (min_lat, min_lon, max_lat, max_lon), as in the bounds section
+of the bundle; points are (lat, lon).
+"""
+
+import heapq
+import math
+from itertools import count, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from dissolve import point_in_ring
+
+Point = Tuple[float, float]
+Box = Tuple[float, float, float, float]
+
+# Children per R-tree node
+NODE_SIZE = 16
+
+KM_PER_DEGREE_LAT = 110.574
+KM_PER_DEGREE_LON_EQUATOR = 111.320
+
+
+def km_per_degree(lat: float) -> Tuple[float, float]:
+    """(km per degree of latitude, km per degree of longitude) at a latitude."""
+    return KM_PER_DEGREE_LAT, KM_PER_DEGREE_LON_EQUATOR * math.cos(math.radians(lat))
+
+
+def box_distance(point: Point, box: Box) -> float:
+    """Distance in km from a point to the nearest point of a box (0 inside)."""
+    lat, lon = point
+    ky, kx = km_per_degree(lat)
+    dy = max(box[0] - lat, 0.0, lat - box[2]) * ky
+    dx = max(box[1] - lon, 0.0, lon - box[3]) * kx
+    return math.hypot(dx, dy)
+
+
+def segment_distance(point: Point, a: Point, b: Point) -> float:
+    """Distance in km from a point to the segment a-b."""
+    ky, kx = km_per_degree(point[0])
+    ax, ay = (a[1] - point[1]) * kx, (a[0] - point[0]) * ky
+    bx, by = (b[1] - point[1]) * kx, (b[0] - point[0]) * ky
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, -(ax * dx + ay * dy) / length_sq))
+    return math.hypot(ax + t * dx, ay + t * dy)
+
+
+def shape_distance(point: Point, kind: str, parts: Sequence[Sequence[Point]]) -> float:
+    """
+    Distance in km from a point to a feature: 0 inside a polygon, else to
+    the nearest edge, segment or point of its parts.
+    """
+    if kind == 'polygon' and any(point_in_ring(point, ring) for ring in parts):
+        return 0.0
+    best = math.inf
+    for part in parts:
+        if len(part) == 1:
+            best = min(best, segment_distance(point, part[0], part[0]))
+            continue
+        part = list(part)
+        ends = (part[1:] + part[:1]) if kind == 'polygon' else part[1:]
+        for a, b in zip(part, ends):
+            best = min(best, segment_distance(point, a, b))
+    return best
+
+
+def _union(boxes: Iterable[Box]) -> Box:
+    boxes = list(boxes)
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+
+def _intersects(a: Box, b: Box) -> bool:
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+class RTree:
+    """Static R-tree over (box, value) entries."""
+
+    def __init__(self, entries: Iterable[Tuple[Box, Any]], node_size: int = NODE_SIZE):
+        # A node is (box, children, leaf); leaf children are (box, value) entries
+        self.node_size = node_size
+        entries = [(tuple(box), value) for box, value in entries if box]
+        self.size = len(entries)
+        level = self._pack(entries, leaf=True)
+        while len(level) > 1:
+            level = self._pack(level, leaf=False)
+        self.root = level[0] if level else None
+
+    def _pack(self, items: List[Tuple], leaf: bool) -> List[Tuple]:
+        """One level of STR packing: items (box first) -> parent nodes."""
+        if not items:
+            return []
+        size = self.node_size
+        pages = math.ceil(len(items) / size)
+        slice_count = math.ceil(math.sqrt(pages))
+        per_slice = slice_count * size
+        by_lon = sorted(items, key=lambda item: item[0][1] + item[0][3])
+        nodes = []
+        for s in range(0, len(by_lon), per_slice):
+            column = sorted(by_lon[s:s + per_slice], key=lambda item: item[0][0] + item[0][2])
+            for n in range(0, len(column), size):
+                children = column[n:n + size]
+                nodes.append((_union(child[0] for child in children), children, leaf))
+        return nodes
+
+    def __len__(self):
+        return self.size
+
+    def search(self, box: Box) -> Iterator[Any]:
+        """Values whose boxes intersect box."""
+        if self.root is None:
+            return
+        stack = [self.root]
+        while stack:
+            _, children, leaf = stack.pop()
+            for child in children:
+                if _intersects(child[0], box):
+                    if leaf:
+                        yield child[1]
+                    else:
+                        stack.append(child)
+
+    def iter_nearest(self, point: Point, distance: Callable[[Any], float],
+                     max_distance: float = math.inf) -> Iterator[Tuple[float, Any]]:
+        """
+        (distance, value) pairs in order of distance from point, up to
+        max_distance. distance(value) gives the exact distance of a value
+        and is only called for values whose box could still be nearest.
+        """
+        if self.root is None:
+            return
+        tie = count()
+        # (lower bound, tie, kind, payload): kind 0 = node, 1 = entry, 2 = exact value
+        heap = [(box_distance(point, self.root[0]), next(tie), 0, self.root)]
+        while heap:
+            bound, _, kind, payload = heapq.heappop(heap)
+            if bound > max_distance:
+                return
+            if kind == 2:
+                yield bound, payload
+            elif kind == 1:
+                heapq.heappush(heap, (distance(payload[1]), next(tie), 2, payload[1]))
+            else:
+                _, children, leaf = payload
+                for child in children:
+                    heapq.heappush(heap, (box_distance(point, child[0]), next(tie), 1 if leaf else 0, child))
+
+    def nearest(self, point: Point, distance: Callable[[Any], float], k: Optional[int] = 1,
+                max_distance: float = math.inf) -> List[Tuple[float, Any]]:
+        """The k nearest (distance, value) pairs (k=None: all within max_distance)."""
+        return list(islice(self.iter_nearest(point, distance, max_distance), k))
+
+
+class NameTrie:
+    """Prefix trie from folded names to values; a name may map to several values."""
+
+    _VALUES = ''
+
+    def __init__(self):
+        self.root: Dict[str, Any] = {}
+        self.keys = 0
+
+    def insert(self, key: str, value: Any):
+        if not key:
+            return
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        values = node.setdefault(self._VALUES, [])
+        if value not in values:
+            values.append(value)
+            self.keys += 1
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> List[Any]:
+        """Values of the keys starting with prefix, shortest and then alphabetical keys first."""
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        results = []
+        seen = set()
+        level = [node]
+        # Breadth-first, so exact and short matches come before long ones
+        while level and (limit is None or len(results) < limit):
+            next_level = []
+            for current in level:
+                for value in current.get(self._VALUES, ()):
+                    if value not in seen:
+                        seen.add(value)
+                        results.append(value)
+                next_level += [current[char] for char in sorted(current) if char != self._VALUES]
+            level = next_level
+        return results if limit is None else results[:limit]
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Cut the map layers into z/x/y vector tiles and pack them into one archive.
+
+Tiles are laid over the page's own map space rather than web mercator:
+index.html projects (lat, lon) equirectangularly onto x 0..1000 and
+y 0..1400 and shows the square viewBox (-200, 0)-(1200, 1400), so zoom 0
+is that square and each zoom level splits every tile in four. For every
+zoom the features are
+
+1. simplified once (Douglas-Peucker, tolerance TOLERANCE of a tile side,
+   i.e. about half a pixel of a 256 px tile), starting at the deepest
+   zoom and simplifying each shallower level from the previous one,
+2. clipped to each tile they touch, grown by BUFFER on every side
+   (Sutherland-Hodgman for rings, segment clipping for lines), so strokes
+   at tile edges can be hidden by clipping to the tile itself,
+3. quantised to EXTENT units per tile side and delta-encoded.
+
+A tile is compact JSON: {"layer": [[row, [x0, y0, dx1, dy1, ...], ...], ...]}
+with one entry per feature, keyed by the feature's row index in its table
+so the page takes names and styles from the rows it already has. Points
+go only into the tile that contains them.
+
+The archive is a single file that can be read with HTTP range requests
+or from local disk (TileArchive):
+
+    8 bytes   MAGIC
+    4 bytes   directory length, uint32 little-endian
+    n bytes   directory JSON: format, grid, zoom range, layer kinds and
+              "z/x/y" -> [offset, length] of each tile's bytes
+    ...       tile data; offsets are relative to the end of the directory
+
+Empty tiles are left out of the directory, and tiles with identical
+bytes (open sea at high zoom, say) are stored once.
+
+Usage (from the data/ directory):
+    python3 ../scripts/vector_tiles.py info ../tiles/japan.tiles
+    python3 ../scripts/vector_tiles.py get ../tiles/japan.tiles 2 1 1
+"""
+
+import argparse
+import json
+import struct
+import sys
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MAGIC = b'JGTILES1'
+FORMAT_VERSION = 1
+
+# Projection used by index.html (projectPoint) and its square viewBox
+MIN_LAT, MAX_LAT = 30.0, 46.0
+MIN_LON, MAX_LON = 128.0, 146.0
+MAP_WIDTH, MAP_HEIGHT = 1000.0, 1400.0
+GRID = (-200.0, 0.0, 1400.0)  # x, y and side of the zoom 0 tile
+
+# Quantisation steps per tile side, and the clip margin in those steps
+EXTENT = 4096
+BUFFER = 256
+# Simplification tolerance as a fraction of the tile side
+TOLERANCE = 1 / 512
+DEFAULT_MAX_ZOOM = 4
+
+Point = Tuple[float, float]
+Box = Tuple[float, float, float, float]
+
+
+def project(lat: float, lon: float) -> Point:
+    """(lat, lon) -> page map coordinates, as projectPoint in index.html."""
+    return ((lon - MIN_LON) / (MAX_LON - MIN_LON) * MAP_WIDTH,
+            (1 - (lat - MIN_LAT) / (MAX_LAT - MIN_LAT)) * MAP_HEIGHT)
+
+
+def tile_box(z: int, x: int, y: int) -> Box:
+    """Map-space (min_x, min_y, max_x, max_y) of a tile."""
+    size = GRID[2] / (1 << z)
+    return (GRID[0] + x * size, GRID[1] + y * size, GRID[0] + (x + 1) * size, GRID[1] + (y + 1) * size)
+
+
+def simplify_line(points: Sequence[Point], epsilon: float) -> List[Point]:
+    """Iterative Douglas-Peucker of an open polyline; the end points are always kept."""
+    n = len(points)
+    if n < 3:
+        return list(points)
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        (x1, y1), (x2, y2) = points[start], points[end]
+        dx, dy = x2 - x1, y2 - y1
+        length = (dx * dx + dy * dy) ** 0.5
+        worst, worst_distance = -1, epsilon
+        for i in range(start + 1, end):
+            x, y = points[i]
+            if length == 0:
+                distance = ((x - x1) ** 2 + (y - y1) ** 2) ** 0.5
+            else:
+                distance = abs(dy * (x - x1) - dx * (y - y1)) / length
+            if distance > worst_distance:
+                worst, worst_distance = i, distance
+        if worst != -1:
+            keep[worst] = True
+            stack.append((start, worst))
+            stack.append((worst, end))
+    return [p for p, kept in zip(points, keep) if kept]
+
+
+def simplify_ring(ring: Sequence[Point], epsilon: float) -> List[Point]:
+    """Douglas-Peucker of a closed ring (no closing point); [] when it collapses."""
+    if len(ring) < 4:
+        return list(ring) if len(ring) == 3 else []
+    simplified = simplify_line(list(ring) + [ring[0]], epsilon)[:-1]
+    return simplified if len(simplified) >= 3 else []
+
+
+def clip_ring(ring: Sequence[Point], box: Box) -> List[Point]:
+    """Sutherland-Hodgman clip of a ring to a box. Parts outside run along the box edges."""
+    min_x, min_y, max_x, max_y = box
+    edges = (
+        (lambda p: p[0] >= min_x, lambda a, b: (min_x, a[1] + (b[1] - a[1]) * (min_x - a[0]) / (b[0] - a[0]))),
+        (lambda p: p[0] <= max_x, lambda a, b: (max_x, a[1] + (b[1] - a[1]) * (max_x - a[0]) / (b[0] - a[0]))),
+        (lambda p: p[1] >= min_y, lambda a, b: (a[0] + (b[0] - a[0]) * (min_y - a[1]) / (b[1] - a[1]), min_y)),
+        (lambda p: p[1] <= max_y, lambda a, b: (a[0] + (b[0] - a[0]) * (max_y - a[1]) / (b[1] - a[1]), max_y)),
+    )
+    output = list(ring)
+    for inside, intersect in edges:
+        if not output:
+            break
+        points, output = output, []
+        previous = points[-1]
+        for point in points:
+            if inside(point):
+                if not inside(previous):
+                    output.append(intersect(previous, point))
+                output.append(point)
+            elif inside(previous):
+                output.append(intersect(previous, point))
+            previous = point
+    return output if len(output) >= 3 else []
+
+
+def clip_line(line: Sequence[Point], box: Box) -> List[List[Point]]:
+    """Clip a polyline to a box (Liang-Barsky per segment); returns the pieces inside."""
+    min_x, min_y, max_x, max_y = box
+    pieces: List[List[Point]] = []
+    current: List[Point] = []
+    for (x1, y1), (x2, y2) in zip(line, line[1:]):
+        dx, dy = x2 - x1, y2 - y1
+        t0, t1 = 0.0, 1.0
+        for p, q in ((-dx, x1 - min_x), (dx, max_x - x1), (-dy, y1 - min_y), (dy, max_y - y1)):
+            if p == 0:
+                if q < 0:
+                    t0, t1 = 1.0, 0.0
+                    break
+            else:
+                t = q / p
+                if p < 0:
+                    t0 = max(t0, t)
+                else:
+                    t1 = min(t1, t)
+        if t0 > t1:
+            # Segment misses the box: end the current piece
+            if len(current) > 1:
+                pieces.append(current)
+            current = []
+            continue
+        start = (x1 + t0 * dx, y1 + t0 * dy)
+        end = (x1 + t1 * dx, y1 + t1 * dy)
+        if not current:
+            current = [start]
+        current.append(end)
+        if t1 < 1.0:
+            # Leaves the box before the segment ends
+            pieces.append(current)
+            current = []
+    if len(current) > 1:
+        pieces.append(current)
+    return pieces
+
+
+def encode_part(points: Sequence[Point], box: Box) -> List[int]:
+    """Quantise a part to the tile's EXTENT grid as [x0, y0, dx1, dy1, ...], dropping repeats."""
+    scale = EXTENT / (box[2] - box[0])
+    encoded: List[int] = []
+    last_x = last_y = 0
+    for i, (x, y) in enumerate(points):
+        qx = round((x - box[0]) * scale)
+        qy = round((y - box[1]) * scale)
+        if i and qx == last_x and qy == last_y:
+            continue
+        encoded += (qx - last_x, qy - last_y)
+        last_x, last_y = qx, qy
+    return encoded
+
+
+def decode_part(encoded: Sequence[int], box: Box) -> List[Point]:
+    """Inverse of encode_part, back to map coordinates."""
+    scale = (box[2] - box[0]) / EXTENT
+    points = []
+    x = y = 0
+    for k in range(0, len(encoded), 2):
+        x += encoded[k]
+        y += encoded[k + 1]
+        points.append((box[0] + x * scale, box[1] + y * scale))
+    return points
+
+
+def _bbox(points: Sequence[Point]) -> Box:
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _tile_range(z: int, min_x: float, min_y: float, max_x: float, max_y: float) -> Tuple[range, range]:
+    count = 1 << z
+    size = GRID[2] / count
+
+    def span(low, high, origin):
+        first = max(0, int((low - origin) // size))
+        last = min(count - 1, int((high - origin) // size))
+        return range(first, last + 1)
+
+    return span(min_x, max_x, GRID[0]), span(min_y, max_y, GRID[1])
+
+
+def build_tiles(layers: Dict[str, Tuple[str, List[List[List[Point]]]]],
+                max_zoom: int = DEFAULT_MAX_ZOOM) -> Dict[Tuple[int, int, int], Dict[str, list]]:
+    """
+    Tile every layer at zooms 0..max_zoom. layers maps a layer name to
+    (kind, features), kind being 'polygon', 'polyline' or 'point' and each
+    feature a list of parts of projected points (see project()). Returns
+    (z, x, y) -> {layer: [[row, part, part, ...], ...]} for non-empty tiles.
+    """
+    tiles: Dict[Tuple[int, int, int], Dict[str, list]] = defaultdict(lambda: defaultdict(list))
+    for name, (kind, features) in layers.items():
+        simplify = simplify_ring if kind == 'polygon' else simplify_line
+        for row, parts in enumerate(features):
+            if kind == 'point':
+                for z in range(max_zoom + 1):
+                    for x, y in (p for part in parts for p in part):
+                        xs, ys = _tile_range(z, x, y, x, y)
+                        for tx in xs:
+                            for ty in ys:
+                                box = tile_box(z, tx, ty)
+                                tiles[(z, tx, ty)][name].append([row, encode_part([(x, y)], box)])
+                continue
+
+            # Deepest zoom first: each level is simplified from the one below it,
+            # which is far shorter than the source and off by at most its tolerance
+            for z in range(max_zoom, -1, -1):
+                size = GRID[2] / (1 << z)
+                margin = size * BUFFER / EXTENT
+                parts = [s for s in (simplify(part, size * TOLERANCE) for part in parts) if len(s) >= 2]
+                if not parts:
+                    break
+                boxes = [_bbox(part) for part in parts]
+                xs, ys = _tile_range(z, min(b[0] for b in boxes) - margin, min(b[1] for b in boxes) - margin,
+                                     max(b[2] for b in boxes) + margin, max(b[3] for b in boxes) + margin)
+                for tx in xs:
+                    for ty in ys:
+                        box = tile_box(z, tx, ty)
+                        clip_box = (box[0] - margin, box[1] - margin, box[2] + margin, box[3] + margin)
+                        encoded = []
+                        for part, part_box in zip(parts, boxes):
+                            if (part_box[2] < clip_box[0] or part_box[0] > clip_box[2] or
+                                    part_box[3] < clip_box[1] or part_box[1] > clip_box[3]):
+                                continue
+                            if (part_box[0] >= clip_box[0] and part_box[2] <= clip_box[2] and
+                                    part_box[1] >= clip_box[1] and part_box[3] <= clip_box[3]):
+                                # Wholly inside: nothing to clip
+                                pieces = [part]
+                            elif kind == 'polygon':
+                                clipped = clip_ring(part, clip_box)
+                                pieces = [clipped] if clipped else []
+                            else:
+                                pieces = clip_line(part, clip_box)
+                            for piece in pieces:
+                                values = encode_part(piece, box)
+                                if len(values) >= (6 if kind == 'polygon' else 4):
+                                    encoded.append(values)
+                        if encoded:
+                            tiles[(z, tx, ty)][name].append([row] + encoded)
+    return tiles
+
+
+def encode_tile(layers: Dict[str, list]) -> bytes:
+    return json.dumps(layers, separators=(',', ':')).encode('utf-8')
+
+
+def write_archive(path: str, tiles: Dict[Tuple[int, int, int], Dict[str, list]],
+                  layer_kinds: Dict[str, str], max_zoom: int = DEFAULT_MAX_ZOOM) -> Dict:
+    """Write the tiles from build_tiles() as one archive; returns the directory."""
+    directory = {
+        'format': FORMAT_VERSION,
+        'grid': list(GRID),
+        'extent': EXTENT,
+        'buffer': BUFFER,
+        'minzoom': 0,
+        'maxzoom': max_zoom,
+        'layers': layer_kinds,
+        'tiles': {},
+    }
+    blobs: List[bytes] = []
+    offsets: Dict[bytes, int] = {}
+    size = 0
+    for z, x, y in sorted(tiles):
+        payload = encode_tile(tiles[(z, x, y)])
+        if payload not in offsets:
+            offsets[payload] = size
+            blobs.append(payload)
+            size += len(payload)
+        directory['tiles'][f"{z}/{x}/{y}"] = [offsets[payload], len(payload)]
+    header = json.dumps(directory, separators=(',', ':')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    directory['bytes'] = len(MAGIC) + 4 + len(header) + size
+    return directory
+
+
+class TileArchive:
+    """Reads single tiles from an archive on disk; use as a context manager."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError(f"{path}: not a tile archive")
+        (length,) = struct.unpack('<I', self._file.read(4))
+        self.directory = json.loads(self._file.read(length).decode('utf-8'))
+        self.data_offset = len(MAGIC) + 4 + length
+        if self.directory.get('format') != FORMAT_VERSION:
+            self._file.close()
+            raise ValueError(f"{path}: unsupported format {self.directory.get('format')}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def __len__(self):
+        return len(self.directory['tiles'])
+
+    def raw(self, z: int, x: int, y: int) -> Optional[bytes]:
+        entry = self.directory['tiles'].get(f"{z}/{x}/{y}")
+        if entry is None:
+            return None
+        self._file.seek(self.data_offset + entry[0])
+        return self._file.read(entry[1])
+
+    def get(self, z: int, x: int, y: int) -> Dict[str, list]:
+        """The tile's layers ({} for an empty tile)."""
+        payload = self.raw(z, x, y)
+        return json.loads(payload.decode('utf-8')) if payload else {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect a vector tile archive')
+    commands = parser.add_subparsers(dest='command', required=True)
+    info = commands.add_parser('info', help='Print tile counts and sizes per zoom')
+    info.add_argument('archive')
+    get = commands.add_parser('get', help='Print the features of one tile')
+    get.add_argument('archive')
+    get.add_argument('z', type=int)
+    get.add_argument('x', type=int)
+    get.add_argument('y', type=int)
+    args = parser.parse_args()
+
+    with TileArchive(args.archive) as archive:
+        directory = archive.directory
+        if args.command == 'info':
+            print(f"{args.archive}: {len(archive)} tiles, zoom {directory['minzoom']}-{directory['maxzoom']}, "
+                  f"layers: {', '.join(f'{k} ({v})' for k, v in directory['layers'].items())}")
+            per_zoom = defaultdict(lambda: [0, 0])
+            for key, (_, length) in directory['tiles'].items():
+                per_zoom[int(key.split('/')[0])][0] += 1
+                per_zoom[int(key.split('/')[0])][1] += length
+            for z in sorted(per_zoom):
+                count, total = per_zoom[z]
+                print(f"  z{z}: {count} tiles, {total / 1024:.0f} KB, largest "
+                      f"{max(e[1] for k, e in directory['tiles'].items() if k.startswith(f'{z}/')) / 1024:.1f} KB")
+        else:
+            layers = archive.get(args.z, args.x, args.y)
+            if not layers:
+                print(f"{args.z}/{args.x}/{args.y}: empty")
+            for name, features in layers.items():
+                vertices = sum(len(part) // 2 for feature in features for part in feature[1:])
+                print(f"{name}: {len(features)} features, {vertices} vertices "
+                      f"(rows {', '.join(str(feature[0]) for feature in features[:20])}"
+                      f"{', ...' if len(features) > 20 else ''})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
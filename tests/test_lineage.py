@@ -0,0 +1,47 @@
+"""Tests for scripts/lineage.py (run with python3 -m pytest tests)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+from lineage import Lineage, bit_ids, decode_bitset, encode_bitset, parse_parents  # noqa: E402
+
+
+def test_parse_parents_skips_agents_remarks_and_line_numbers():
+    assert parse_parents('Takane Nishiki x Gamma Rays') == ['Takane Nishiki']
+    assert parse_parents('Akikeishu 251 x 306') == ['Akikeishu 251']
+    assert parse_parents('?? Hida Minori x Fuku no hana') == ['Hida Minori', 'Fuku no hana']
+    assert parse_parents('Yamada Nishiki (one parent confirmed)') == ['Yamada Nishiki']
+    assert parse_parents('') == []
+
+
+def test_closures_follow_folded_names_and_notes():
+    rows = [
+        {'Name': 'Omachi', 'Parents': ''},
+        {'Name': 'Yamadaho', 'Parents': ''},
+        {'Name': 'Yamadanishiki', 'Parents': 'Yamadaho x Tankan-wataribune'},
+        {'Name': 'Tankan-wataribune', 'Parents': '', 'Notes': 'Tankan-wataribune descended from Omachi'},
+        {'Name': 'Miyama Nishiki', 'Parents': 'Takane Nishiki x Gamma Rays'},
+        {'Name': 'Koshi Tanrei', 'Parents': 'Yamada Nishiki x Gohykumangoku'},
+        {'Name': 'Gohyakumangoku', 'Parents': ''},
+    ]
+    lineage = Lineage(rows)
+    omachi = lineage.find('Omachi')
+    assert [lineage.names[i] for i in bit_ids(lineage.descendants[omachi])] == [
+        'Yamadanishiki', 'Tankan-wataribune', 'Koshi Tanrei']
+    assert set(bit_ids(lineage.ancestors[lineage.find('Koshi Tanrei')])) == {
+        lineage.find(name) for name in ('Omachi', 'Yamadaho', 'Yamadanishiki',
+                                        'Tankan-wataribune', 'Gohyakumangoku')}
+    # Takane Nishiki is a parent outside the table; gamma rays are not a node
+    assert lineage.names[lineage.rows:] == ['Takane Nishiki']
+    assert lineage.find('Gamma Rays') is None
+    for bits in lineage.ancestors + lineage.descendants:
+        assert decode_bitset(encode_bitset(bits)) == bits
+
+
+def test_edge_closing_a_cycle_is_left_out():
+    rows = [{'Name': 'A', 'Parents': 'B'}, {'Name': 'B', 'Parents': 'A'}]
+    lineage = Lineage(rows)
+    assert lineage.parents == [[1], []]
+    assert lineage.rejected == [('A', 'B', 'Parents')]
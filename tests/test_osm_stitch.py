@@ -0,0 +1,31 @@
+"""Tests for scripts/osm_stitch.py (run with python3 -m pytest tests)."""
+
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+from osm_stitch import stitch_ways  # noqa: E402
+
+
+def test_one_reversed_way_does_not_flip_the_river():
+    # w2 is drawn against the flow; w1 and w3 run downstream
+    ways = {
+        'w1': [(0, 0), (0, 1)],
+        'w2': [(0, 2), (0, 1)],
+        'w3': [(0, 2), (0, 3)],
+    }
+    for order in itertools.permutations(ways):
+        parts = stitch_ways([ways[name] for name in order])
+        assert len(parts) == 1, order
+        assert parts[0]['coords'] == [(0, 0), (0, 1), (0, 2), (0, 3)], order
+
+
+def test_tributary_joins_main_stem():
+    main = [[(0, 0), (0, 1)], [(0, 1), (0, 2)], [(0, 2), (0, 3)]]
+    tributary = [[(0.5, 1), (0.25, 1), (0, 1)]]
+    parts = stitch_ways(main + tributary)
+    assert parts[0]['coords'] == [(0, 0), (0, 1), (0, 2), (0, 3)]
+    assert parts[1]['coords'] == [(0.5, 1), (0.25, 1), (0, 1)]
+    assert parts[1]['parent'] == 0